@@ -0,0 +1,91 @@
+"""Measures WebSocket fan-out cost: one encode per socket vs one per message.
+
+The manager figure covers encoding, queueing and the per-socket writers
+handing every frame to its socket.
+
+Run with: PYTHONPATH=src python benchmarks/broadcast.py
+"""
+
+import asyncio
+import json
+import time
+
+from regatta.models.board import Board, Grid
+from regatta.models.game import Game, GamePhase
+from regatta.models.position import Position
+from regatta.models.wind import Heading, WindDirection
+from regatta.models.yacht import Yacht
+from regatta.serialization.game_serializer import serialize_game
+from regatta.ws.connection_manager import ConnectionManager
+
+SUBSCRIBERS = (10, 100, 1_000)
+REPEAT = 50
+
+
+class FakeSocket:
+    """Does the same encoding work as starlette's WebSocket, without the I/O."""
+
+    async def send_json(self, data: dict) -> None:
+        json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+    async def send_text(self, data: str) -> None:
+        pass
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+
+async def _per_socket_broadcast(sockets: list[FakeSocket], message: dict) -> None:
+    await asyncio.gather(*[socket.send_json(message) for socket in sockets])
+
+
+async def _manager_broadcast(manager: ConnectionManager, message: dict) -> None:
+    await manager.broadcast("bench", message)
+    await manager.drain("bench")
+
+
+async def _time(broadcast) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        await broadcast()
+    return (time.perf_counter() - start) / REPEAT * 1e3
+
+
+async def main() -> None:
+    game = Game(
+        id="bench",
+        board=Board(
+            grid=Grid(28, 20),
+            course_marks=[Position(14, 3)],
+            starting_line=(Position(8, 19), Position(20, 19)),
+        ),
+        wind_direction=WindDirection.NORTH,
+        phase=GamePhase.RACING,
+        setup_order=[f"player_{i}" for i in range(6)],
+        yachts={
+            f"player_{i}": Yacht(Position(8 + 2 * i, 19), Heading.NORTH_EAST)
+            for i in range(6)
+        },
+    )
+    message = {"type": "snapshot", "version": 1, "state": serialize_game(game)}
+
+    for subscribers in SUBSCRIBERS:
+        sockets = [FakeSocket() for _ in range(subscribers)]
+        manager = ConnectionManager()
+        for socket in sockets:
+            manager.connect("bench", socket)  # type: ignore[arg-type]
+
+        per_socket = await _time(lambda s=sockets: _per_socket_broadcast(s, message))
+        once = await _time(lambda m=manager: _manager_broadcast(m, message))
+        assert manager.evictions == 0
+        for socket in sockets:
+            manager.disconnect("bench", socket)  # type: ignore[arg-type]
+
+        print(
+            f"subscribers={subscribers:>5}  per-socket encode {per_socket:7.3f} ms"
+            f"  encode once {once:7.3f} ms  ({per_socket / once:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
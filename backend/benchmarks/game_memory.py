@@ -0,0 +1,74 @@
+"""Reports the memory held per in-flight game, measured with tracemalloc.
+
+Run with: PYTHONPATH=src python benchmarks/game_memory.py
+"""
+
+import random
+import tracemalloc
+from dataclasses import replace
+
+from regatta.core.game_actions import (
+    add_player,
+    choose_starting_position,
+    end_turn,
+    move_leg,
+    start_setup,
+)
+from regatta.models.board import Board, Grid
+from regatta.models.game import Game, GamePhase
+from regatta.models.position import Position
+from regatta.models.wind import Heading, WindDirection
+
+GAMES = 500
+TURNS = 40
+PLAYERS = 6
+
+
+def _play_game(index: int, rng: random.Random) -> Game:
+    game = Game(
+        id=str(index),
+        board=Board(
+            grid=Grid(28, 20),
+            course_marks=[Position(14, 3)],
+            starting_line=(Position(8, 19), Position(20, 19)),
+        ),
+        wind_direction=WindDirection.NORTH,
+    )
+    for player in range(PLAYERS):
+        game = add_player(game, f"player_{player}")
+    game = start_setup(game)
+    for x, player_id in enumerate(game.setup_order):
+        game = choose_starting_position(game, player_id, Position(8 + 2 * x, 19))
+
+    for _ in range(TURNS * PLAYERS):
+        if game.phase != GamePhase.RACING:
+            break
+        player_id = game.setup_order[game.current_player_index]
+        for heading in rng.sample(list(Heading), len(Heading)):
+            try:
+                game = move_leg(game, player_id, heading)
+                break
+            except ValueError:
+                continue
+        else:
+            game = end_turn(replace(game, legs_remaining=0))
+    return game
+
+
+def main() -> None:
+    random.seed(0)
+    rng = random.Random(0)
+    tracemalloc.start()
+    games = [_play_game(index, rng) for index in range(GAMES)]
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    points = sum(
+        len(yacht.position_history) for game in games for yacht in game.yachts.values()
+    )
+    print(f"games={GAMES}  track points per game={points / GAMES:.0f}")
+    print(f"{current / GAMES / 1024:.1f} KiB per game")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Compares ORM load/save of game rows with the Core game store, on Postgres.
+
+Each simulated request loads a game, applies one action and writes it back,
+the way the action routes do on a cache miss. Needs a scratch database:
+
+Run with: BENCH_DATABASE_URL=postgresql+asyncpg://localhost/regatta_bench \\
+    PYTHONPATH=src python benchmarks/game_store.py
+"""
+
+import asyncio
+import os
+import time
+import uuid
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from regatta.core.action_log import apply_action, new_action
+from regatta.db.game_store import append_action, insert_game, load_game
+from regatta.db.models import Base, GameActionRow, GameRow
+from regatta.models.board import Board, Grid
+from regatta.models.game import Game, GamePhase
+from regatta.models.position import Position
+from regatta.models.wind import Heading, WindDirection
+from regatta.models.yacht import Yacht
+from regatta.serialization.game_serializer import deserialize_game, serialize_game
+
+DATABASE_URL = os.environ.get(
+    "BENCH_DATABASE_URL", "postgresql+asyncpg://localhost/regatta_bench"
+)
+CONCURRENCY = 16
+REQUESTS_PER_WORKER = 200
+SNAPSHOT_INTERVAL = 20
+
+
+def _make_game() -> Game:
+    history = [Position(14, y) for y in range(19, 4, -1)]
+    return Game(
+        id=str(uuid.uuid4()),
+        board=Board(
+            grid=Grid(28, 20),
+            course_marks=[Position(14, 3)],
+            starting_line=(Position(8, 19), Position(20, 19)),
+        ),
+        wind_direction=WindDirection.NORTH,
+        phase=GamePhase.RACING,
+        setup_order=["player_1"],
+        legs_per_turn=3,
+        legs_remaining=3,
+        yachts={
+            "player_1": Yacht(history[-1], Heading.NORTH_EAST, position_history=history)
+        },
+    )
+
+
+def _next_action(game: Game) -> dict:
+    if game.yachts["player_1"].spinnaker:
+        return new_action("lower_spinnaker", player_id="player_1")
+    return new_action("raise_spinnaker", player_id="player_1")
+
+
+async def _orm_request(session: AsyncSession, game_id: uuid.UUID) -> None:
+    game_row = await session.get(GameRow, game_id, populate_existing=True)
+    assert game_row is not None
+    game = deserialize_game(game_row.state)
+    game_row.state = serialize_game(apply_action(game, _next_action(game)))
+    await session.commit()
+
+
+async def _store_request(session: AsyncSession, game_id: uuid.UUID) -> None:
+    stored_game = await load_game(session, game_id)
+    assert stored_game is not None
+    action = _next_action(stored_game.game)
+    updated_game = apply_action(stored_game.game, action)
+    snapshot = await append_action(
+        session,
+        game_id,
+        stored_game.version,
+        action,
+        serialize_game(updated_game),
+        stored_game.snapshot,
+        SNAPSHOT_INTERVAL,
+    )
+    assert snapshot is not None
+    await session.commit()
+
+
+async def _run(sessionmaker, request) -> float:
+    game_ids = [uuid.uuid4() for _ in range(CONCURRENCY)]
+    async with sessionmaker() as session:
+        for game_id in game_ids:
+            await insert_game(session, game_id, serialize_game(_make_game()))
+        await session.commit()
+
+    async def worker(game_id: uuid.UUID) -> None:
+        async with sessionmaker() as session:
+            for _ in range(REQUESTS_PER_WORKER):
+                await request(session, game_id)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(game_id) for game_id in game_ids))
+    return CONCURRENCY * REQUESTS_PER_WORKER / (time.perf_counter() - start)
+
+
+async def main() -> None:
+    engine = create_async_engine(DATABASE_URL, pool_size=CONCURRENCY)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+
+    try:
+        for name, request in (("orm", _orm_request), ("store", _store_request)):
+            requests_per_second = await _run(sessionmaker, request)
+            print(f"{name:>5}: {requests_per_second:8.0f} requests/s")
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(delete(GameActionRow))
+            await conn.execute(delete(GameRow))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,56 @@
+"""Measures move_leg latency as a yacht's track grows.
+
+Run with: PYTHONPATH=src python benchmarks/move_leg.py
+"""
+
+import timeit
+
+from regatta.core.game_actions import move_leg
+from regatta.models.board import Board, Grid
+from regatta.models.game import Game, GamePhase
+from regatta.models.position import Position
+from regatta.models.wind import Heading, WindDirection
+from regatta.models.yacht import Yacht
+
+HISTORY_LENGTHS = (10, 100, 1_000, 5_000)
+REPEAT = 2_000
+
+
+def _make_game(history_length: int) -> Game:
+    # Zig-zag across the board so the hull is non-trivial but stays below the mark.
+    history = tuple(
+        Position(2 + i % 20, 12 + (i // 20) % 6) for i in range(history_length)
+    )
+    board = Board(
+        grid=Grid(28, 20),
+        course_marks=[Position(14, 3)],
+        starting_line=(Position(8, 19), Position(20, 19)),
+    )
+    return Game(
+        id="bench",
+        board=board,
+        wind_direction=WindDirection.NORTH,
+        phase=GamePhase.RACING,
+        setup_order=["player_1"],
+        legs_remaining=3,
+        yachts={
+            "player_1": Yacht(Position(10, 10), Heading.EAST, position_history=history)
+        },
+    )
+
+
+def main() -> None:
+    for history_length in HISTORY_LENGTHS:
+        game = _make_game(history_length)
+        # Warm the cached hull, as a live game would after its first move.
+        game = move_leg(game, "player_1", Heading.EAST)
+        game = move_leg(game, "player_1", Heading.WEST)
+
+        seconds = timeit.timeit(
+            lambda g=game: move_leg(g, "player_1", Heading.EAST), number=REPEAT
+        )
+        print(f"history={history_length:>6}  {seconds / REPEAT * 1e6:8.2f} us/move")
+
+
+if __name__ == "__main__":
+    main()
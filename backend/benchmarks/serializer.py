@@ -0,0 +1,93 @@
+"""Compares the compact track encoding with the legacy one-object-per-point format.
+
+Run with: PYTHONPATH=src python benchmarks/serializer.py
+"""
+
+import json
+import timeit
+
+from regatta.models.board import Board, Grid
+from regatta.models.game import Game, GamePhase
+from regatta.models.position import Position
+from regatta.models.track import Track
+from regatta.models.wind import Heading, WindDirection
+from regatta.models.yacht import Yacht
+from regatta.serialization.game_serializer import (
+    _deserialize_track,
+    _serialize_track,
+    serialize_game,
+)
+
+TRACK_LENGTHS = (50, 500, 5_000)
+PLAYERS = 6
+REPEAT = 20
+
+
+def _make_game(track_length: int) -> Game:
+    # Three-cell legs zig-zagging upwind, like a boat beating to the mark.
+    yachts = {}
+    for player in range(PLAYERS):
+        history = []
+        x, y = 2 + player * 4, 19
+        for i in range(track_length):
+            dx = 1 if (i // 3) % 2 == 0 else -1
+            x, y = x + dx, (y - 1) % 20
+            history.append(Position(x, y))
+        yachts[f"player_{player}"] = Yacht(
+            history[-1], Heading.NORTH_EAST, position_history=history
+        )
+
+    return Game(
+        id="bench",
+        board=Board(
+            grid=Grid(28, 20),
+            course_marks=[Position(14, 3)],
+            starting_line=(Position(8, 19), Position(20, 19)),
+        ),
+        wind_direction=WindDirection.NORTH,
+        phase=GamePhase.RACING,
+        setup_order=list(yachts),
+        yachts=yachts,
+    )
+
+
+def _legacy_track(track: Track) -> list[dict]:
+    return [{"x": x, "y": y} for x, y in track.coordinates()]
+
+
+def main() -> None:
+    for track_length in TRACK_LENGTHS:
+        game = _make_game(track_length)
+        compact = serialize_game(game)
+        legacy = json.loads(json.dumps(compact))
+        for player_id, yacht in game.yachts.items():
+            legacy["yachts"][player_id]["position_history"] = _legacy_track(
+                yacht.position_history
+            )
+
+        tracks = [yacht.position_history for yacht in game.yachts.values()]
+        legacy_json = [json.dumps(_legacy_track(track)) for track in tracks]
+        compact_json = [json.dumps(_serialize_track(track)) for track in tracks]
+
+        def timed(fn, items) -> float:
+            seconds = timeit.timeit(lambda: [fn(i) for i in items], number=REPEAT)
+            return seconds / REPEAT * 1e3
+
+        legacy_bytes = len(json.dumps(legacy))
+        compact_bytes = len(json.dumps(compact))
+        legacy_encode = timed(lambda t: json.dumps(_legacy_track(t)), tracks)
+        compact_encode = timed(lambda t: json.dumps(_serialize_track(t)), tracks)
+        legacy_decode = timed(lambda s: _deserialize_track(json.loads(s)), legacy_json)
+        compact_decode = timed(
+            lambda s: _deserialize_track(json.loads(s)), compact_json
+        )
+
+        print(
+            f"track={track_length:>5}  json {legacy_bytes:>7} -> {compact_bytes:>6} B"
+            f"  encode {legacy_encode:6.2f} -> {compact_encode:6.2f} ms"
+            f"  decode {legacy_decode:6.2f} -> {compact_decode:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
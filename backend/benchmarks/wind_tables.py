@@ -0,0 +1,61 @@
+"""Compares the wind lookup tables against the original arithmetic.
+
+Run with: PYTHONPATH=src python benchmarks/wind_tables.py
+"""
+
+import timeit
+
+from regatta.models.wind import (
+    Heading,
+    WindDirection,
+    _compute_maneuver,
+    _compute_point_of_sail,
+    _compute_speed,
+    _compute_tack,
+    detect_maneuver,
+    get_point_of_sail,
+    get_speed,
+    get_tack,
+)
+
+REPEAT = 20
+
+PAIRS = [(wind, heading) for wind in WindDirection for heading in Heading]
+TRIPLES = [(wind, old, new) for wind, old in PAIRS for new in Heading]
+
+
+def _time(label: str, arithmetic, table) -> None:
+    arithmetic_seconds = timeit.timeit(arithmetic, number=REPEAT)
+    table_seconds = timeit.timeit(table, number=REPEAT)
+    print(
+        f"{label:<16} arithmetic {arithmetic_seconds * 1e3:7.2f} ms"
+        f"  table {table_seconds * 1e3:7.2f} ms"
+        f"  ({arithmetic_seconds / table_seconds:4.1f}x)"
+    )
+
+
+def main() -> None:
+    _time(
+        "point of sail",
+        lambda: [_compute_point_of_sail(w, h) for w, h in PAIRS],
+        lambda: [get_point_of_sail(w, h) for w, h in PAIRS],
+    )
+    _time(
+        "tack",
+        lambda: [_compute_tack(w, h) for w, h in PAIRS],
+        lambda: [get_tack(w, h) for w, h in PAIRS],
+    )
+    _time(
+        "maneuver",
+        lambda: [_compute_maneuver(w, o, n) for w, o, n in TRIPLES],
+        lambda: [detect_maneuver(w, o, n) for w, o, n in TRIPLES],
+    )
+    _time(
+        "spinnaker speed",
+        lambda: [_compute_speed(w, h, True) for w, h in PAIRS],
+        lambda: [get_speed(w, h, True) for w, h in PAIRS],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ import jwt
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from regatta.cache.token_cache import token_cache
 from regatta.config import settings
 
 
@@ -22,11 +23,18 @@ def create_access_token() -> str:
 
 
 def decode_token(token: str) -> dict:
+    claims = token_cache.get(token)
+    if claims is not None:
+        return claims
+
     try:
-        return jwt.decode(token, settings.jwt_secret_key, algorithms=["HS256"])
+        claims = jwt.decode(token, settings.jwt_secret_key, algorithms=["HS256"])
     except jwt.InvalidTokenError as e:
         raise HTTPException(status_code=401, detail="Invalid or expired token") from e
 
+    token_cache.put(token, claims)
+    return claims
+
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
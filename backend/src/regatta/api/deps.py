@@ -1,7 +1,8 @@
 from collections.abc import AsyncGenerator
+from concurrent.futures import Executor
 from typing import Annotated
 
-from fastapi import Header, HTTPException
+from fastapi import Header, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from regatta.api.auth import decode_token
@@ -13,6 +14,11 @@ async def get_db() -> AsyncGenerator[AsyncSession]:
         yield session
 
 
+def get_planner_pool(request: Request) -> Executor:
+    """The process pool for CPU-bound searches, owned by the app lifespan."""
+    return request.app.state.planner_pool
+
+
 def get_current_user(authorization: Annotated[str, Header()]):
     try:
         token = authorization.split(" ")[1]
@@ -0,0 +1,97 @@
+"""Loading and updating games for both the HTTP routes and the WebSocket."""
+
+import uuid
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from regatta.cache.game_cache import CachedGame, game_cache
+from regatta.config import settings
+from regatta.core.action_log import apply_action
+from regatta.db.game_store import append_action, load_game
+from regatta.models.game import Game
+from regatta.serialization.game_serializer import serialize_game
+from regatta.ws.broadcast_dispatcher import broadcast_dispatcher
+
+
+async def get_cached_game_or_404(game_id: uuid.UUID, db: AsyncSession) -> CachedGame:
+    cached_game = game_cache.get(str(game_id))
+    if cached_game:
+        return cached_game
+    return await _load_game_or_404(game_id, db)
+
+
+async def _load_game_or_404(game_id: uuid.UUID, db: AsyncSession) -> CachedGame:
+    stored_game = await load_game(db, game_id)
+    if not stored_game:
+        raise HTTPException(status_code=404)
+
+    return game_cache.put(
+        str(game_id),
+        stored_game.game,
+        serialize_game(stored_game.game),
+        stored_game.version,
+        stored_game.snapshot,
+    )
+
+
+def _apply_or_422(game: Game, action: dict) -> Game:
+    try:
+        return apply_action(game, action)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+
+async def apply_game_action(
+    game_id: uuid.UUID, db: AsyncSession, action: dict
+) -> CachedGame:
+    """
+    Applies action to the latest game and logs it, re-running it on fresh
+    state if a concurrent write lands in between or a cached game rejects it.
+    Returns the new cache entry.
+    """
+    for _ in range(settings.game_write_retries + 1):
+        cached_game = game_cache.get(str(game_id))
+        if cached_game is None:
+            cached_game = await _load_game_or_404(game_id, db)
+            updated_game = _apply_or_422(cached_game.game, action)
+        else:
+            try:
+                updated_game = apply_action(cached_game.game, action)
+            except ValueError:
+                # The entry can predate a write made through another worker,
+                # so only the stored game may reject the action.
+                game_cache.invalidate(str(game_id))
+                cached_game = await _load_game_or_404(game_id, db)
+                updated_game = _apply_or_422(cached_game.game, action)
+
+        serialized_game = serialize_game(updated_game)
+        snapshot = await append_action(
+            db,
+            game_id,
+            cached_game.version,
+            action,
+            serialized_game,
+            cached_game.snapshot,
+            settings.snapshot_interval,
+        )
+        if snapshot is not None:
+            await db.commit()
+            saved_game = game_cache.put(
+                str(game_id),
+                updated_game,
+                serialized_game,
+                cached_game.version + 1,
+                snapshot,
+            )
+            broadcast_dispatcher.publish(
+                str(game_id), saved_game.version, serialized_game
+            )
+            return saved_game
+
+        await db.rollback()
+        game_cache.invalidate(str(game_id))
+
+    raise HTTPException(
+        status_code=409, detail="Game was updated concurrently, please retry"
+    )
@@ -1,79 +1,123 @@
+import asyncio
+import base64
 import random
 import uuid
+from concurrent.futures import Executor
+from datetime import datetime
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from regatta.api.deps import get_current_user, get_db
+from regatta.api.deps import get_current_user, get_db, get_planner_pool
+from regatta.api.game_state import apply_game_action, get_cached_game_or_404
 from regatta.api.schemas import (
     AddPlayerRequest,
     ChooseStartingPositionRequest,
+    GameListResponse,
     GameResponse,
+    GameSummaryResponse,
+    LegalActionsResponse,
     MoveLegRequest,
+    ReachableCellsResponse,
     SpinnakerRequest,
+    StandingsResponse,
+    TurnRequest,
     UsePuffRequest,
 )
-from regatta.core.game_actions import (
-    add_player,
-    choose_starting_position,
-    end_turn,
-    lower_spinnaker,
-    move_leg,
-    raise_spinnaker,
-    start_round,
-    start_setup,
-    use_puff,
+from regatta.cache.game_cache import game_cache
+from regatta.core.action_log import new_action
+from regatta.core.course import generate_board
+from regatta.core.legal_moves import (
+    LegalActions,
+    list_legal_actions,
+    reachable_cells,
 )
-from regatta.db.models import GameRow
-from regatta.models.board import Board, Grid
-from regatta.models.game import Game
+from regatta.core.route_planner import plan_route_async
+from regatta.db.game_store import insert_game, list_games
+from regatta.models.game import Game, GamePhase
 from regatta.models.position import Position
-from regatta.models.wind import Heading, WindDirection
-from regatta.serialization.game_serializer import deserialize_game, serialize_game
-from regatta.ws.connection_manager import connection_manager
+from regatta.models.wind import WindDirection
+from regatta.serialization.game_serializer import serialize_game
 
 router = APIRouter(
     prefix="/games", tags=["games"], dependencies=[Depends(get_current_user)]
 )
 
 
-async def _get_game_or_404(game_id: uuid.UUID, db: AsyncSession) -> GameRow:
-    game_row = await db.get(GameRow, game_id)
-    if not game_row:
-        raise HTTPException(status_code=404)
-    return game_row
+async def _apply_action(
+    game_id: uuid.UUID, db: AsyncSession, action: dict
+) -> GameResponse:
+    cached_game = await apply_game_action(game_id, db, action)
+    return GameResponse.model_validate(cached_game.payload)
 
 
-async def _save_game(game_row: GameRow, game: Game, db: AsyncSession) -> GameResponse:
-    serialized_game = serialize_game(game)
-    game_row.state = serialized_game
+def _encode_cursor(created_at: datetime, game_id: uuid.UUID) -> str:
+    raw = f"{created_at.isoformat()}|{game_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
 
-    await db.commit()
-    await connection_manager.broadcast(str(game_row.id), serialized_game)
 
-    return GameResponse.model_validate(serialized_game)
+def _decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        created_at, game_id = base64.urlsafe_b64decode(cursor).decode().split("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(game_id)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail="Invalid cursor") from e
 
 
-@router.post("/", response_model=GameResponse)
-async def create_game(db: AsyncSession = Depends(get_db)):
-    board = Board(
-        grid=Grid(28, 20),
-        course_marks=[
-            Position(random.randint(10, 18), random.randint(1, 4)),
+@router.get("/", response_model=GameListResponse)
+async def get_games(
+    phase: Literal["LOBBY", "SETUP", "RACING", "FINISHED"] | None = None,
+    player_count: int | None = Query(None, ge=0),
+    created_after: datetime | None = None,
+    created_before: datetime | None = None,
+    cursor: str | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+) -> GameListResponse:
+    rows = await list_games(
+        db,
+        # One extra row tells us whether there is another page.
+        limit=limit + 1,
+        phase=phase,
+        player_count=player_count,
+        created_after=created_after,
+        created_before=created_before,
+        after=_decode_cursor(cursor) if cursor else None,
+    )
+
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = _encode_cursor(page[-1].created_at, page[-1].id)
+
+    return GameListResponse(
+        games=[
+            GameSummaryResponse(
+                id=str(row.id),
+                phase=row.phase,
+                player_count=row.player_count,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+            )
+            for row in page
         ],
-        starting_line=(Position(8, 19), Position(20, 19)),
+        next_cursor=next_cursor,
     )
 
+
+@router.post("/", response_model=GameResponse)
+async def create_game(db: AsyncSession = Depends(get_db)):
     game = Game(
         id=str(uuid.uuid4()),
-        board=board,
+        board=generate_board(),
         wind_direction=random.choice(list(WindDirection)),
     )
     serialized_game = serialize_game(game)
-    game_row = GameRow(id=uuid.UUID(game.id), state=serialized_game)
 
-    db.add(game_row)
+    await insert_game(db, uuid.UUID(game.id), serialized_game)
     await db.commit()
+    game_cache.put(game.id, game, serialized_game, 1, serialized_game)
 
     return GameResponse.model_validate(serialized_game)
 
@@ -82,38 +126,142 @@ async def create_game(db: AsyncSession = Depends(get_db)):
 async def get_game(
     game_id: uuid.UUID, db: AsyncSession = Depends(get_db)
 ) -> GameResponse:
-    game_row = await _get_game_or_404(game_id, db)
-    return GameResponse.model_validate(game_row.state)
+    cached_game = await get_cached_game_or_404(game_id, db)
+    return GameResponse.model_validate(cached_game.payload)
 
 
-@router.post("/{game_id}/players", response_model=GameResponse)
-async def add_player_to_game(
-    game_id: uuid.UUID, request: AddPlayerRequest, db: AsyncSession = Depends(get_db)
-) -> GameResponse:
-    game_row = await _get_game_or_404(game_id, db)
-    deserialized_game = deserialize_game(game_row.state)
+def _serialize_legal_actions(game: Game) -> dict:
+    legal_actions: LegalActions = list_legal_actions(game)
+
+    def position(p: Position | None) -> dict | None:
+        return {"x": p.x, "y": p.y} if p else None
+
+    return {
+        "player_id": legal_actions.player_id,
+        "moves": [
+            {
+                **vars(move),
+                "heading": move.heading.value,
+                "destination": position(move.destination),
+            }
+            for move in legal_actions.moves
+        ],
+        "puffs": [
+            {
+                **vars(puff),
+                "direction": puff.direction.value,
+                "destination": position(puff.destination),
+            }
+            for puff in legal_actions.puffs
+        ],
+        "can_raise_spinnaker": legal_actions.can_raise_spinnaker,
+        "can_lower_spinnaker": legal_actions.can_lower_spinnaker,
+        "can_end_turn": legal_actions.can_end_turn,
+    }
+
+
+@router.get("/{game_id}/legal-actions", response_model=LegalActionsResponse)
+async def get_legal_actions(
+    game_id: uuid.UUID, db: AsyncSession = Depends(get_db)
+) -> LegalActionsResponse:
+    """Every move, puff and spinnaker action open to the current player."""
+    cached_game = await get_cached_game_or_404(game_id, db)
 
     try:
-        updated_game = add_player(deserialized_game, request.player_id)
+        legal_actions = cached_game.derive("legal_actions", _serialize_legal_actions)
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e)) from e
 
-    return await _save_game(game_row, updated_game, db)
+    return LegalActionsResponse.model_validate(legal_actions)
+
+
+def _serialize_reachable_cells(game: Game) -> dict:
+    reachable = reachable_cells(game)
+    return {
+        "player_id": reachable.player_id,
+        "cells": [
+            {"x": cell.x, "y": cell.y}
+            for cell in sorted(reachable.cells, key=lambda cell: (cell.y, cell.x))
+        ],
+        "can_finish": reachable.can_finish,
+    }
+
+
+@router.get("/{game_id}/reachable-cells", response_model=ReachableCellsResponse)
+async def get_reachable_cells(
+    game_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    planner_pool: Executor = Depends(get_planner_pool),
+) -> ReachableCellsResponse:
+    """Every cell the current player could end their turn on."""
+    cached_game = await get_cached_game_or_404(game_id, db)
+
+    reachable = cached_game.derived.get("reachable_cells")
+    if reachable is None:
+        loop = asyncio.get_running_loop()
+        try:
+            reachable = await loop.run_in_executor(
+                planner_pool, _serialize_reachable_cells, cached_game.game
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e)) from e
+        cached_game.derived["reachable_cells"] = reachable
+
+    return ReachableCellsResponse.model_validate(reachable)
+
+
+@router.get("/{game_id}/standings", response_model=StandingsResponse)
+async def get_standings(
+    game_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    planner_pool: Executor = Depends(get_planner_pool),
+) -> StandingsResponse:
+    """Players ordered by the fewest legs each still needs to finish."""
+    cached_game = await get_cached_game_or_404(game_id, db)
+    game = cached_game.game
+    if game.phase not in (GamePhase.RACING, GamePhase.FINISHED):
+        raise HTTPException(status_code=422, detail="Must be in RACING phase")
+
+    standings = cached_game.derived.get("standings")
+    if standings is None:
+        standings = []
+        for player_id in game.setup_order:
+            yacht = game.yachts[player_id]
+            legs_to_finish = 0
+            if game.winner != player_id:
+                route = await plan_route_async(
+                    planner_pool, game.board, game.wind_direction, yacht
+                )
+                legs_to_finish = route.legs if route else None
+            standings.append(
+                {
+                    "player_id": player_id,
+                    "legs_to_finish": legs_to_finish,
+                    "marks_rounded": len(yacht.marks_rounded),
+                }
+            )
+        standings.sort(
+            key=lambda s: (s["legs_to_finish"] is None, s["legs_to_finish"] or 0)
+        )
+        cached_game.derived["standings"] = standings
+
+    return StandingsResponse(standings=standings)
+
+
+@router.post("/{game_id}/players", response_model=GameResponse)
+async def add_player_to_game(
+    game_id: uuid.UUID, request: AddPlayerRequest, db: AsyncSession = Depends(get_db)
+) -> GameResponse:
+    return await _apply_action(
+        game_id, db, new_action("add_player", player_id=request.player_id)
+    )
 
 
 @router.post("/{game_id}/start", response_model=GameResponse)
 async def begin_setup(
     game_id: uuid.UUID, db: AsyncSession = Depends(get_db)
 ) -> GameResponse:
-    game_row = await _get_game_or_404(game_id, db)
-    deserialized_game = deserialize_game(game_row.state)
-
-    try:
-        updated_game = start_setup(deserialized_game)
-    except ValueError as e:
-        raise HTTPException(status_code=422, detail=str(e)) from e
-
-    return await _save_game(game_row, updated_game, db)
+    return await _apply_action(game_id, db, new_action("start_setup"))
 
 
 @router.post("/{game_id}/starting-position", response_model=GameResponse)
@@ -122,17 +270,16 @@ async def choose_start(
     request: ChooseStartingPositionRequest,
     db: AsyncSession = Depends(get_db),
 ) -> GameResponse:
-    game_row = await _get_game_or_404(game_id, db)
-    deserialized_game = deserialize_game(game_row.state)
-
-    try:
-        updated_game = choose_starting_position(
-            deserialized_game, request.player_id, Position(request.x, request.y)
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=422, detail=str(e)) from e
-
-    return await _save_game(game_row, updated_game, db)
+    return await _apply_action(
+        game_id,
+        db,
+        new_action(
+            "choose_starting_position",
+            player_id=request.player_id,
+            x=request.x,
+            y=request.y,
+        ),
+    )
 
 
 @router.post("/{game_id}/round", response_model=GameResponse)
@@ -140,15 +287,7 @@ async def start_game_round(
     game_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ) -> GameResponse:
-    game_row = await _get_game_or_404(game_id, db)
-    deserialized_game = deserialize_game(game_row.state)
-
-    try:
-        updated_game = start_round(deserialized_game)
-    except ValueError as e:
-        raise HTTPException(status_code=422, detail=str(e)) from e
-
-    return await _save_game(game_row, updated_game, db)
+    return await _apply_action(game_id, db, new_action("start_round"))
 
 
 @router.post("/{game_id}/move", response_model=GameResponse)
@@ -157,17 +296,11 @@ async def make_move(
     request: MoveLegRequest,
     db: AsyncSession = Depends(get_db),
 ) -> GameResponse:
-    game_row = await _get_game_or_404(game_id, db)
-    deserialized_game = deserialize_game(game_row.state)
-
-    try:
-        updated_game = move_leg(
-            deserialized_game, request.player_id, Heading(request.heading)
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=422, detail=str(e)) from e
-
-    return await _save_game(game_row, updated_game, db)
+    return await _apply_action(
+        game_id,
+        db,
+        new_action("move_leg", player_id=request.player_id, heading=request.heading),
+    )
 
 
 @router.post("/{game_id}/end-turn", response_model=GameResponse)
@@ -175,15 +308,7 @@ async def end_player_turn(
     game_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ) -> GameResponse:
-    game_row = await _get_game_or_404(game_id, db)
-    deserialized_game = deserialize_game(game_row.state)
-
-    try:
-        updated_game = end_turn(deserialized_game)
-    except ValueError as e:
-        raise HTTPException(status_code=422, detail=str(e)) from e
-
-    return await _save_game(game_row, updated_game, db)
+    return await _apply_action(game_id, db, new_action("end_turn"))
 
 
 @router.post("/{game_id}/puff", response_model=GameResponse)
@@ -192,18 +317,13 @@ async def puff(
     request: UsePuffRequest,
     db: AsyncSession = Depends(get_db),
 ) -> GameResponse:
-    game_row = await _get_game_or_404(game_id, db)
-    deserialized_game = deserialize_game(game_row.state)
-
-    try:
-        updated_game = use_puff(
-            deserialized_game, request.player_id, WindDirection(request.direction)
-        )
-
-    except ValueError as e:
-        raise HTTPException(status_code=422, detail=str(e)) from e
-
-    return await _save_game(game_row, updated_game, db)
+    return await _apply_action(
+        game_id,
+        db,
+        new_action(
+            "use_puff", player_id=request.player_id, direction=request.direction
+        ),
+    )
 
 
 @router.post("/{game_id}/spinnaker/raise", response_model=GameResponse)
@@ -212,16 +332,9 @@ async def spinnaker_raise(
     request: SpinnakerRequest,
     db: AsyncSession = Depends(get_db),
 ) -> GameResponse:
-    game_row = await _get_game_or_404(game_id, db)
-    deserialized_game = deserialize_game(game_row.state)
-
-    try:
-        updated_game = raise_spinnaker(deserialized_game, request.player_id)
-
-    except ValueError as e:
-        raise HTTPException(status_code=422, detail=str(e)) from e
-
-    return await _save_game(game_row, updated_game, db)
+    return await _apply_action(
+        game_id, db, new_action("raise_spinnaker", player_id=request.player_id)
+    )
 
 
 @router.post("/{game_id}/spinnaker/lower", response_model=GameResponse)
@@ -230,13 +343,28 @@ async def spinnaker_lower(
     request: SpinnakerRequest,
     db: AsyncSession = Depends(get_db),
 ) -> GameResponse:
-    game_row = await _get_game_or_404(game_id, db)
-    deserialized_game = deserialize_game(game_row.state)
-
-    try:
-        updated_game = lower_spinnaker(deserialized_game, request.player_id)
+    return await _apply_action(
+        game_id, db, new_action("lower_spinnaker", player_id=request.player_id)
+    )
 
-    except ValueError as e:
-        raise HTTPException(status_code=422, detail=str(e)) from e
 
-    return await _save_game(game_row, updated_game, db)
+@router.post("/{game_id}/turn", response_model=GameResponse)
+async def take_turn(
+    game_id: uuid.UUID,
+    request: TurnRequest,
+    db: AsyncSession = Depends(get_db),
+) -> GameResponse:
+    """
+    Applies several actions for one player in order, with one commit and one
+    broadcast. Nothing is saved if any action is rejected; the 422 detail
+    names the index of the first one that was.
+    """
+    return await _apply_action(
+        game_id,
+        db,
+        new_action(
+            "turn",
+            player_id=request.player_id,
+            actions=[step.model_dump() for step in request.actions],
+        ),
+    )
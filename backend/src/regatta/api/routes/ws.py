@@ -1,15 +1,90 @@
-from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+import json
+import uuid
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from regatta.api.auth import decode_token
+from regatta.api.deps import get_db
+from regatta.api.game_state import apply_game_action
+from regatta.api.schemas import GameCommand
+from regatta.core.action_log import new_action
 from regatta.ws.connection_manager import connection_manager
 
 router = APIRouter()
 
 
+def _parse_frame(message: str) -> dict:
+    """Anything that is not a JSON object is treated as a keepalive."""
+    try:
+        frame = json.loads(message)
+    except ValueError:
+        return {}
+    return frame if isinstance(frame, dict) else {}
+
+
+async def _run_command(game_id: str, frame: dict, db: AsyncSession) -> dict:
+    """Applies a command frame and returns the ack or error frame to send back."""
+    request_id = frame.get("request_id")
+    try:
+        command = GameCommand.model_validate(frame)
+    except ValidationError as e:
+        return _error_frame(
+            request_id, 422, e.errors(include_url=False, include_context=False)
+        )
+    try:
+        game_uuid = uuid.UUID(game_id)
+    except ValueError:
+        return _error_frame(request_id, 404, "Not Found")
+
+    try:
+        cached_game = await apply_game_action(
+            game_uuid,
+            db,
+            new_action(
+                command.action.type,
+                player_id=command.player_id,
+                **command.action.model_dump(exclude={"type"}),
+            ),
+        )
+    except HTTPException as e:
+        # The socket keeps its session, so end the transaction a failed
+        # command may have opened.
+        await db.rollback()
+        return _error_frame(request_id, e.status_code, e.detail)
+    except Exception:
+        await db.rollback()
+        raise
+
+    return {"type": "ack", "request_id": request_id, "version": cached_game.version}
+
+
+def _error_frame(request_id: object, status: int, detail: object) -> dict:
+    return {
+        "type": "error",
+        "request_id": request_id,
+        "status": status,
+        "detail": detail,
+    }
+
+
 @router.websocket("/{game_id}/ws")
 async def websocket_endpoint(
-    game_id: str, connection: WebSocket, token: str = Query(...)
+    game_id: str,
+    connection: WebSocket,
+    token: str = Query(...),
+    db: AsyncSession = Depends(get_db),
 ) -> None:
+    # The token is checked once here; commands on this socket are not
+    # re-authenticated.
     try:
         decode_token(token)
     except Exception:
@@ -21,6 +96,14 @@ async def websocket_endpoint(
 
     try:
         while True:
-            await connection.receive_text()  # keep connection alive
+            frame = _parse_frame(await connection.receive_text())
+            match frame.get("type"):
+                case "snapshot":
+                    await connection_manager.send_snapshot(game_id, connection)
+                case "command":
+                    reply = await _run_command(game_id, frame, db)
+                    await connection_manager.send(connection, reply)
     except WebSocketDisconnect:
+        pass
+    finally:
         connection_manager.disconnect(game_id, connection)
@@ -1,4 +1,7 @@
-from pydantic import BaseModel
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, Field
 
 
 class AddPlayerRequest(BaseModel):
@@ -25,18 +28,72 @@ class SpinnakerRequest(BaseModel):
     player_id: str
 
 
+class MoveLegStep(BaseModel):
+    type: Literal["move_leg"]
+    heading: int
+
+
+class UsePuffStep(BaseModel):
+    type: Literal["use_puff"]
+    direction: int
+
+
+class SpinnakerStep(BaseModel):
+    type: Literal["raise_spinnaker", "lower_spinnaker"]
+
+
+class EndTurnStep(BaseModel):
+    type: Literal["end_turn"]
+
+
+TurnStep = Annotated[
+    MoveLegStep | UsePuffStep | SpinnakerStep | EndTurnStep,
+    Field(discriminator="type"),
+]
+
+
+class TurnRequest(BaseModel):
+    player_id: str
+    actions: list[TurnStep] = Field(min_length=1, max_length=20)
+
+
+class StartRoundStep(BaseModel):
+    type: Literal["start_round"]
+
+
+class GameCommand(BaseModel):
+    """
+    A game action sent over the WebSocket. The server answers with an "ack"
+    or "error" frame carrying the same request_id; the new state follows as
+    a regular patch.
+    """
+
+    type: Literal["command"]
+    request_id: str
+    player_id: str
+    action: Annotated[
+        MoveLegStep | UsePuffStep | SpinnakerStep | EndTurnStep | StartRoundStep,
+        Field(discriminator="type"),
+    ]
+
+
 class PositionResponse(BaseModel):
     x: int
     y: int
 
 
+class TrackResponse(BaseModel):
+    version: int
+    runs: list[int]  # [x0, y0, dx, dy, count, ...]
+
+
 class YachtResponse(BaseModel):
     position: PositionResponse
     heading: int
     spinnaker: bool
     puff_count: int
     marks_rounded: list[PositionResponse]
-    position_history: list[PositionResponse]
+    position_history: TrackResponse
 
 
 class GridResponse(BaseModel):
@@ -64,3 +121,65 @@ class GameResponse(BaseModel):
     has_used_puff: bool
     winner: str | None
     last_event: str | None
+
+
+class GameSummaryResponse(BaseModel):
+    id: str
+    phase: str
+    player_count: int
+    created_at: datetime
+    updated_at: datetime
+
+
+class GameListResponse(BaseModel):
+    games: list[GameSummaryResponse]
+    # Pass as `cursor` to fetch the next page; None on the last page.
+    next_cursor: str | None
+
+
+class MoveOptionResponse(BaseModel):
+    heading: int
+    legal: bool
+    reason: str | None
+    destination: PositionResponse | None
+    speed: int
+    toggled_spinnaker_speed: int
+    leg_cost: int
+    maneuver: Literal["tack", "jibe"] | None
+    tack: Literal["port", "starboard"] | None
+    rounds_mark: bool
+    finishes: bool
+
+
+class PuffOptionResponse(BaseModel):
+    direction: int
+    legal: bool
+    reason: str | None
+    destination: PositionResponse | None
+    rounds_mark: bool
+
+
+class LegalActionsResponse(BaseModel):
+    player_id: str
+    moves: list[MoveOptionResponse]
+    puffs: list[PuffOptionResponse]
+    can_raise_spinnaker: bool
+    can_lower_spinnaker: bool
+    can_end_turn: bool
+
+
+class ReachableCellsResponse(BaseModel):
+    player_id: str
+    cells: list[PositionResponse]
+    can_finish: bool
+
+
+class StandingResponse(BaseModel):
+    player_id: str
+    # None if the course can no longer be finished from where the yacht is.
+    legs_to_finish: int | None
+    marks_rounded: int
+
+
+class StandingsResponse(BaseModel):
+    standings: list[StandingResponse]
@@ -0,0 +1,113 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from regatta.config import settings
+from regatta.models.game import Game
+
+
+@dataclass(frozen=True)
+class CachedGame:
+    game: Game
+    payload: dict
+    version: int
+    # The document currently stored in games.state, which can be older than
+    # payload. Snapshot writes are diffed against it.
+    snapshot: dict
+    expires_at: float
+    # Values computed from this version of the game, e.g. its legal moves.
+    # A new version gets a new entry, so these never go stale.
+    derived: dict = field(default_factory=dict, compare=False, repr=False)
+
+    def derive[T](self, key: str, compute: Callable[[Game], T]) -> T:
+        if key not in self.derived:
+            self.derived[key] = compute(self.game)
+        return self.derived[key]
+
+
+class GameCache:
+    """
+    Bounded LRU cache of deserialized games and their serialized payloads,
+    keyed by game id. Entries expire after ttl_seconds. A max_size of 0
+    disables caching. An entry is never replaced by an older version, so
+    writers finishing out of order cannot roll the cache back.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, CachedGame] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, game_id: str) -> CachedGame | None:
+        entry = self._entries.get(game_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.expires_at <= self._clock():
+            del self._entries[game_id]
+            self.evictions += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(game_id)
+        self.hits += 1
+        return entry
+
+    def put(
+        self, game_id: str, game: Game, payload: dict, version: int, snapshot: dict
+    ) -> CachedGame:
+        entry = CachedGame(
+            game, payload, version, snapshot, self._clock() + self.ttl_seconds
+        )
+        if self.max_size <= 0:
+            return entry
+
+        current = self._entries.get(game_id)
+        if current is not None and current.version > version:
+            return entry
+
+        self._entries[game_id] = entry
+        self._entries.move_to_end(game_id)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+        return entry
+
+    def invalidate(self, game_id: str) -> None:
+        self._entries.pop(game_id, None)
+
+    def invalidate_older(self, game_id: str, version: int) -> None:
+        """Drops the entry if it predates version, e.g. one written elsewhere."""
+        entry = self._entries.get(game_id)
+        if entry is not None and entry.version < version:
+            del self._entries[game_id]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+game_cache = GameCache(settings.game_cache_size, settings.game_cache_ttl_seconds)
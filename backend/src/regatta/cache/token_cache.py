@@ -0,0 +1,74 @@
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from regatta.config import settings
+
+
+class TokenCache:
+    """
+    Bounded LRU cache of verified JWT claims, keyed by a SHA-256 of the token
+    so raw tokens are not held in memory. Entries expire at the token's exp
+    claim, so a cached token is never accepted after the JWT itself would be
+    rejected. A max_size of 0 disables caching.
+    """
+
+    def __init__(self, max_size: int, clock: Callable[[], float] = time.time) -> None:
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[bytes, dict] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict | None:
+        key = self._key(token)
+        claims = self._entries.get(key)
+        if claims is None:
+            self.misses += 1
+            return None
+
+        if claims["exp"] <= self._clock():
+            del self._entries[key]
+            self.evictions += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return claims
+
+    def put(self, token: str, claims: dict) -> None:
+        # Without an exp claim there is nothing to expire the entry at.
+        if self.max_size <= 0 or "exp" not in claims:
+            return
+
+        key = self._key(token)
+        self._entries[key] = claims
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+token_cache = TokenCache(settings.token_cache_size)
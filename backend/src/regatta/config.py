@@ -1,11 +1,37 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     database_url: str = "postgresql+asyncpg://localhost/regatta"
+    db_echo: bool = False
+    # Per worker process: total connections = workers * (size + overflow).
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30.0
+    # -1 keeps connections indefinitely.
+    db_pool_recycle_seconds: int = -1
+    db_pool_pre_ping: bool = False
+    # asyncpg prepared statements kept per connection; 0 disables the cache,
+    # which is needed behind PgBouncer in transaction pooling mode.
+    db_statement_cache_size: int = 100
     model_config = {"env_file": ".env"}
     jwt_secret_key: str
     shared_password: str
+    token_cache_size: int = 4096
+    game_cache_size: int = 1024
+    game_cache_ttl_seconds: float = 300.0
+    ws_send_queue_size: int = 32
+    ws_overflow_policy: Literal["coalesce", "drop"] = "coalesce"
+    shutdown_drain_timeout_seconds: float = 10.0
+    # "postgres" relays updates between workers with LISTEN/NOTIFY.
+    broadcast_backend: Literal["local", "postgres"] = "local"
+    notify_channel: str = "regatta_game_updates"
+    game_write_retries: int = 3
+    snapshot_interval: int = 20
+    # Worker processes for the route planner behind GET /games/{id}/standings.
+    route_planner_workers: int = 2
 
 
 settings = Settings()  # type: ignore
@@ -0,0 +1,121 @@
+"""
+Replayable game actions.
+
+An action is a small JSON-safe dict naming one of the functions in
+game_actions plus its arguments, e.g. {"type": "move_leg", "player_id": "p1",
+"heading": 45, "seed": 1234}. The seed fixes any dice the action rolls, so
+replaying a log from a snapshot rebuilds exactly the game that was played.
+
+A "turn" action carries an ordered list of steps for one player, e.g.
+{"type": "turn", "player_id": "p1", "actions": [{"type": "move_leg",
+"heading": 45}, {"type": "end_turn"}], "seed": 99}, applied all or nothing.
+"""
+
+import random
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+
+from regatta.core.game_actions import (
+    add_player,
+    choose_starting_position,
+    end_turn,
+    lower_spinnaker,
+    move_leg,
+    raise_spinnaker,
+    start_round,
+    start_setup,
+    use_puff,
+)
+from regatta.models.game import Game, GamePhase
+from regatta.models.position import get_position
+from regatta.models.wind import Heading, WindDirection
+
+TURN_STEP_TYPES = frozenset(
+    {"move_leg", "use_puff", "raise_spinnaker", "lower_spinnaker", "end_turn"}
+)
+
+
+class TurnActionError(ValueError):
+    """A step of a turn action was rejected; index is its position in the turn."""
+
+    def __init__(self, index: int, message: str) -> None:
+        super().__init__(f"Action {index}: {message}")
+        self.index = index
+
+
+def new_action(action_type: str, **params: object) -> dict:
+    return {"type": action_type, **params, "seed": random.getrandbits(32)}
+
+
+@contextmanager
+def _seeded_random(seed: int) -> Iterator[None]:
+    # game_actions rolls dice with the module-level random functions. Seed
+    # them for the duration of one action and restore the previous stream.
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(state)
+
+
+def apply_action(game: Game, action: dict) -> Game:
+    with _seeded_random(action["seed"]):
+        return _dispatch(game, action)
+
+
+def replay(game: Game, actions: Iterable[dict]) -> Game:
+    for action in actions:
+        game = apply_action(game, action)
+    return game
+
+
+def _dispatch(game: Game, action: dict) -> Game:
+    match action["type"]:
+        case "add_player":
+            return add_player(game, action["player_id"])
+        case "start_setup":
+            return start_setup(game)
+        case "choose_starting_position":
+            return choose_starting_position(
+                game, action["player_id"], get_position(action["x"], action["y"])
+            )
+        case "start_round":
+            return start_round(game)
+        case "move_leg":
+            return move_leg(game, action["player_id"], Heading(action["heading"]))
+        case "end_turn":
+            return end_turn(game)
+        case "use_puff":
+            return use_puff(
+                game, action["player_id"], WindDirection(action["direction"])
+            )
+        case "raise_spinnaker":
+            return raise_spinnaker(game, action["player_id"])
+        case "lower_spinnaker":
+            return lower_spinnaker(game, action["player_id"])
+        case "turn":
+            return _apply_turn(game, action["player_id"], action["actions"])
+        case unknown:
+            raise ValueError(f"Unknown action type {unknown!r}")
+
+
+def _apply_turn(game: Game, player_id: str, steps: list[dict]) -> Game:
+    for index, step in enumerate(steps):
+        if step["type"] not in TURN_STEP_TYPES:
+            raise TurnActionError(index, f"{step['type']!r} is not allowed in a turn")
+
+        # end_turn takes no player, so check whose turn is being ended here.
+        if (
+            step["type"] == "end_turn"
+            and game.phase == GamePhase.RACING
+            and game.setup_order[game.current_player_index] != player_id
+        ):
+            raise TurnActionError(index, f"It is not player_id {player_id}'s turn")
+
+        try:
+            game = _dispatch(game, {**step, "player_id": player_id})
+        except ValueError as e:
+            raise TurnActionError(index, str(e)) from e
+
+    return game
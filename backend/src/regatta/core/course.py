@@ -0,0 +1,17 @@
+import random
+
+from regatta.models.board import Board, Grid
+from regatta.models.position import Position
+
+
+def generate_board(rng: random.Random | None = None) -> Board:
+    """The board every new game is raced on, with the course mark placed at
+    random. Pass `rng` for a reproducible course."""
+    randint = rng.randint if rng else random.randint
+    return Board(
+        grid=Grid(28, 20),
+        course_marks=[
+            Position(randint(10, 18), randint(1, 4)),
+        ],
+        starting_line=(Position(8, 19), Position(20, 19)),
+    )
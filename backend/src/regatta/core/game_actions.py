@@ -1,20 +1,12 @@
 import random
 from dataclasses import replace
 
-from regatta.core.geometry import (
-    bounding_box_contains,
-    convex_hull,
-    is_strictly_inside_hull,
-)
+from regatta.core.geometry import convex_hull, extend_hull, is_strictly_inside_hull
+from regatta.models.board import Board
 from regatta.models.game import Game, GamePhase
 from regatta.models.position import Position, calculate_next_position
-from regatta.models.wind import (
-    Heading,
-    PointOfSail,
-    detect_maneuver,
-    get_point_of_sail,
-    get_tack,
-)
+from regatta.models.track import Track
+from regatta.models.wind import Heading, detect_maneuver, get_speed, get_tack
 from regatta.models.yacht import Yacht
 
 
@@ -60,7 +52,9 @@ def choose_starting_position(game: Game, player_id: str, position: Position) ->
         raise ValueError("Position is already taken")
 
     new_yacht = Yacht(
-        position, heading=game.wind_direction.opposite(), position_history=(position,)
+        position,
+        heading=game.wind_direction.opposite(),
+        position_history=Track((position,)),
     )
     updated_yachts = {**game.yachts, player_id: new_yacht}
 
@@ -115,22 +109,15 @@ def move_leg(game: Game, player_id: str, heading: Heading) -> Game:
         game.wind_direction, game.yachts[player_id].heading, heading
     )
 
-    point_of_sail = get_point_of_sail(game.wind_direction, heading)
-    spaces = point_of_sail.speed
+    spaces = get_speed(game.wind_direction, heading, game.yachts[player_id].spinnaker)
 
     if spaces == 0:
         raise ValueError("Cannot sail directly into the wind")
 
-    # spinnaker bonus
-    if game.yachts[player_id].spinnaker and point_of_sail in (
-        PointOfSail.RUNNING,
-        PointOfSail.BROAD_REACHING,
-    ):
-        spaces += 1
-
     prev_marks_rounded = game.yachts[player_id].marks_rounded
     current_marks_rounded = prev_marks_rounded
     current_history = game.yachts[player_id].position_history
+    current_hull = _get_track_hull(game.yachts[player_id])
 
     next_position = game.yachts[player_id].position
     for _ in range(spaces):
@@ -138,19 +125,14 @@ def move_leg(game: Game, player_id: str, heading: Heading) -> Game:
         if game.board.is_on_course_mark(candidate):
             raise ValueError("Cannot sail through a course mark")
         next_position = candidate
-        current_history = current_history + (next_position,)
-
-        if len(current_history) >= 8:
-            history_list = list(current_history)
-            for mark in game.board.course_marks:
-                if mark not in current_marks_rounded and bounding_box_contains(
-                    history_list, mark
-                ):
-                    hull = convex_hull(history_list)
-                    if is_strictly_inside_hull(hull, mark):
-                        current_marks_rounded = current_marks_rounded | {mark}
-
-        all_marks_rounded = set(game.board.course_marks) <= set(current_marks_rounded)
+        current_history = current_history.append(next_position)
+        current_hull = extend_hull(current_hull, next_position)
+
+        current_marks_rounded = _round_marks(
+            game.board, current_hull, len(current_history), current_marks_rounded
+        )
+
+        all_marks_rounded = game.board.course.course_marks <= current_marks_rounded
         if all_marks_rounded and game.board.is_on_starting_line(next_position):
             break
 
@@ -162,18 +144,19 @@ def move_leg(game: Game, player_id: str, heading: Heading) -> Game:
     if any(yacht.position == next_position for yacht in game.yachts.values()):
         raise ValueError("Position is occupied")
 
-    updated_yacht = (
-        game.yachts[player_id]
-        .with_position(next_position)
-        .with_heading(heading)
-        .with_marks_rounded(current_marks_rounded)
-        .with_position_history(current_history)
+    updated_yacht = replace(
+        game.yachts[player_id],
+        position=next_position,
+        heading=heading,
+        marks_rounded=current_marks_rounded,
+        position_history=current_history,
+        track_hull=current_hull,
     )
 
     updated_yachts = {**game.yachts, player_id: updated_yacht}
 
     # Check win condition
-    all_marks_rounded = set(game.board.course_marks) <= set(current_marks_rounded)
+    all_marks_rounded = game.board.course.course_marks <= current_marks_rounded
     on_finish_line = game.board.is_on_starting_line(next_position)
     newly_rounded = len(current_marks_rounded) > len(prev_marks_rounded)
 
@@ -262,27 +245,22 @@ def use_puff(game: Game, player_id: str, direction: Heading) -> Game:
 
     new_puff_count = player_yacht.puff_count - 1
 
-    current_marks_rounded = player_yacht.marks_rounded
-    current_history = player_yacht.position_history + (new_position,)
-
-    if len(current_history) >= 8:
-        history_list = list(current_history)
-        for mark in game.board.course_marks:
-            if mark not in current_marks_rounded and bounding_box_contains(
-                history_list, mark
-            ):
-                hull = convex_hull(history_list)
-                if is_strictly_inside_hull(hull, mark):
-                    current_marks_rounded = current_marks_rounded | {mark}
+    current_history = player_yacht.position_history.append(new_position)
+    current_hull = extend_hull(_get_track_hull(player_yacht), new_position)
+    current_marks_rounded = _round_marks(
+        game.board, current_hull, len(current_history), player_yacht.marks_rounded
+    )
 
     newly_rounded = len(current_marks_rounded) > len(player_yacht.marks_rounded)
     last_event = "Rounded the mark via puff!" if newly_rounded else game.last_event
 
-    updated_yacht = (
-        player_yacht.with_puff_count(new_puff_count)
-        .with_position(new_position)
-        .with_marks_rounded(current_marks_rounded)
-        .with_position_history(current_history)
+    updated_yacht = replace(
+        player_yacht,
+        position=new_position,
+        puff_count=new_puff_count,
+        marks_rounded=current_marks_rounded,
+        position_history=current_history,
+        track_hull=current_hull,
     )
     updated_yachts = {**game.yachts, player_id: updated_yacht}
 
@@ -333,6 +311,28 @@ def lower_spinnaker(game: Game, player_id: str) -> Game:
     return updated_game
 
 
+def _get_track_hull(yacht: Yacht) -> tuple[Position, ...]:
+    if yacht.track_hull is not None:
+        return yacht.track_hull
+    return tuple(convex_hull(yacht.position_history))
+
+
+def _round_marks(
+    board: Board,
+    hull: tuple[Position, ...],
+    history_length: int,
+    marks_rounded: frozenset[Position],
+) -> frozenset[Position]:
+    """Adds every course mark strictly enclosed by the track hull."""
+    if history_length < 8:
+        return marks_rounded
+
+    for mark in board.course_marks:
+        if mark not in marks_rounded and is_strictly_inside_hull(hull, mark):
+            marks_rounded = marks_rounded | {mark}
+    return marks_rounded
+
+
 def _get_blanket_penalty(game: Game, player_id: str) -> int:
     yacht = game.yachts[player_id]
     windward_1 = calculate_next_position(yacht.position, game.wind_direction)
@@ -1,3 +1,5 @@
+from collections.abc import Iterable, Sequence
+
 from regatta.models.position import Position
 
 
@@ -6,7 +8,7 @@ def _cross(o: Position, a: Position, b: Position) -> float:
     return (a.x - o.x) * (b.y - o.y) - (a.y - o.y) * (b.x - o.x)
 
 
-def convex_hull(points: list[Position]) -> list[Position]:
+def convex_hull(points: Iterable[Position]) -> list[Position]:
     """
     Andrew's monotone chain convex hull algorithm.
     Returns hull vertices in CCW order (standard math coords),
@@ -32,7 +34,7 @@ def convex_hull(points: list[Position]) -> list[Position]:
     return lower[:-1] + upper[:-1]
 
 
-def is_strictly_inside_hull(hull: list[Position], point: Position) -> bool:
+def is_strictly_inside_hull(hull: Sequence[Position], point: Position) -> bool:
     """
     Returns True if point is strictly inside the convex hull (not on boundary).
     Uses the cross-product sign test: point must be strictly on the same side
@@ -44,15 +46,14 @@ def is_strictly_inside_hull(hull: list[Position], point: Position) -> bool:
     return all(_cross(hull[i], hull[(i + 1) % n], point) > 0 for i in range(n))
 
 
-def bounding_box_contains(points: list[Position], mark: Position) -> bool:
+def extend_hull(hull: tuple[Position, ...], point: Position) -> tuple[Position, ...]:
     """
-    Fast pre-check: returns True only if the bounding box of points strictly
-    contains the mark on all sides — a necessary condition for hull enclosure.
-    Avoids expensive hull computation when encirclement is geometrically impossible.
+    Incremental convex hull: returns convex_hull(points + [point]) given
+    hull == convex_hull(points). A point inside or on the boundary leaves the
+    hull unchanged; otherwise only the hull vertices are re-wrapped. Hull size
+    is bounded by the grid, so this is O(1) amortized in the number of points.
     """
-    return (
-        any(p.x < mark.x for p in points)
-        and any(p.x > mark.x for p in points)
-        and any(p.y < mark.y for p in points)
-        and any(p.y > mark.y for p in points)
-    )
+    n = len(hull)
+    if n >= 3 and all(_cross(hull[i], hull[(i + 1) % n], point) >= 0 for i in range(n)):
+        return hull
+    return tuple(convex_hull([*hull, point]))
@@ -0,0 +1,216 @@
+"""
+Everything the current player could do next, worked out by dry-running the
+actions in game_actions so the answer always matches what they would accept.
+"""
+
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass, replace
+
+from regatta.core.game_actions import (
+    lower_spinnaker,
+    move_leg,
+    raise_spinnaker,
+    use_puff,
+)
+from regatta.models.game import Game, GamePhase
+from regatta.models.position import Position
+from regatta.models.wind import (
+    Heading,
+    Maneuver,
+    Tack,
+    detect_maneuver,
+    get_speed,
+    get_tack,
+)
+
+
+@dataclass(frozen=True)
+class MoveOption:
+    heading: Heading
+    legal: bool
+    # The ValueError move_leg would raise, e.g. a right-of-way violation.
+    reason: str | None
+    destination: Position | None
+    speed: int
+    # Speed on this heading if the spinnaker were raised or lowered first.
+    toggled_spinnaker_speed: int
+    leg_cost: int
+    maneuver: Maneuver
+    tack: Tack
+    rounds_mark: bool
+    finishes: bool
+
+
+@dataclass(frozen=True)
+class PuffOption:
+    direction: Heading
+    legal: bool
+    reason: str | None
+    destination: Position | None
+    rounds_mark: bool
+
+
+@dataclass(frozen=True)
+class LegalActions:
+    player_id: str
+    moves: tuple[MoveOption, ...]
+    puffs: tuple[PuffOption, ...]
+    can_raise_spinnaker: bool
+    can_lower_spinnaker: bool
+    can_end_turn: bool
+
+
+def _dry_run(action, *args) -> tuple[Game | None, str | None]:
+    try:
+        return action(*args), None
+    except ValueError as e:
+        return None, str(e)
+
+
+def _move_option(
+    game: Game, probe: Game, player_id: str, heading: Heading
+) -> MoveOption:
+    yacht = game.yachts[player_id]
+    maneuver = detect_maneuver(game.wind_direction, yacht.heading, heading)
+    moved, reason = _dry_run(move_leg, probe, player_id, heading)
+    moved_yacht = moved.yachts[player_id] if moved else None
+
+    return MoveOption(
+        heading=heading,
+        legal=moved is not None,
+        reason=reason,
+        destination=moved_yacht.position if moved_yacht else None,
+        speed=get_speed(game.wind_direction, heading, yacht.spinnaker),
+        toggled_spinnaker_speed=get_speed(
+            game.wind_direction, heading, not yacht.spinnaker
+        ),
+        leg_cost=2 if maneuver else 1,
+        maneuver=maneuver,
+        tack=get_tack(game.wind_direction, heading),
+        rounds_mark=bool(
+            moved_yacht and len(moved_yacht.marks_rounded) > len(yacht.marks_rounded)
+        ),
+        finishes=bool(moved and moved.winner == player_id),
+    )
+
+
+def _puff_option(game: Game, player_id: str, direction: Heading) -> PuffOption:
+    yacht = game.yachts[player_id]
+    puffed, reason = _dry_run(use_puff, game, player_id, direction)
+    puffed_yacht = puffed.yachts[player_id] if puffed else None
+
+    return PuffOption(
+        direction=direction,
+        legal=puffed is not None,
+        reason=reason,
+        destination=puffed_yacht.position if puffed_yacht else None,
+        rounds_mark=bool(
+            puffed_yacht and len(puffed_yacht.marks_rounded) > len(yacht.marks_rounded)
+        ),
+    )
+
+
+def list_legal_actions(game: Game) -> LegalActions:
+    if game.phase != GamePhase.RACING:
+        raise ValueError("Must be in RACING phase")
+
+    player_id = game.setup_order[game.current_player_index]
+
+    # Dry runs must not end the turn: that rolls dice for the next one. Two
+    # spare legs cover the most a single move can cost, and no rule other
+    # than the zero-legs check looks at the count.
+    probe = game
+    if game.legs_remaining > 0:
+        probe = replace(game, legs_remaining=game.legs_remaining + 2)
+
+    return LegalActions(
+        player_id=player_id,
+        moves=tuple(
+            _move_option(game, probe, player_id, heading) for heading in Heading
+        ),
+        puffs=tuple(_puff_option(game, player_id, direction) for direction in Heading),
+        can_raise_spinnaker=_dry_run(raise_spinnaker, game, player_id)[1] is None,
+        can_lower_spinnaker=_dry_run(lower_spinnaker, probe, player_id)[1] is None,
+        can_end_turn=game.legs_remaining == 0,
+    )
+
+
+@dataclass(frozen=True)
+class ReachableCells:
+    player_id: str
+    # Every cell the yacht could be on once its turn is over.
+    cells: frozenset[Position]
+    can_finish: bool
+
+
+def _turn_key(game: Game, player_id: str) -> tuple:
+    # Other yachts stay put during a turn, so the current yacht and the turn
+    # counters are all that decide what can happen next.
+    yacht = game.yachts[player_id]
+    return (
+        yacht.position,
+        yacht.heading,
+        yacht.spinnaker,
+        yacht.marks_rounded,
+        game.legs_remaining,
+        game.has_used_puff,
+    )
+
+
+def _next_states(game: Game, player_id: str) -> Iterator[Game]:
+    for heading in Heading:
+        moved, _ = _dry_run(move_leg, game, player_id, heading)
+        puffed, _ = _dry_run(use_puff, game, player_id, heading)
+        yield from (state for state in (moved, puffed) if state)
+    for action in (raise_spinnaker, lower_spinnaker):
+        toggled, _ = _dry_run(action, game, player_id)
+        if toggled:
+            yield toggled
+
+
+def reachable_cells(game: Game) -> ReachableCells:
+    """
+    Breadth-first search over the current player's remaining turn: moves
+    (with tack and jibe costs), the one puff and spinnaker changes, each
+    applied through the real game actions.
+    """
+    if game.phase != GamePhase.RACING:
+        raise ValueError("Must be in RACING phase")
+
+    player_id = game.setup_order[game.current_player_index]
+
+    # Same padding as list_legal_actions, so the search never runs end_turn.
+    spare_legs = 2 if game.legs_remaining > 0 else 0
+    start = replace(game, legs_remaining=game.legs_remaining + spare_legs)
+
+    cells: set[Position] = set()
+    can_finish = False
+    seen = {_turn_key(start, player_id)}
+    queue = deque([start])
+
+    while queue:
+        state = queue.popleft()
+        position = state.yachts[player_id].position
+
+        if state.phase == GamePhase.FINISHED:
+            cells.add(position)
+            can_finish = True
+            continue
+
+        # The turn is over once the legs run out. A turn that starts without
+        # legs can still use its puff before it is ended.
+        if state.legs_remaining <= spare_legs:
+            cells.add(position)
+            if state is not start:
+                continue
+
+        for next_state in _next_states(state, player_id):
+            key = _turn_key(next_state, player_id)
+            if key not in seen:
+                seen.add(key)
+                queue.append(next_state)
+
+    return ReachableCells(
+        player_id=player_id, cells=frozenset(cells), can_finish=can_finish
+    )
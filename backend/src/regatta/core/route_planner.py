@@ -0,0 +1,431 @@
+"""
+Minimum-leg routes around the course, for bots, course-fairness checks and
+"legs to finish" standings.
+
+The search is A* over (position, heading, spinnaker, rounding progress) with
+the engine's own speed, maneuver and spinnaker rules. Other yachts and puffs
+are left out: the route is what a yacht sailing alone would need.
+
+Hull-based rounding cannot be tracked exactly without the whole track, so
+each unrounded mark keeps a bitmask of the eight directions (four axes, four
+quadrants) it has been seen from. A mark counts as rounded only when no
+half-plane through it could hold every visited direction, which means the
+engine's hull strictly encloses it too. The planner can therefore
+overestimate by a leg around a mark, but never plans a rounding the engine
+would not accept.
+"""
+
+import asyncio
+import heapq
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import count
+from typing import Literal
+
+from regatta.models.board import Board, Grid
+from regatta.models.position import Position, calculate_next_position, get_position
+from regatta.models.wind import Heading, WindDirection, detect_maneuver, get_speed
+from regatta.models.yacht import Yacht
+
+# The engine only starts checking for roundings once a track has this many
+# cells (see game_actions._round_marks).
+_MIN_ROUNDING_HISTORY = 8
+
+_HEADINGS = tuple(Heading)
+_ROUNDED = 0xFF
+
+
+@dataclass(frozen=True)
+class Course:
+    """The parts of a Board that matter for routing; hashable, so cacheable."""
+
+    width: int
+    height: int
+    course_marks: tuple[Position, ...]
+    starting_line: tuple[Position, Position]
+
+    @classmethod
+    def from_board(cls, board: Board) -> "Course":
+        return cls(
+            board.grid.width,
+            board.grid.height,
+            tuple(board.course_marks),
+            board.starting_line,
+        )
+
+    def to_board(self) -> Board:
+        return Board(
+            Grid(self.width, self.height), list(self.course_marks), self.starting_line
+        )
+
+
+@dataclass(frozen=True)
+class RouteStep:
+    action: Literal["move_leg", "raise_spinnaker", "lower_spinnaker"]
+    heading: Heading | None
+    # Where the yacht is after the step.
+    position: Position
+    legs: int
+
+
+@dataclass(frozen=True)
+class Route:
+    start: Position
+    legs: int
+    steps: tuple[RouteStep, ...]
+
+
+# (cell index, heading index, spinnaker, rounding masks, track length), with
+# one byte of the masks per course mark, set to _ROUNDED once it is rounded.
+type _State = tuple[int, int, bool, int, int]
+
+
+def _direction_class(mark: Position, cell: Position) -> int:
+    """One bit per direction class around the mark: the axis rays east,
+    north, west and south, then the open quadrants between them."""
+    dx, dy = cell.x - mark.x, mark.y - cell.y
+    if dy == 0:
+        return 1 << 0 if dx > 0 else 1 << 2
+    if dx == 0:
+        return 1 << 1 if dy > 0 else 1 << 3
+    if dx > 0:
+        return 1 << 4 if dy > 0 else 1 << 7
+    return 1 << 5 if dy > 0 else 1 << 6
+
+
+def _outside_closed_half_plane(bit: int, t: int) -> bool:
+    """True if every direction in the class lies outside [t, t + 180]."""
+    index = bit.bit_length() - 1
+    if index < 4:
+        return (index * 90 - t) % 360 > 180
+    offset = ((index - 4) * 90 - t) % 360
+    return offset >= 180 and offset + 90 <= 360
+
+
+def _encloses(mask: int) -> bool:
+    # Class boundaries are multiples of 90 degrees, so half-planes every 45
+    # degrees cover each boundary and each gap between them.
+    bits = [1 << i for i in range(8) if mask & (1 << i)]
+    return all(
+        any(_outside_closed_half_plane(bit, t) for bit in bits)
+        for t in range(0, 360, 45)
+    )
+
+
+_ENCLOSES = tuple(_encloses(mask) for mask in range(256))
+
+
+def _cell_bits(marks: tuple[Position, ...], cell: Position) -> int:
+    """Rounding-mask bits a cell contributes, packed like the state."""
+    return int.from_bytes(bytes(_direction_class(mark, cell) for mark in marks))
+
+
+def _start_state(
+    course: Course,
+    position: Position,
+    heading: Heading,
+    spinnaker: bool,
+    track: tuple[Position, ...],
+    marks_rounded: frozenset[Position],
+) -> _State:
+    width = course.width
+    masks = 0
+    for cell in set(track):
+        masks |= _cell_bits(course.course_marks, cell)
+    for i, mark in enumerate(reversed(course.course_marks)):
+        if mark in marks_rounded:
+            masks |= _ROUNDED << (8 * i)
+    return (
+        position.y * width + position.x,
+        _HEADINGS.index(heading),
+        spinnaker,
+        masks,
+        min(len(track), _MIN_ROUNDING_HISTORY),
+    )
+
+
+class _Planner:
+    def __init__(self, course: Course, wind: WindDirection) -> None:
+        self.course = course
+        self.wind = wind
+        board = course.to_board()
+        width = course.width
+        self.cells = [
+            get_position(i % width, i // width) for i in range(width * course.height)
+        ]
+        marks = course.course_marks
+        self.all_rounded = int.from_bytes(bytes([_ROUNDED] * len(marks)))
+
+        self.cell_bits = [_cell_bits(marks, cell) for cell in self.cells]
+        self.on_line = [board.is_on_starting_line(cell) for cell in self.cells]
+
+        # The cells each leg passes through, cut short at a course mark or the
+        # edge of the board (a leg that leaves the board cannot come back).
+        self.legs: dict[tuple[int, int, bool], tuple[tuple[int, ...], bool]] = {}
+        for index, cell in enumerate(self.cells):
+            for h, heading in enumerate(_HEADINGS):
+                for spinnaker in (False, True):
+                    path: list[int] = []
+                    blocked = False
+                    position = cell
+                    for _ in range(get_speed(wind, heading, spinnaker)):
+                        position = calculate_next_position(position, heading)
+                        if not board.is_in_bounds(position) or board.is_on_course_mark(
+                            position
+                        ):
+                            blocked = True
+                            break
+                        path.append(position.y * width + position.x)
+                    self.legs[index, h, spinnaker] = (tuple(path), blocked)
+
+        self.leg_costs = [
+            [2 if detect_maneuver(wind, old, new) else 1 for new in _HEADINGS]
+            for old in _HEADINGS
+        ]
+
+        # A* heuristic: no leg covers more cells than the fastest point of
+        # sail, and every leg left has to reach the line. Before that, each
+        # unrounded mark needs the track strictly on all four sides of it.
+        self.fastest = max(get_speed(wind, heading, True) for heading in Heading)
+        line = board.get_starting_line_positions()
+        self.to_line = [
+            min(max(abs(c.x - p.x), abs(c.y - p.y)) for p in line) for c in self.cells
+        ]
+        self.sides: list[tuple[int, int, list[int]]] = []
+        for i, mark in enumerate(reversed(marks)):
+            for bits, distance in (
+                (0b0011_0010, lambda c, m=mark: max(0, c.y - m.y + 1)),
+                (0b1100_1000, lambda c, m=mark: max(0, m.y + 1 - c.y)),
+                (0b1001_0001, lambda c, m=mark: max(0, m.x + 1 - c.x)),
+                (0b0110_0100, lambda c, m=mark: max(0, c.x - m.x + 1)),
+            ):
+                side_to_line = min(distance(p) for p in line)
+                detours = [distance(c) + side_to_line for c in self.cells]
+                self.sides.append((8 * i, bits, detours))
+        self.estimates: dict[tuple[int, int], int] = {}
+
+    def _estimate(self, cell: int, masks: int) -> int:
+        key = (cell, masks)
+        estimate = self.estimates.get(key)
+        if estimate is None:
+            cells_left = self.to_line[cell]
+            for shift, bits, detours in self.sides:
+                mask = (masks >> shift) & 0xFF
+                if mask != _ROUNDED and not mask & bits:
+                    cells_left = max(cells_left, detours[cell])
+            estimate = self.estimates[key] = -(-cells_left // self.fastest)
+        return estimate
+
+    def _round(self, masks: int) -> int:
+        rounded = 0
+        for shift in range(0, 8 * len(self.course.course_marks), 8):
+            mask = (masks >> shift) & 0xFF
+            rounded |= (_ROUNDED if _ENCLOSES[mask] else mask) << shift
+        return rounded
+
+    def _sail(self, state: _State, h: int) -> tuple[_State, bool] | None:
+        """Mirrors move_leg for a lone yacht: the state after the leg and
+        whether it won the race, or None if the leg is illegal."""
+        cell, _, spinnaker, masks, track_length = state
+        path, blocked = self.legs[cell, h, spinnaker]
+        if not path and not blocked:
+            return None  # head to wind
+
+        for cell in path:
+            masks |= self.cell_bits[cell]
+            track_length = min(track_length + 1, _MIN_ROUNDING_HISTORY)
+            if track_length == _MIN_ROUNDING_HISTORY and masks != self.all_rounded:
+                masks = self._round(masks)
+            if masks == self.all_rounded and self.on_line[cell]:
+                return (cell, h, spinnaker, masks, track_length), True
+
+        if blocked:
+            return None
+        return (cell, h, spinnaker, masks, track_length), False
+
+    def _steps(self, state: _State) -> Iterator[tuple[_State, int, bool]]:
+        cell, h, spinnaker, masks, track_length = state
+        for new_h, leg_cost in enumerate(self.leg_costs[h]):
+            sailed = self._sail(state, new_h)
+            if sailed is None:
+                continue
+            next_state, finished = sailed
+            # move_leg charges a winning leg as one, maneuver or not.
+            yield next_state, 1 if finished else leg_cost, finished
+
+        # Raising the spinnaker is free; lowering it costs a leg.
+        toggled = (cell, h, not spinnaker, masks, track_length)
+        yield toggled, int(spinnaker), False
+
+    def _step(self, state: _State, next_state: _State, legs: int) -> RouteStep:
+        position = self.cells[next_state[0]]
+        if state[2] != next_state[2]:
+            action = "raise_spinnaker" if next_state[2] else "lower_spinnaker"
+            return RouteStep(action, None, position, legs)
+        return RouteStep("move_leg", _HEADINGS[next_state[1]], position, legs)
+
+    def plan(
+        self, starts: tuple[_State, ...]
+    ) -> tuple[Route, tuple[_State, ...]] | None:
+        """The best route from any of starts, with the state before each of
+        its steps."""
+        tie = count()
+        best = dict.fromkeys(starts, 0)
+        came_from: dict[_State, _State] = {}
+        finish: tuple[int, _State, _State] | None = None
+        heap = [(self._estimate(s[0], s[3]), next(tie), s) for s in starts]
+        heapq.heapify(heap)
+
+        while heap:
+            estimate, _, state = heapq.heappop(heap)
+            if finish is not None and finish[0] <= estimate:
+                break
+            legs = best[state]
+            if estimate > legs + self._estimate(state[0], state[3]):
+                continue  # already reached more cheaply
+
+            for next_state, leg_cost, finished in self._steps(state):
+                new_legs = legs + leg_cost
+                if finished:
+                    if finish is None or new_legs < finish[0]:
+                        finish = (new_legs, state, next_state)
+                elif new_legs < best.get(next_state, new_legs + 1):
+                    best[next_state] = new_legs
+                    came_from[next_state] = state
+                    estimate = new_legs + self._estimate(next_state[0], next_state[3])
+                    heapq.heappush(heap, (estimate, next(tie), next_state))
+
+        if finish is None:
+            return None
+
+        legs, state, goal = finish
+        steps = [self._step(state, goal, legs - best[state])]
+        states = [state]
+        while state in came_from:
+            previous = came_from[state]
+            steps.append(self._step(previous, state, best[state] - best[previous]))
+            state = previous
+            states.append(state)
+        steps.reverse()
+        states.reverse()
+        route = Route(start=self.cells[state[0]], legs=legs, steps=tuple(steps))
+        return route, tuple(states)
+
+
+@lru_cache(maxsize=64)
+def _planner(course: Course, wind: WindDirection) -> _Planner:
+    return _Planner(course, wind)
+
+
+type _SearchResult = tuple[Route, tuple[_State, ...]] | None
+
+
+def _search(
+    course: Course, wind: WindDirection, starts: tuple[_State, ...]
+) -> _SearchResult:
+    return _planner(course, wind).plan(starts)
+
+
+def _starts(
+    course: Course, wind: WindDirection, yacht: Yacht | None
+) -> tuple[_State, ...]:
+    # Built without a _Planner, so callers that search on an executor never
+    # pay for one in this process.
+    if yacht is not None:
+        track = tuple(yacht.position_history) or (yacht.position,)
+        return (
+            _start_state(
+                course,
+                yacht.position,
+                yacht.heading,
+                yacht.spinnaker,
+                track,
+                yacht.marks_rounded,
+            ),
+        )
+
+    # A fresh yacht on any starting-line cell, as choose_starting_position
+    # places it.
+    return tuple(
+        _start_state(course, cell, wind.opposite(), False, (cell,), frozenset())
+        for cell in course.to_board().get_starting_line_positions()
+    )
+
+
+_ROUTE_CACHE_SIZE = 16384
+_routes: OrderedDict[tuple, Route | None] = OrderedDict()
+
+
+def _cached_route(key: tuple) -> Route | None | Literal[False]:
+    if key not in _routes:
+        return False
+    _routes.move_to_end(key)
+    return _routes[key]
+
+
+def _remember(key: tuple, result: _SearchResult) -> Route | None:
+    """
+    Caches the route found for key, and the rest of it for every state along
+    the way: the tail of a minimum-leg route is a minimum-leg route too, so a
+    yacht that keeps to it is looked up rather than searched again.
+    """
+    course, wind, _ = key
+    if result is None:
+        _store(key, None)
+        return None
+
+    route, states = result
+    legs = route.legs
+    for i in range(1, len(states)):
+        legs -= route.steps[i - 1].legs
+        rest = Route(route.steps[i - 1].position, legs, route.steps[i:])
+        _store((course, wind, (states[i],)), rest)
+    _store(key, route)
+    return route
+
+
+def _store(key: tuple, route: Route | None) -> None:
+    _routes[key] = route
+    _routes.move_to_end(key)
+    if len(_routes) > _ROUTE_CACHE_SIZE:
+        _routes.popitem(last=False)
+
+
+def plan_route(
+    board: Board | Course, wind: WindDirection, yacht: Yacht | None = None
+) -> Route | None:
+    """
+    The fewest legs from `yacht` (or from the best starting-line cell, if
+    None) to a finish, or None if the course cannot be completed.
+
+    Routes are cached per course, wind and starting state, so games sharing a
+    course reuse them, along with the rest of each route from every state on
+    it. Any other state, e.g. after a puff or a leg off the planned route,
+    needs a search of its own.
+    """
+    course = board if isinstance(board, Course) else Course.from_board(board)
+    key = (course, wind, _starts(course, wind, yacht))
+    route = _cached_route(key)
+    if route is False:
+        route = _remember(key, _search(*key))
+    return route
+
+
+async def plan_route_async(
+    executor: Executor,
+    board: Board | Course,
+    wind: WindDirection,
+    yacht: Yacht | None = None,
+) -> Route | None:
+    """plan_route with the search run on `executor`, e.g. a
+    ProcessPoolExecutor, so a cold cache does not block the event loop."""
+    course = board if isinstance(board, Course) else Course.from_board(board)
+    key = (course, wind, _starts(course, wind, yacht))
+    route = _cached_route(key)
+    if route is False:
+        loop = asyncio.get_running_loop()
+        route = _remember(key, await loop.run_in_executor(executor, _search, *key))
+    return route
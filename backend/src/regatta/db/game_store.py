@@ -0,0 +1,229 @@
+"""
+Game persistence on SQLAlchemy Core.
+
+Statements select and write columns directly rather than loading GameRow
+entities, so the session adds no identity-map or flush work; it only
+provides the transaction.
+"""
+
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import cast
+
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Row,
+    Text,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from regatta.core.action_log import replay
+from regatta.db.models import GameActionRow, GameRow
+from regatta.models.game import Game
+from regatta.serialization.game_serializer import deserialize_game
+from regatta.ws.game_patches import diff_game
+
+# Past this many trailing run values to drop, rewriting the runs array is
+# cheaper than chaining `- -1` removals.
+_MAX_RUNS_TRIM = 8
+
+
+@dataclass(frozen=True)
+class StoredGame:
+    game: Game
+    version: int
+    snapshot: dict
+
+
+async def load_game(db: AsyncSession, game_id: uuid.UUID) -> StoredGame | None:
+    """Rebuilds the current game from its latest snapshot and the actions since."""
+    result = await db.execute(
+        select(GameRow.state, GameRow.version, GameRow.snapshot_version).where(
+            GameRow.id == game_id
+        )
+    )
+    game_row = result.one_or_none()
+    if not game_row:
+        return None
+
+    game = deserialize_game(game_row.state)
+    if game_row.snapshot_version < game_row.version:
+        actions = await db.scalars(
+            select(GameActionRow.action)
+            .where(
+                GameActionRow.game_id == game_id,
+                GameActionRow.sequence > game_row.snapshot_version,
+            )
+            .order_by(GameActionRow.sequence)
+        )
+        game = replay(game, actions)
+
+    return StoredGame(game, game_row.version, game_row.state)
+
+
+async def insert_game(db: AsyncSession, game_id: uuid.UUID, state: dict) -> None:
+    await db.execute(
+        insert(GameRow).values(id=game_id, state=state, **_listing_columns(state))
+    )
+
+
+def _listing_columns(state: dict) -> dict:
+    return {"phase": state["phase"], "player_count": len(state["players"])}
+
+
+async def list_games(
+    db: AsyncSession,
+    *,
+    limit: int,
+    phase: str | None = None,
+    player_count: int | None = None,
+    created_after: datetime | None = None,
+    created_before: datetime | None = None,
+    after: tuple[datetime, uuid.UUID] | None = None,
+) -> Sequence[Row]:
+    """
+    Newest games first. after is the (created_at, id) of the last game on the
+    previous page; seeking past it keeps every page an index range scan.
+    """
+    query = select(
+        GameRow.id,
+        GameRow.phase,
+        GameRow.player_count,
+        GameRow.created_at,
+        GameRow.updated_at,
+    )
+    if phase is not None:
+        query = query.where(GameRow.phase == phase)
+    if player_count is not None:
+        query = query.where(GameRow.player_count == player_count)
+    if created_after is not None:
+        query = query.where(GameRow.created_at > created_after)
+    if created_before is not None:
+        query = query.where(GameRow.created_at < created_before)
+    if after is not None:
+        query = query.where(tuple_(GameRow.created_at, GameRow.id) < after)
+
+    result = await db.execute(
+        query.order_by(GameRow.created_at.desc(), GameRow.id.desc()).limit(limit)
+    )
+    return result.all()
+
+
+def _jsonb(value: object) -> ColumnElement:
+    return literal(value, JSONB)
+
+
+def _path(*keys: str) -> ColumnElement:
+    return literal(list(keys), ARRAY(Text))
+
+
+def _jsonb_set(target: ColumnElement, path: ColumnElement, value: ColumnElement):
+    return func.jsonb_set(target, path, value, type_=JSONB)
+
+
+def state_update(old: dict, new: dict) -> ColumnElement:
+    """
+    SQL expression turning the stored document old into new. Only changed
+    top-level fields, changed yacht fields and the tail of each yacht's track
+    runs are sent, so its size does not grow with fleet size or race length.
+    """
+    changes = diff_game(old, new)
+    yachts = changes.pop("yachts", {})
+
+    state: ColumnElement = GameRow.__table__.c.state
+    if changes:
+        state = state.op("||", return_type=JSONB)(_jsonb(changes))
+
+    for player_id, yacht_changes in yachts.items():
+        if player_id not in old["yachts"]:
+            state = _jsonb_set(state, _path("yachts", player_id), _jsonb(yacht_changes))
+            continue
+
+        track_patch = yacht_changes.pop("track", None)
+        for field, value in yacht_changes.items():
+            state = _jsonb_set(state, _path("yachts", player_id, field), _jsonb(value))
+        if track_patch:
+            runs_path = _path("yachts", player_id, "position_history", "runs")
+            state = _jsonb_set(
+                state,
+                runs_path,
+                _append_runs(
+                    runs_path,
+                    old["yachts"][player_id]["position_history"]["runs"],
+                    track_patch,
+                ),
+            )
+
+    return state
+
+
+def _append_runs(
+    runs_path: ColumnElement, old_runs: list[int], track_patch: dict
+) -> ColumnElement:
+    trim = len(old_runs) - track_patch["from"]
+    if trim > _MAX_RUNS_TRIM:
+        return _jsonb(old_runs[: track_patch["from"]] + track_patch["runs"])
+
+    # Reads the runs from the stored column, not the partially updated
+    # expression, so bound values are not repeated.
+    runs: ColumnElement = GameRow.state.op("#>", return_type=JSONB)(runs_path)
+    for _ in range(trim):
+        runs = runs.op("-", return_type=JSONB)(literal(-1, Integer))
+    return runs.op("||", return_type=JSONB)(_jsonb(track_patch["runs"]))
+
+
+async def append_action(
+    db: AsyncSession,
+    game_id: uuid.UUID,
+    expected_version: int,
+    action: dict,
+    state: dict,
+    snapshot: dict,
+    snapshot_interval: int,
+) -> dict | None:
+    """
+    Logs action as the next version of the game, provided the row is still at
+    expected_version. Every snapshot_interval versions the stored document
+    (snapshot) is also brought up to state with a partial update; otherwise a
+    write is a version bump plus one small insert.
+
+    Returns the document games.state now holds, or None when another writer
+    got there first. The caller commits.
+    """
+    version = expected_version + 1
+    values: dict = {"version": version, **_listing_columns(state)}
+    if version % snapshot_interval == 0:
+        values |= {"state": state_update(snapshot, state), "snapshot_version": version}
+        snapshot = state
+
+    # Bump the version and log the action in one round trip. The insert
+    # selects from the update, so it writes nothing when the version check
+    # fails.
+    bumped = (
+        update(GameRow)
+        .where(GameRow.id == game_id, GameRow.version == expected_version)
+        .values(**values)
+        .returning(GameRow.id)
+        .cte("bumped")
+    )
+    result = await db.execute(
+        insert(GameActionRow).from_select(
+            ["game_id", "sequence", "action"],
+            select(bumped.c.id, literal(version), _jsonb(action)),
+        )
+    )
+    if cast(CursorResult, result).rowcount == 0:
+        return None
+
+    return snapshot
@@ -0,0 +1,91 @@
+import time
+
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+
+class DatabaseMetrics:
+    """
+    Pool and query timings for one engine: how long requests wait to check out
+    a connection, how many are in use, and how long statements take. Separates
+    pool starvation from slow queries when sizing the pool per worker.
+    """
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.checkout_wait_seconds = 0.0
+        self.max_checkout_wait_seconds = 0.0
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.max_query_seconds = 0.0
+        self._pool: Pool | None = None
+
+    def attach(self, engine: Engine) -> None:
+        self._pool = engine.pool
+        event.listen(engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+
+    def record_checkout_wait(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.checkout_wait_seconds += seconds
+        self.max_checkout_wait_seconds = max(self.max_checkout_wait_seconds, seconds)
+
+    def record_query(self, seconds: float) -> None:
+        self.queries += 1
+        self.query_seconds += seconds
+        self.max_query_seconds = max(self.max_query_seconds, seconds)
+
+    # The start time lives on the statement's execution context, so a
+    # statement that raises (and never reaches after_cursor_execute) leaves
+    # nothing behind to be paired with the next one.
+    def _before_execute(self, _conn, _cursor, _statement, _params, context, _many):
+        context._metrics_started_at = time.perf_counter()
+
+    def _after_execute(self, _conn, _cursor, _statement, _params, context, _many):
+        self.record_query(time.perf_counter() - context._metrics_started_at)
+
+    def stats(self) -> dict:
+        stats = {
+            "checkouts": self.checkouts,
+            "mean_checkout_wait_ms": _mean_ms(
+                self.checkout_wait_seconds, self.checkouts
+            ),
+            "max_checkout_wait_ms": self.max_checkout_wait_seconds * 1e3,
+            "queries": self.queries,
+            "mean_query_ms": _mean_ms(self.query_seconds, self.queries),
+            "max_query_ms": self.max_query_seconds * 1e3,
+        }
+
+        pool = self._pool
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            # A max_overflow of -1 means no limit: the pool cannot saturate.
+            saturation = None
+            if pool._max_overflow >= 0:
+                capacity = pool.size() + pool._max_overflow
+                saturation = pool.checkedout() / capacity if capacity else 0.0
+            stats |= {
+                "pool_size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "in_use": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "saturation": saturation,
+            }
+        return stats
+
+
+def _mean_ms(total_seconds: float, count: int) -> float:
+    return total_seconds / count * 1e3 if count else 0.0
+
+
+db_metrics = DatabaseMetrics()
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Records how long each checkout waited for a free connection."""
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_metrics.record_checkout_wait(time.perf_counter() - started_at)
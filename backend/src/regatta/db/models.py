@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -12,14 +12,52 @@ class Base(DeclarativeBase):
 
 class GameRow(Base):
     __tablename__ = "games"
+    __table_args__ = (
+        # Keyset pagination for GET /games, with and without a phase filter.
+        Index("ix_games_phase_created_at", "phase", "created_at", "id"),
+        Index("ix_games_created_at", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     state: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    # Bumped on every write; updates compare-and-swap on it.
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
+    # Version that `state` was written at. Actions logged after it are
+    # replayed on top to rebuild the current game.
+    snapshot_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
+    # Copied from the current game on every write, since `state` can lag
+    # behind it by up to a snapshot interval.
+    phase: Mapped[str] = mapped_column(
+        String(16), nullable=False, server_default="LOBBY"
+    )
+    player_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+
+
+class GameActionRow(Base):
+    __tablename__ = "game_actions"
+
+    game_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("games.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # The game version this action produced.
+    sequence: Mapped[int] = mapped_column(Integer, primary_key=True)
+    action: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
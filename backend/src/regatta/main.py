@@ -1,5 +1,6 @@
 """FastAPI application entry point."""
 
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
 import os
 
@@ -9,11 +10,24 @@ from fastapi.middleware.cors import CORSMiddleware
 from regatta.api.auth import router as auth_router
 from regatta.api.routes.games import router
 from regatta.api.routes.ws import router as ws_router
+from regatta.cache.game_cache import game_cache
+from regatta.cache.token_cache import token_cache
+from regatta.config import settings
+from regatta.db.metrics import db_metrics
+from regatta.ws.broadcast_dispatcher import broadcast_dispatcher
+from regatta.ws.connection_manager import connection_manager
 
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI):
+async def lifespan(fastapi_app: FastAPI):
+    # Route planning and reachable-cell searches are CPU-bound; workers start
+    # on first use and keep their own per-course planner caches.
+    planner_pool = ProcessPoolExecutor(max_workers=settings.route_planner_workers)
+    fastapi_app.state.planner_pool = planner_pool
+    await broadcast_dispatcher.start()
     yield  # startup code before, shutdown code after
+    await broadcast_dispatcher.stop(timeout=settings.shutdown_drain_timeout_seconds)
+    planner_pool.shutdown(cancel_futures=True)
 
 
 origins = os.getenv("ALLOWED_ORIGINS", "http://localhost:5173").split(",")
@@ -35,3 +49,13 @@ app.include_router(auth_router)
 @app.get("/health")
 async def health_check():
     return {"status": "ok"}
+
+
+@app.get("/metrics")
+async def metrics():
+    return {
+        "game_cache": game_cache.stats(),
+        "websockets": connection_manager.stats(),
+        "database": db_metrics.stats(),
+        "tokens": token_cache.stats(),
+    }
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 
-from regatta.models.position import Position
+from regatta.models.position import Position, get_position
 
 
 def _sign(n: int) -> int:
@@ -20,6 +21,41 @@ class Grid:
         return 0 <= position.x < self.width and 0 <= position.y < self.height
 
 
+def _line_positions(point_a: Position, point_b: Position) -> list[Position]:
+    dx = point_b.x - point_a.x
+    dy = point_b.y - point_a.y
+
+    step_x = _sign(dx)
+    step_y = _sign(dy)
+
+    current = point_a
+    positions = [current]
+
+    while current != point_b:
+        current = get_position(current.x + step_x, current.y + step_y)
+        positions.append(current)
+
+    return positions
+
+
+@dataclass(frozen=True)
+class CourseIndex:
+    """Precompiled lookup sets for a course, shared by every board using it."""
+
+    course_marks: frozenset[Position]
+    starting_line: frozenset[Position]
+
+
+@lru_cache(maxsize=1024)
+def _compile_course(
+    course_marks: tuple[Position, ...], starting_line: tuple[Position, Position]
+) -> CourseIndex:
+    return CourseIndex(
+        course_marks=frozenset(course_marks),
+        starting_line=frozenset(_line_positions(*starting_line)),
+    )
+
+
 @dataclass
 class Board:
     grid: Grid
@@ -29,27 +65,15 @@ class Board:
     def is_in_bounds(self, position: Position) -> bool:
         return self.grid.is_in_bounds(position)
 
+    @cached_property
+    def course(self) -> CourseIndex:
+        return _compile_course(tuple(self.course_marks), self.starting_line)
+
     def is_on_course_mark(self, position: Position) -> bool:
-        return position in self.course_marks
+        return position in self.course.course_marks
 
     def get_starting_line_positions(self) -> list[Position]:
-        point_a, point_b = self.starting_line
-
-        dx = point_b.x - point_a.x
-        dy = point_b.y - point_a.y
-
-        step_x = _sign(dx)
-        step_y = _sign(dy)
-
-        current = point_a
-        positions = [current]
-
-        while current != point_b:
-            current = Position(current.x + step_x, current.y + step_y)
-            positions.append(current)
-
-        return positions
+        return _line_positions(*self.starting_line)
 
     def is_on_starting_line(self, position: Position) -> bool:
-        return position in self.get_starting_line_positions()
-
+        return position in self.course.starting_line
@@ -1,14 +1,21 @@
 from dataclasses import dataclass
+from functools import lru_cache
 
 from regatta.models.wind import Heading
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Position:
     x: int
     y: int
 
 
+@lru_cache(maxsize=65536)
+def get_position(x: int, y: int) -> Position:
+    """Interned Position for a cell, so hot paths reuse one instance per cell."""
+    return Position(x, y)
+
+
 _DIRECTION_DELTAS = {
     Heading.NORTH: (0, -1),
     Heading.NORTH_EAST: (1, -1),
@@ -24,7 +31,7 @@ _DIRECTION_DELTAS = {
 def calculate_next_position(current_position: Position, heading: Heading) -> Position:
     dx, dy = _DIRECTION_DELTAS[heading]
 
-    return Position(
+    return get_position(
         current_position.x + dx,
         current_position.y + dy,
     )
@@ -0,0 +1,100 @@
+from array import array
+from collections.abc import Iterable, Iterator
+from itertools import islice
+
+from regatta.models.position import Position, get_position
+
+
+class Track:
+    """
+    Immutable, append-efficient sequence of positions (a yacht's wake).
+    Coordinates are packed as x/y pairs in an array('h') shared between
+    snapshots. Appending to the newest snapshot extends the shared buffer in
+    place; older snapshots keep their own length and never see later points.
+    Appending to an older snapshot copies its prefix first.
+    """
+
+    __slots__ = ("_buffer", "_length")
+
+    _buffer: array
+    _length: int
+
+    def __init__(self, positions: Iterable[Position] = ()) -> None:
+        buffer = array("h")
+        for position in positions:
+            buffer.append(position.x)
+            buffer.append(position.y)
+        self._buffer = buffer
+        self._length = len(buffer)
+
+    @classmethod
+    def from_coordinates(cls, coordinates: Iterable[tuple[int, int]]) -> "Track":
+        buffer = array("h")
+        for x, y in coordinates:
+            buffer.append(x)
+            buffer.append(y)
+        return cls._share(buffer, len(buffer))
+
+    @classmethod
+    def from_packed(cls, values: Iterable[int]) -> "Track":
+        """Builds a track from flat [x0, y0, x1, y1, ...] coordinates."""
+        buffer = array("h", values)
+        if len(buffer) % 2:
+            raise ValueError("Packed coordinates must come in x/y pairs")
+        return cls._share(buffer, len(buffer))
+
+    @classmethod
+    def _share(cls, buffer: array, length: int) -> "Track":
+        track = cls.__new__(cls)
+        track._buffer = buffer
+        track._length = length
+        return track
+
+    def append(self, position: Position) -> "Track":
+        buffer = self._buffer
+        if len(buffer) != self._length:
+            buffer = buffer[: self._length]
+        buffer.append(position.x)
+        buffer.append(position.y)
+        return Track._share(buffer, len(buffer))
+
+    def packed(self) -> array:
+        """Copy of the flat [x0, y0, x1, y1, ...] coordinate buffer."""
+        return self._buffer[: self._length]
+
+    def coordinates(self) -> Iterator[tuple[int, int]]:
+        """Yields (x, y) pairs straight from the packed buffer."""
+        return zip(
+            islice(self._buffer, 0, self._length, 2),
+            islice(self._buffer, 1, self._length, 2),
+            strict=True,
+        )
+
+    def __len__(self) -> int:
+        return self._length // 2
+
+    def __getitem__(self, index: int) -> Position:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Track index out of range")
+        return get_position(self._buffer[2 * index], self._buffer[2 * index + 1])
+
+    def __iter__(self) -> Iterator[Position]:
+        for x, y in self.coordinates():
+            yield get_position(x, y)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Track):
+            return NotImplemented
+        return (
+            self._length == other._length
+            and self._buffer[: self._length] == other._buffer[: other._length]
+        )
+
+    def __hash__(self) -> int:
+        return hash(self._buffer[: self._length].tobytes())
+
+    def __repr__(self) -> str:
+        return f"Track({list(self)!r})"
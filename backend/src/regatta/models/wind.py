@@ -18,6 +18,9 @@ class WindDirection(Enum):
 
 Heading = WindDirection
 
+Tack = Literal["starboard", "port"] | None
+Maneuver = Literal["tack", "jibe"] | None
+
 
 class PointOfSail(Enum):
     LUFFING = 0
@@ -49,16 +52,14 @@ _ANGLE_TO_POINT_OF_SAIL = {
 }
 
 
-def get_point_of_sail(wind: WindDirection, heading: Heading) -> PointOfSail:
+def _compute_point_of_sail(wind: WindDirection, heading: Heading) -> PointOfSail:
     diff: int = abs(wind.value - heading.value)
     angle: int = min(diff, 360 - diff)
 
     return _ANGLE_TO_POINT_OF_SAIL[angle]
 
 
-def get_tack(
-    wind: WindDirection, heading: Heading
-) -> Literal["starboard", "port"] | None:
+def _compute_tack(wind: WindDirection, heading: Heading) -> Tack:
     diff = (wind.value - heading.value) % 360
 
     if diff == 0 or diff == 180:
@@ -66,14 +67,14 @@ def get_tack(
     return "starboard" if diff < 180 else "port"
 
 
-def detect_maneuver(
+def _compute_maneuver(
     wind: WindDirection, old_heading: Heading, new_heading: Heading
-) -> Literal["tack", "jibe"] | None:
+) -> Maneuver:
     if old_heading == new_heading:
         return None
 
-    old_tack = get_tack(wind, old_heading)
-    new_tack = get_tack(wind, new_heading)
+    old_tack = _compute_tack(wind, old_heading)
+    new_tack = _compute_tack(wind, new_heading)
 
     if old_tack is None or new_tack is None or old_tack == new_tack:
         return None
@@ -95,3 +96,64 @@ def detect_maneuver(
             if counter_clockwise_to_upwind <= counter_clockwise_distance
             else "jibe"
         )
+
+
+def _compute_speed(wind: WindDirection, heading: Heading, spinnaker: bool) -> int:
+    point_of_sail = _compute_point_of_sail(wind, heading)
+    if spinnaker and point_of_sail in (
+        PointOfSail.RUNNING,
+        PointOfSail.BROAD_REACHING,
+    ):
+        return point_of_sail.speed + 1
+    return point_of_sail.speed
+
+
+# Dense lookup tables, built once at import time. There are only 8 winds and 8
+# headings, so every rule above collapses to a single index on the hot path.
+# Directions are indexed by their compass angle divided by 45.
+
+_POINT_OF_SAIL_TABLE: tuple[tuple[PointOfSail, ...], ...] = tuple(
+    tuple(_compute_point_of_sail(wind, heading) for heading in Heading)
+    for wind in WindDirection
+)
+
+_TACK_TABLE: tuple[tuple[Tack, ...], ...] = tuple(
+    tuple(_compute_tack(wind, heading) for heading in Heading) for wind in WindDirection
+)
+
+_MANEUVER_TABLE: tuple[tuple[tuple[Maneuver, ...], ...], ...] = tuple(
+    tuple(
+        tuple(_compute_maneuver(wind, old, new) for new in Heading) for old in Heading
+    )
+    for wind in WindDirection
+)
+
+# Indexed by [spinnaker][wind][heading].
+_SPEED_TABLE: tuple[tuple[tuple[int, ...], ...], ...] = tuple(
+    tuple(
+        tuple(_compute_speed(wind, heading, spinnaker) for heading in Heading)
+        for wind in WindDirection
+    )
+    for spinnaker in (False, True)
+)
+
+
+def get_point_of_sail(wind: WindDirection, heading: Heading) -> PointOfSail:
+    return _POINT_OF_SAIL_TABLE[wind._value_ // 45][heading._value_ // 45]
+
+
+def get_tack(wind: WindDirection, heading: Heading) -> Tack:
+    return _TACK_TABLE[wind._value_ // 45][heading._value_ // 45]
+
+
+def detect_maneuver(
+    wind: WindDirection, old_heading: Heading, new_heading: Heading
+) -> Maneuver:
+    return _MANEUVER_TABLE[wind._value_ // 45][old_heading._value_ // 45][
+        new_heading._value_ // 45
+    ]
+
+
+def get_speed(wind: WindDirection, heading: Heading, spinnaker: bool) -> int:
+    """Spaces moved per leg, including the spinnaker bonus off the wind."""
+    return _SPEED_TABLE[spinnaker][wind._value_ // 45][heading._value_ // 45]
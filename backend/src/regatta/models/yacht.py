@@ -1,76 +1,46 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
 from regatta.models.position import Position
+from regatta.models.track import Track
 from regatta.models.wind import Heading
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Yacht:
     position: Position
     heading: Heading
     spinnaker: bool = False
     puff_count: int = 2
     marks_rounded: frozenset[Position] = field(default_factory=frozenset)
-    position_history: tuple[Position, ...] = field(default_factory=tuple)
+    position_history: Track = field(default_factory=Track)
+    # Convex hull of position_history, maintained incrementally by the engine.
+    # None means not yet computed (e.g. freshly deserialized).
+    track_hull: tuple[Position, ...] | None = field(
+        default=None, compare=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.position_history, Track):
+            object.__setattr__(self, "position_history", Track(self.position_history))
 
     def with_position(self, new_position: Position) -> "Yacht":
-        return Yacht(
-            new_position,
-            self.heading,
-            self.spinnaker,
-            self.puff_count,
-            self.marks_rounded,
-            self.position_history,
-        )
+        return replace(self, position=new_position)
 
     def with_heading(self, new_heading: Heading) -> "Yacht":
-        return Yacht(
-            self.position,
-            new_heading,
-            self.spinnaker,
-            self.puff_count,
-            self.marks_rounded,
-            self.position_history,
-        )
+        return replace(self, heading=new_heading)
 
     def with_spinnaker(self, new_spinnaker_position: bool) -> "Yacht":
-        return Yacht(
-            self.position,
-            self.heading,
-            new_spinnaker_position,
-            self.puff_count,
-            self.marks_rounded,
-            self.position_history,
-        )
+        return replace(self, spinnaker=new_spinnaker_position)
 
     def with_puff_count(self, new_puff_count: int) -> "Yacht":
-        return Yacht(
-            self.position,
-            self.heading,
-            self.spinnaker,
-            new_puff_count,
-            self.marks_rounded,
-            self.position_history,
-        )
+        return replace(self, puff_count=new_puff_count)
 
     def with_marks_rounded(self, new_marks: frozenset[Position]) -> "Yacht":
-        return Yacht(
-            self.position,
-            self.heading,
-            self.spinnaker,
-            self.puff_count,
-            marks_rounded=new_marks,
-            position_history=self.position_history,
-        )
+        return replace(self, marks_rounded=new_marks)
 
     def with_position_history(
-        self, new_history: tuple[Position, ...]
+        self,
+        new_history: Track,
+        new_hull: tuple[Position, ...] | None = None,
     ) -> "Yacht":
-        return Yacht(
-            self.position,
-            self.heading,
-            self.spinnaker,
-            self.puff_count,
-            marks_rounded=self.marks_rounded,
-            position_history=new_history,
-        )
+        return replace(self, position_history=new_history, track_hull=new_hull)
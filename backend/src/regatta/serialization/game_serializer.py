@@ -1,6 +1,7 @@
 from regatta.models.board import Board, Grid
 from regatta.models.game import Game, GamePhase
-from regatta.models.position import Position
+from regatta.models.position import Position, get_position
+from regatta.models.track import Track
 from regatta.models.wind import WindDirection
 from regatta.models.yacht import Yacht
 
@@ -10,7 +11,58 @@ def _serialize_position(position: Position) -> dict:
 
 
 def _deserialize_position(d: dict) -> Position:
-    return Position(x=d["x"], y=d["y"])
+    return get_position(d["x"], d["y"])
+
+
+# Compact track encoding: {"version": 1, "runs": [x0, y0, dx, dy, n, ...]}.
+# The first point is absolute; each (dx, dy, n) triple repeats one step n times.
+# Boats sail in straight lines, so a whole leg usually collapses to one triple.
+_TRACK_FORMAT_VERSION = 1
+
+
+def _serialize_track(track: Track) -> dict:
+    values = track.packed()
+    runs: list[int] = list(values[:2])
+
+    run_dx = run_dy = run_length = 0
+    for i in range(2, len(values), 2):
+        dx = values[i] - values[i - 2]
+        dy = values[i + 1] - values[i - 1]
+        if run_length and dx == run_dx and dy == run_dy:
+            run_length += 1
+        else:
+            if run_length:
+                runs += (run_dx, run_dy, run_length)
+            run_dx, run_dy, run_length = dx, dy, 1
+    if run_length:
+        runs += (run_dx, run_dy, run_length)
+
+    return {"version": _TRACK_FORMAT_VERSION, "runs": runs}
+
+
+def _decode_runs(runs: list[int]) -> list[int]:
+    if not runs:
+        return []
+
+    x, y = runs[0], runs[1]
+    values = [x, y]
+    for i in range(2, len(runs), 3):
+        dx, dy, count = runs[i], runs[i + 1], runs[i + 2]
+        for _ in range(count):
+            x += dx
+            y += dy
+            values += (x, y)
+    return values
+
+
+def _deserialize_track(d: dict | list) -> Track:
+    if isinstance(d, list):
+        # Legacy format: one {"x", "y"} object per point.
+        return Track.from_coordinates((p["x"], p["y"]) for p in d)
+
+    if d["version"] != _TRACK_FORMAT_VERSION:
+        raise ValueError(f"Unsupported track format version {d['version']}")
+    return Track.from_packed(_decode_runs(d["runs"]))
 
 
 def _serialize_yacht(yacht: Yacht) -> dict:
@@ -25,7 +77,7 @@ def _serialize_yacht(yacht: Yacht) -> dict:
         "spinnaker": yacht.spinnaker,
         "puff_count": yacht.puff_count,
         "marks_rounded": marks_rounded,
-        "position_history": [_serialize_position(p) for p in yacht.position_history],
+        "position_history": _serialize_track(yacht.position_history),
     }
 
 
@@ -38,9 +90,7 @@ def _deserialize_yacht(d: dict) -> Yacht:
         marks_rounded=frozenset(
             [_deserialize_position(position) for position in d["marks_rounded"]]
         ),
-        position_history=tuple(
-            _deserialize_position(p) for p in d.get("position_history", [])
-        ),
+        position_history=_deserialize_track(d.get("position_history", [])),
     )
 
 
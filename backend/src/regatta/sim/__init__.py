@@ -0,0 +1 @@
+"""Headless race simulation for load-testing the rules and tuning courses."""
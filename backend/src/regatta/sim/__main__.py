@@ -0,0 +1,48 @@
+"""Plays many headless races and prints aggregate statistics.
+
+Run with: PYTHONPATH=src python -m regatta.sim --races 1000 --players 4
+"""
+
+import argparse
+import json
+import time
+
+from regatta.sim.policies import POLICIES
+from regatta.sim.simulator import run_simulation
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m regatta.sim")
+    parser.add_argument("--races", type=int, default=1_000)
+    parser.add_argument("--players", type=int, default=2, choices=range(2, 7))
+    parser.add_argument(
+        "--policy",
+        action="append",
+        choices=sorted(POLICIES),
+        help="Policy for each seat in turn; repeat for a mixed field.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-turns", type=int, default=1_000)
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Processes (default: all cores)."
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    stats = run_simulation(
+        args.races,
+        seed=args.seed,
+        players=args.players,
+        policies=args.policy or ["greedy"],
+        max_turns=args.max_turns,
+        workers=args.workers,
+    )
+    elapsed = time.perf_counter() - started
+
+    summary = stats.summary()
+    summary["races_per_second"] = args.races / elapsed
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
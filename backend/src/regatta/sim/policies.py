@@ -0,0 +1,140 @@
+"""
+Player policies for simulated races. A policy picks a starting cell during
+setup and one action at a time while racing, as an action-log dict for
+core.action_log.apply_action (without the seed, which the simulator adds).
+"""
+
+import random
+from typing import Protocol
+
+from regatta.core.legal_moves import MoveOption, list_legal_actions
+from regatta.models.game import Game
+from regatta.models.position import Position
+
+
+class Policy(Protocol):
+    def choose_start(
+        self, game: Game, player_id: str, rng: random.Random
+    ) -> Position: ...
+
+    def choose_action(
+        self, game: Game, player_id: str, rng: random.Random
+    ) -> dict | None:
+        """The next action this turn, or None if there is nothing legal."""
+        ...
+
+
+def _free_starting_cells(game: Game) -> list[Position]:
+    taken = {yacht.position for yacht in game.yachts.values()}
+    return [
+        cell for cell in game.board.get_starting_line_positions() if cell not in taken
+    ]
+
+
+def _fallback(game: Game, player_id: str, rng: random.Random) -> dict | None:
+    # No move is legal: spend the puff, or a leg lowering the spinnaker.
+    legal_actions = list_legal_actions(game)
+    puffs = [puff for puff in legal_actions.puffs if puff.legal]
+    if puffs:
+        puff = rng.choice(puffs)
+        return {
+            "type": "use_puff",
+            "player_id": player_id,
+            "direction": puff.direction.value,
+        }
+    if legal_actions.can_lower_spinnaker:
+        return {"type": "lower_spinnaker", "player_id": player_id}
+    return None
+
+
+def _move(player_id: str, move: MoveOption) -> dict:
+    return {"type": "move_leg", "player_id": player_id, "heading": move.heading.value}
+
+
+class RandomPolicy:
+    """Any legal move, uniformly."""
+
+    def choose_start(self, game: Game, player_id: str, rng: random.Random) -> Position:
+        return rng.choice(_free_starting_cells(game))
+
+    def choose_action(
+        self, game: Game, player_id: str, rng: random.Random
+    ) -> dict | None:
+        moves = [move for move in list_legal_actions(game).moves if move.legal]
+        if not moves:
+            return _fallback(game, player_id, rng)
+        return _move(player_id, rng.choice(moves))
+
+
+def _distance(a: Position, b: Position) -> int:
+    return max(abs(a.x - b.x), abs(a.y - b.y))
+
+
+class GreedyPolicy:
+    """
+    Sails each leg as close as it can to the next waypoint: round the mark
+    clockwise from its left side, then head for the nearest finishing cell.
+    Raises the spinnaker whenever that makes the chosen leg longer.
+    """
+
+    def choose_start(self, game: Game, player_id: str, rng: random.Random) -> Position:
+        mark = game.board.course_marks[0]
+        cells = _free_starting_cells(game)
+        return min(cells, key=lambda cell: (abs(cell.x - mark.x), rng.random()))
+
+    def _target(self, game: Game, player_id: str) -> Position:
+        yacht = game.yachts[player_id]
+        for mark in game.board.course_marks:
+            if mark in yacht.marks_rounded:
+                continue
+            waypoints = (
+                Position(mark.x - 2, mark.y),
+                Position(mark.x, mark.y - 2),
+                Position(mark.x + 2, mark.y),
+                Position(mark.x, mark.y + 2),
+            )
+            visited = 0
+            for cell in yacht.position_history:
+                if (
+                    visited < len(waypoints)
+                    and _distance(cell, waypoints[visited]) <= 1
+                ):
+                    visited += 1
+            return waypoints[min(visited, len(waypoints) - 1)]
+
+        return min(
+            game.board.get_starting_line_positions(),
+            key=lambda cell: _distance(cell, yacht.position),
+        )
+
+    def choose_action(
+        self, game: Game, player_id: str, rng: random.Random
+    ) -> dict | None:
+        legal_actions = list_legal_actions(game)
+        moves = [move for move in legal_actions.moves if move.legal]
+        if not moves:
+            return _fallback(game, player_id, rng)
+
+        target = self._target(game, player_id)
+
+        def score(move: MoveOption) -> tuple:
+            assert move.destination is not None  # set on every legal move
+            return (
+                not move.finishes,
+                not move.rounds_mark,
+                _distance(move.destination, target) + move.leg_cost - 1,
+                rng.random(),
+            )
+
+        best = min(moves, key=score)
+        if legal_actions.can_raise_spinnaker and (
+            best.toggled_spinnaker_speed > best.speed
+        ):
+            return {"type": "raise_spinnaker", "player_id": player_id}
+        return _move(player_id, best)
+
+
+POLICIES: dict[str, type[Policy]] = {
+    "random": RandomPolicy,
+    "greedy": GreedyPolicy,
+}
@@ -0,0 +1,201 @@
+"""
+Headless races played through the action log, so every simulated game runs
+the same rule engine as a live one and is reproducible from its seed.
+"""
+
+import os
+import random
+import statistics
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+
+from regatta.core.action_log import apply_action
+from regatta.core.course import generate_board
+from regatta.models.game import Game, GamePhase
+from regatta.models.wind import WindDirection
+from regatta.sim.policies import POLICIES
+
+
+@dataclass(frozen=True)
+class RaceResult:
+    seed: int
+    winner: str | None
+    # Each player's cell on the starting line, counted from its first end.
+    starts: dict[str, int]
+    policies: dict[str, str]
+    turns: int
+    blanketed_turns: int
+    partially_blanketed_turns: int
+    # A player was left with no legal action.
+    stalled: bool
+
+
+def simulate_race(
+    seed: int,
+    players: int = 2,
+    policies: Sequence[str] = ("greedy",),
+    max_turns: int = 1_000,
+) -> RaceResult:
+    """
+    Plays one race from lobby to finish. Seats take policies in turn. Turns
+    advance only through the game actions, as in a live game: every seat in a
+    round shares the legs_per_turn that end_turn rolls when the round wraps,
+    and the only blanket check is the start_round that opens the race after
+    the last starting position is chosen.
+    """
+    rng = random.Random(seed)
+
+    def play(game: Game, action: dict) -> Game:
+        return apply_action(game, {**action, "seed": rng.getrandbits(32)})
+
+    game = Game(
+        id=f"sim-{seed}",
+        board=generate_board(rng),
+        wind_direction=rng.choice(list(WindDirection)),
+    )
+    player_ids = [f"player_{i + 1}" for i in range(players)]
+    policy_names = {
+        player_id: policies[i % len(policies)] for i, player_id in enumerate(player_ids)
+    }
+    seats = {player_id: POLICIES[name]() for player_id, name in policy_names.items()}
+
+    for player_id in player_ids:
+        game = play(game, {"type": "add_player", "player_id": player_id})
+    game = play(game, {"type": "start_setup"})
+
+    line = game.board.get_starting_line_positions()
+    starts: dict[str, int] = {}
+    while game.phase == GamePhase.SETUP:
+        player_id = game.setup_order[game.current_player_index]
+        cell = seats[player_id].choose_start(game, player_id, rng)
+        starts[player_id] = line.index(cell)
+        action = {"player_id": player_id, "x": cell.x, "y": cell.y}
+        game = play(game, {"type": "choose_starting_position", **action})
+
+    turns = blanketed = partially_blanketed = 0
+    stalled = False
+    # The last placement ran start_round for the first turn. A blanketed
+    # first player has already lost that turn.
+    if game.last_event == "Blanketed! Turn lost.":
+        blanketed = turns = 1
+    elif game.last_event and game.last_event.startswith("Partially blanketed"):
+        partially_blanketed = 1
+
+    while game.phase == GamePhase.RACING and turns < max_turns and not stalled:
+        turns += 1
+        turn = game.current_player_index
+        player_id = game.setup_order[turn]
+        # move_leg and lower_spinnaker end the turn themselves once
+        # the last leg is spent.
+        while game.phase == GamePhase.RACING and game.current_player_index == turn:
+            action = seats[player_id].choose_action(game, player_id, rng)
+            if action is None:
+                stalled = True
+                break
+            game = play(game, action)
+
+    return RaceResult(
+        seed=seed,
+        winner=game.winner,
+        starts=starts,
+        policies=policy_names,
+        turns=turns,
+        blanketed_turns=blanketed,
+        partially_blanketed_turns=partially_blanketed,
+        stalled=stalled,
+    )
+
+
+@dataclass
+class SimulationStats:
+    races: int = 0
+    finished: int = 0
+    stalled: int = 0
+    turns: int = 0
+    blanketed_turns: int = 0
+    partially_blanketed_turns: int = 0
+    # Rounds (turns / players) of each finished race.
+    race_lengths: list[float] = field(default_factory=list)
+    starts_by_cell: Counter[int] = field(default_factory=Counter)
+    wins_by_cell: Counter[int] = field(default_factory=Counter)
+    seats_by_policy: Counter[str] = field(default_factory=Counter)
+    wins_by_policy: Counter[str] = field(default_factory=Counter)
+
+    def add(self, result: RaceResult) -> None:
+        self.races += 1
+        self.stalled += result.stalled
+        self.turns += result.turns
+        self.blanketed_turns += result.blanketed_turns
+        self.partially_blanketed_turns += result.partially_blanketed_turns
+        self.starts_by_cell.update(result.starts.values())
+        self.seats_by_policy.update(result.policies.values())
+
+        if result.winner is not None:
+            self.finished += 1
+            self.race_lengths.append(result.turns / len(result.starts))
+            self.wins_by_cell[result.starts[result.winner]] += 1
+            self.wins_by_policy[result.policies[result.winner]] += 1
+
+    def summary(self) -> dict:
+        lengths = sorted(self.race_lengths)
+        return {
+            "races": self.races,
+            "finished": self.finished,
+            "stalled": self.stalled,
+            "race_length_rounds": {
+                "mean": statistics.fmean(lengths) if lengths else None,
+                "median": statistics.median(lengths) if lengths else None,
+                "p90": lengths[int(len(lengths) * 0.9)] if lengths else None,
+            },
+            "win_rate_by_start": {
+                cell: self.wins_by_cell[cell] / starts
+                for cell, starts in sorted(self.starts_by_cell.items())
+            },
+            "win_rate_by_policy": {
+                policy: self.wins_by_policy[policy] / seats
+                for policy, seats in sorted(self.seats_by_policy.items())
+            },
+            "blanketed_turn_rate": self.blanketed_turns / max(self.turns, 1),
+            "partially_blanketed_turn_rate": (
+                self.partially_blanketed_turns / max(self.turns, 1)
+            ),
+        }
+
+
+def run_simulation(
+    races: int,
+    *,
+    seed: int = 0,
+    players: int = 2,
+    policies: Sequence[str] = ("greedy",),
+    max_turns: int = 1_000,
+    workers: int | None = None,
+) -> SimulationStats:
+    """
+    Plays `races` races with seeds seed, seed + 1, ... across `workers`
+    processes (all cores by default) and aggregates the results.
+    """
+    unknown = set(policies) - POLICIES.keys()
+    if unknown:
+        raise ValueError(f"Unknown policies: {', '.join(sorted(unknown))}")
+
+    race = partial(
+        simulate_race, players=players, policies=tuple(policies), max_turns=max_turns
+    )
+    seeds = range(seed, seed + races)
+    stats = SimulationStats()
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for result in map(race, seeds):
+            stats.add(result)
+        return stats
+
+    chunksize = max(1, races // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for result in pool.map(race, seeds, chunksize=chunksize):
+            stats.add(result)
+    return stats
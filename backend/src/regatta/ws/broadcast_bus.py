@@ -0,0 +1,218 @@
+"""
+Cross-process transport for game updates.
+
+Each process fans committed states out to its own sockets directly; the bus
+carries them to every other process so they can do the same for theirs.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from collections.abc import Awaitable, Callable
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from regatta.db.engine import AsyncSessionLocal
+from regatta.db.game_store import StoredGame, load_game
+from regatta.serialization.game_serializer import serialize_game
+
+logger = logging.getLogger(__name__)
+
+StateHandler = Callable[[str, int, dict], Awaitable[None]]
+ResyncHandler = Callable[[], Awaitable[None]]
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more. Larger states are
+# announced by game id and version only and loaded from the database by
+# listeners.
+NOTIFY_PAYLOAD_LIMIT = 7900
+
+# An idle LISTEN connection is pinged this often, so a connection that died
+# without closing its socket is noticed and replaced.
+LISTENER_PING_SECONDS = 30.0
+RECONNECT_MIN_DELAY_SECONDS = 0.5
+RECONNECT_MAX_DELAY_SECONDS = 30.0
+
+_CONNECTION_ERRORS = (
+    OSError,
+    TimeoutError,
+    asyncpg.InterfaceError,
+    asyncpg.exceptions.PostgresConnectionError,
+)
+
+
+class BroadcastBus:
+    """Single-process bus: there are no other workers to notify."""
+
+    async def start(self, handler: StateHandler, resync: ResyncHandler) -> None:
+        pass
+
+    async def publish(self, game_id: str, version: int, state: dict) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+def encode_notification(origin: str, game_id: str, version: int, state: dict) -> str:
+    header = {"origin": origin, "game_id": game_id, "version": version}
+    payload = json.dumps({**header, "state": state}, separators=(",", ":"))
+    if len(payload.encode()) <= NOTIFY_PAYLOAD_LIMIT:
+        return payload
+    return json.dumps({**header, "pointer": True})
+
+
+class PostgresBroadcastBus(BroadcastBus):
+    """
+    Relays updates between workers over Postgres LISTEN/NOTIFY. Dropped
+    connections are re-established: the publisher on its next update, the
+    listener in the background, after which resync is awaited because any
+    updates sent in between were missed.
+    """
+
+    def __init__(self, database_url: str, channel: str) -> None:
+        self.dsn = make_url(database_url).set(drivername="postgresql")
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self._handler: StateHandler | None = None
+        self._resync: ResyncHandler | None = None
+        # NOTIFY and LISTEN use separate connections, since an asyncpg
+        # connection runs one operation at a time.
+        self._publisher: asyncpg.Connection | None = None
+        self._listener: asyncpg.Connection | None = None
+        self._incoming: asyncio.Queue[str] = asyncio.Queue()
+        self._consumer: asyncio.Task | None = None
+        self._supervisor: asyncio.Task | None = None
+
+    async def _connect(self) -> asyncpg.Connection:
+        return await asyncpg.connect(self.dsn.render_as_string(hide_password=False))
+
+    async def start(self, handler: StateHandler, resync: ResyncHandler) -> None:
+        self._handler = handler
+        self._resync = resync
+        self._publisher = await self._connect()
+        lost = await self._listen()
+        self._consumer = asyncio.create_task(self._consume())
+        self._supervisor = asyncio.create_task(self._supervise(lost))
+
+    async def _listen(self) -> asyncio.Event:
+        """Opens the LISTEN connection. The event is set once it is lost."""
+        lost = asyncio.Event()
+        listener = await self._connect()
+        listener.add_termination_listener(lambda _connection: lost.set())
+        await listener.add_listener(self.channel, self._on_notification)
+        self._listener = listener
+        return lost
+
+    async def _supervise(self, lost: asyncio.Event) -> None:
+        while True:
+            await self._wait_until_lost(lost)
+            if self._listener is not None:
+                self._listener.terminate()
+                self._listener = None
+            logger.warning("Lost the %s listener, reconnecting", self.channel)
+
+            delay = RECONNECT_MIN_DELAY_SECONDS
+            while True:
+                try:
+                    lost = await self._listen()
+                    break
+                except _CONNECTION_ERRORS:
+                    logger.warning("Reconnecting in %ss", delay, exc_info=True)
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, RECONNECT_MAX_DELAY_SECONDS)
+
+            if self._resync is not None:
+                try:
+                    await self._resync()
+                except Exception:
+                    logger.exception("Resync after reconnecting failed")
+
+    async def _wait_until_lost(self, lost: asyncio.Event) -> None:
+        while not lost.is_set():
+            try:
+                await asyncio.wait_for(lost.wait(), LISTENER_PING_SECONDS)
+            except TimeoutError:
+                listener = self._listener
+                if listener is None:
+                    return
+                try:
+                    await listener.execute("SELECT 1", timeout=LISTENER_PING_SECONDS)
+                except _CONNECTION_ERRORS:
+                    return
+
+    async def publish(self, game_id: str, version: int, state: dict) -> None:
+        if self._handler is None:
+            raise RuntimeError("PostgresBroadcastBus.start() has not been awaited")
+        payload = encode_notification(self.origin, game_id, version, state)
+        try:
+            await self._notify(payload)
+        except _CONNECTION_ERRORS:
+            # The connection dropped since the last update: retry once on a
+            # new one.
+            if self._publisher is not None:
+                self._publisher.terminate()
+                self._publisher = None
+            await self._notify(payload)
+
+    async def _notify(self, payload: str) -> None:
+        publisher = self._publisher
+        if publisher is None or publisher.is_closed():
+            publisher = self._publisher = await self._connect()
+        await publisher.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+
+    def _on_notification(
+        self, _connection: object, _pid: int, _channel: str, payload: str
+    ) -> None:
+        # asyncpg invokes listeners synchronously in arrival order; queue them
+        # so the handler runs one update at a time and keeps that order.
+        self._incoming.put_nowait(payload)
+
+    async def _consume(self) -> None:
+        while True:
+            payload = await self._incoming.get()
+            try:
+                await self._deliver(json.loads(payload))
+            except Exception:
+                logger.exception("Failed to relay game update %s", payload[:200])
+
+    async def _deliver(self, notification: dict) -> None:
+        if notification["origin"] == self.origin or self._handler is None:
+            return
+
+        game_id = notification["game_id"]
+        version = notification["version"]
+        state = notification.get("state")
+        if state is None:
+            stored_game = await self._fetch(game_id)
+            if stored_game is None:
+                return
+            # The stored game can be newer than the one announced.
+            version = stored_game.version
+            state = serialize_game(stored_game.game)
+        await self._handler(game_id, version, state)
+
+    async def _fetch(self, game_id: str) -> StoredGame | None:
+        async with AsyncSessionLocal() as db:
+            return await load_game(db, uuid.UUID(game_id))
+
+    async def stop(self) -> None:
+        for task in (self._supervisor, self._consumer):
+            if task is not None:
+                task.cancel()
+        self._supervisor = self._consumer = None
+        listener = self._listener
+        if listener is not None and not listener.is_closed():
+            await listener.remove_listener(self.channel, self._on_notification)
+            await listener.close()
+        self._listener = None
+        if self._publisher is not None:
+            await self._publisher.close()
+            self._publisher = None
+
+
+def create_broadcast_bus(backend: str, database_url: str, channel: str) -> BroadcastBus:
+    if backend == "postgres":
+        return PostgresBroadcastBus(database_url, channel)
+    return BroadcastBus()
@@ -0,0 +1,115 @@
+import asyncio
+import logging
+from collections import OrderedDict
+
+from regatta.cache.game_cache import GameCache, game_cache
+from regatta.config import settings
+from regatta.ws.broadcast_bus import BroadcastBus, create_broadcast_bus
+from regatta.ws.connection_manager import ConnectionManager, connection_manager
+
+logger = logging.getLogger(__name__)
+
+# Games whose latest delivered version is remembered, most recent first.
+MAX_TRACKED_GAMES = 10_000
+
+
+class BroadcastDispatcher:
+    """
+    Moves WebSocket fan-out off the request path. Routes publish committed
+    states and return; one background task per process hands them to the
+    local ConnectionManager and then to the bus for other workers, in FIFO
+    order, so each game's updates stay ordered.
+
+    Updates relayed from other workers evict older cache entries. Sockets
+    never receive a version older than one they were already sent.
+    """
+
+    def __init__(
+        self,
+        manager: ConnectionManager,
+        bus: BroadcastBus | None = None,
+        cache: GameCache = game_cache,
+    ) -> None:
+        self.manager = manager
+        self.bus = bus or BroadcastBus()
+        self.cache = cache
+        self._queue: asyncio.Queue[tuple[str, int, dict]] = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+        self._delivered: OrderedDict[str, int] = OrderedDict()
+
+    async def start(self) -> None:
+        """Subscribes to updates committed by other workers."""
+        await self.bus.start(self._relay, self._resync)
+
+    def publish(self, game_id: str, version: int, state: dict) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        self._queue.put_nowait((game_id, version, state))
+
+    def _is_newer(self, game_id: str, version: int) -> bool:
+        """Records version as delivered unless a later one already was."""
+        delivered = self._delivered.get(game_id)
+        if delivered is not None and delivered >= version:
+            return False
+        self._delivered[game_id] = version
+        self._delivered.move_to_end(game_id)
+        while len(self._delivered) > MAX_TRACKED_GAMES:
+            self._delivered.popitem(last=False)
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            game_id, version, state = await self._queue.get()
+            try:
+                if self._is_newer(game_id, version):
+                    try:
+                        await self.manager.broadcast_state(game_id, state)
+                    except Exception:
+                        logger.exception("Broadcast failed for game %s", game_id)
+                try:
+                    await self.bus.publish(game_id, version, state)
+                except Exception:
+                    logger.exception("Publishing game %s to the bus failed", game_id)
+            finally:
+                self._queue.task_done()
+
+    async def _relay(self, game_id: str, version: int, state: dict) -> None:
+        self.cache.invalidate_older(game_id, version)
+        if self._is_newer(game_id, version):
+            await self.manager.broadcast_state(game_id, state)
+
+    async def _resync(self) -> None:
+        # Updates from other workers may have been missed while the bus was
+        # disconnected, so no cached game can be trusted.
+        self.cache.clear()
+
+    async def stop(self, timeout: float) -> None:
+        """Delivers every published update, then stops the worker."""
+        try:
+            await asyncio.wait_for(self._drain(), timeout)
+        except TimeoutError:
+            logger.warning("Broadcast drain timed out after %ss", timeout)
+
+        if self._worker is not None and self._worker.get_loop() is (
+            asyncio.get_running_loop()
+        ):
+            self._worker.cancel()
+        self._worker = None
+        await self.bus.stop()
+
+    async def _drain(self) -> None:
+        await self._queue.join()
+        await asyncio.gather(
+            *[
+                self.manager.drain(game_id)
+                for game_id in list(self.manager.active_connections)
+            ]
+        )
+
+
+broadcast_dispatcher = BroadcastDispatcher(
+    connection_manager,
+    create_broadcast_bus(
+        settings.broadcast_backend, settings.database_url, settings.notify_channel
+    ),
+)
@@ -1,34 +1,213 @@
 import asyncio
+import itertools
+import json
 from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Literal
 
 from fastapi import WebSocket
 
+from regatta.config import settings
+from regatta.ws.game_patches import diff_game
+
+# Process-wide so a version number is never reused for a different state, even
+# after a game's state is dropped and rebuilt.
+_versions = itertools.count(1)
+
+# WebSocket close code for "try again later", sent to evicted slow consumers.
+_TRY_AGAIN_LATER = 1013
+
+OverflowPolicy = Literal["coalesce", "drop"]
+
+
+@dataclass(frozen=True)
+class VersionedState:
+    version: int
+    state: dict
+
+
+@dataclass
+class _Outbox:
+    """Bounded queue of encoded frames for one socket, drained by its own writer."""
+
+    queue: asyncio.Queue[str]
+    writer: asyncio.Task | None = None
+    max_depth: int = 0
+    # Held for each send, so replies sent outside the queue never interleave
+    # with the writer's.
+    sending: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def clear(self) -> None:
+        while not self.queue.empty():
+            self.queue.get_nowait()
+            self.queue.task_done()
+
 
 class ConnectionManager:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        send_queue_size: int = 32,
+        overflow_policy: OverflowPolicy = "coalesce",
+    ) -> None:
         self.active_connections: dict[str, list[WebSocket]] = defaultdict(list)
+        # Last state broadcast per game, kept only while the game has sockets.
+        self.latest_states: dict[str, VersionedState] = {}
+        self.send_queue_size = send_queue_size
+        self.overflow_policy = overflow_policy
+        self.coalesced = 0
+        self.evictions = 0
+        self._outboxes: dict[WebSocket, _Outbox] = {}
+        self._closing: set[asyncio.Task] = set()
 
     def connect(self, game_id: str, connection: WebSocket) -> None:
         self.active_connections[game_id].append(connection)
+        self._outboxes[connection] = _Outbox(asyncio.Queue(self.send_queue_size))
 
     def disconnect(self, game_id: str, connection: WebSocket) -> None:
-        self.active_connections[game_id].remove(connection)
+        if connection in self.active_connections[game_id]:
+            self.active_connections[game_id].remove(connection)
+        if not self.active_connections[game_id]:
+            self.latest_states.pop(game_id, None)
+
+        outbox = self._outboxes.pop(connection, None)
+        if outbox is None:
+            return
+        outbox.clear()
+        if outbox.writer and outbox.writer is not asyncio.current_task():
+            outbox.writer.cancel()
 
-    async def _attempt_broadcast(
-        self, game_id: str, connection: WebSocket, message: dict
+    async def _write(
+        self, game_id: str, connection: WebSocket, outbox: _Outbox
     ) -> None:
-        try:
-            await connection.send_json(message)
-        except Exception:
-            self.disconnect(game_id, connection)
+        while True:
+            encoded_message = await outbox.queue.get()
+            try:
+                async with outbox.sending:
+                    await connection.send_text(encoded_message)
+            except Exception:
+                self.disconnect(game_id, connection)
+                return
+            finally:
+                outbox.queue.task_done()
+
+    def _enqueue(
+        self, game_id: str, connection: WebSocket, encoded_message: str
+    ) -> None:
+        outbox = self._outboxes.get(connection)
+        if outbox is None:
+            return
+        if outbox.writer is None:
+            outbox.writer = asyncio.create_task(
+                self._write(game_id, connection, outbox)
+            )
+
+        if outbox.queue.full():
+            latest = self.latest_states.get(game_id)
+            if self.overflow_policy == "coalesce" and latest is not None:
+                # Everything queued is superseded by the latest full state.
+                self.coalesced += 1
+                outbox.clear()
+                encoded_message = encode_message(_snapshot_message(latest))
+            else:
+                self._evict(game_id, connection)
+                return
+
+        outbox.queue.put_nowait(encoded_message)
+        outbox.max_depth = max(outbox.max_depth, outbox.queue.qsize())
+
+    def _evict(self, game_id: str, connection: WebSocket) -> None:
+        self.evictions += 1
+        self.disconnect(game_id, connection)
+        closing = asyncio.create_task(connection.close(code=_TRY_AGAIN_LATER))
+        self._closing.add(closing)
+        closing.add_done_callback(self._closing.discard)
 
     async def broadcast(self, game_id: str, message: dict) -> None:
+        """Queues the message for every subscriber without waiting for delivery."""
+        # Encode once and queue the same text frame for every subscriber.
+        encoded_message = encode_message(message)
+        for connection in list(self.active_connections[game_id]):
+            self._enqueue(game_id, connection, encoded_message)
+
+    async def broadcast_state(self, game_id: str, state: dict) -> None:
+        """Sends a patch against the previous state, or a snapshot if there is none."""
+        if not self.active_connections[game_id]:
+            return
+
+        previous = self.latest_states.get(game_id)
+        current = VersionedState(next(_versions), state)
+        self.latest_states[game_id] = current
+
+        if previous is None:
+            await self.broadcast(game_id, _snapshot_message(current))
+            return
+
+        await self.broadcast(
+            game_id,
+            {
+                "type": "patch",
+                "version": current.version,
+                "base_version": previous.version,
+                "changes": diff_game(previous.state, state),
+            },
+        )
+
+    async def send(self, connection: WebSocket, message: dict) -> None:
+        """
+        Sends a message to one socket now, ahead of anything still queued for
+        it. Unlike queued frames it cannot be coalesced away, so use it for
+        replies the client waits on.
+        """
+        outbox = self._outboxes.get(connection)
+        if outbox is None:
+            return
+        async with outbox.sending:
+            await connection.send_text(encode_message(message))
+
+    async def send_snapshot(self, game_id: str, connection: WebSocket) -> None:
+        latest = self.latest_states.get(game_id)
+        if latest is not None:
+            self._enqueue(
+                game_id, connection, encode_message(_snapshot_message(latest))
+            )
+
+    async def drain(self, game_id: str) -> None:
+        """Waits until every queued frame for the game has been handed to its socket."""
         await asyncio.gather(
             *[
-                self._attempt_broadcast(game_id, connection, message)
+                self._outboxes[connection].queue.join()
                 for connection in self.active_connections[game_id]
+                if connection in self._outboxes
             ]
         )
 
+    def stats(self) -> dict:
+        depths = [outbox.queue.qsize() for outbox in self._outboxes.values()]
+        return {
+            "connections": len(self._outboxes),
+            "queued_messages": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "peak_queue_depth": max(
+                (outbox.max_depth for outbox in self._outboxes.values()), default=0
+            ),
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+        }
+
+
+def encode_message(message: dict) -> str:
+    """Same encoding as WebSocket.send_json, done once per message."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+def _snapshot_message(versioned_state: VersionedState) -> dict:
+    return {
+        "type": "snapshot",
+        "version": versioned_state.version,
+        "state": versioned_state.state,
+    }
+
 
-connection_manager = ConnectionManager()
+connection_manager = ConnectionManager(
+    settings.ws_send_queue_size, settings.ws_overflow_policy
+)
@@ -0,0 +1,81 @@
+"""
+Versioned patches between two serialized games (see serialize_game).
+
+A patch carries only what changed: top-level fields whose value differs,
+the changed fields of each yacht, and the new tail of each yacht's track runs.
+Clients apply patches in version order and ask for a snapshot when they
+see a base_version they do not hold.
+"""
+
+from typing import Any
+
+
+def _diff_runs(old_runs: list[int], new_runs: list[int]) -> dict | None:
+    """Returns {"from": k, "runs": tail} so that old_runs[:k] + tail == new_runs."""
+    if old_runs == new_runs:
+        return None
+
+    prefix = 0
+    for old_value, new_value in zip(old_runs, new_runs, strict=False):
+        if old_value != new_value:
+            break
+        prefix += 1
+
+    return {"from": prefix, "runs": new_runs[prefix:]}
+
+
+def _diff_yacht(old: dict, new: dict) -> dict:
+    changes = {
+        key: value
+        for key, value in new.items()
+        if key != "position_history" and old.get(key) != value
+    }
+
+    old_track, new_track = old.get("position_history"), new["position_history"]
+    if not isinstance(old_track, dict) or old_track["version"] != new_track["version"]:
+        changes["position_history"] = new_track
+    else:
+        track_patch = _diff_runs(old_track["runs"], new_track["runs"])
+        if track_patch:
+            changes["track"] = track_patch
+
+    return changes
+
+
+def diff_game(old: dict, new: dict) -> dict:
+    changes: dict[str, Any] = {
+        key: value
+        for key, value in new.items()
+        if key != "yachts" and old.get(key) != value
+    }
+
+    yachts = {}
+    for player_id, yacht in new["yachts"].items():
+        old_yacht = old["yachts"].get(player_id)
+        yacht_changes = yacht if old_yacht is None else _diff_yacht(old_yacht, yacht)
+        if yacht_changes:
+            yachts[player_id] = yacht_changes
+
+    if yachts:
+        changes["yachts"] = yachts
+    return changes
+
+
+def apply_patch(state: dict, changes: dict) -> dict:
+    """Reference implementation of the client-side patch application."""
+    patched = {**state, **{k: v for k, v in changes.items() if k != "yachts"}}
+    yachts = dict(state["yachts"])
+
+    for player_id, yacht_changes in changes.get("yachts", {}).items():
+        yacht = {**yachts.get(player_id, {}), **yacht_changes}
+        track_patch = yacht.pop("track", None)
+        if track_patch:
+            track = yacht["position_history"]
+            yacht["position_history"] = {
+                **track,
+                "runs": track["runs"][: track_patch["from"]] + track_patch["runs"],
+            }
+        yachts[player_id] = yacht
+
+    patched["yachts"] = yachts
+    return patched
@@ -0,0 +1,113 @@
+import random
+
+import pytest
+
+from regatta.core.action_log import (
+    TurnActionError,
+    apply_action,
+    new_action,
+    replay,
+)
+from regatta.models.game import GamePhase
+from regatta.models.position import Position
+from regatta.models.wind import Heading
+from tests.test_game_actions import make_game, make_racing_game
+
+PLAYERS = ["player_1", "player_2", "player_3"]
+
+
+def play_to_racing() -> list[dict]:
+    actions = [new_action("add_player", player_id=player) for player in PLAYERS]
+    actions.append(new_action("start_setup"))
+    return actions
+
+
+def test_replay_reproduces_dice_rolls():
+    actions = play_to_racing()
+    game = replay(make_game(), actions)
+
+    for x, player_id in enumerate(game.setup_order, start=3):
+        action = new_action("choose_starting_position", player_id=player_id, x=x, y=5)
+        actions.append(action)
+        game = apply_action(game, action)
+
+    assert game.phase == GamePhase.RACING
+    for _ in range(5):
+        rebuilt = replay(make_game(), actions)
+        assert rebuilt == game
+        assert rebuilt.legs_per_turn == game.legs_per_turn
+
+
+def test_apply_action_leaves_the_global_random_stream_alone():
+    action = new_action("add_player", player_id="player_1")
+    random.seed(42)
+    expected = [random.random() for _ in range(3)]
+
+    random.seed(42)
+    apply_action(make_game(), action)
+
+    assert [random.random() for _ in range(3)] == expected
+
+
+def test_invalid_actions_raise_value_error():
+    with pytest.raises(ValueError, match="Minimum of 2 players"):
+        apply_action(make_game(), new_action("start_setup"))
+
+
+def test_unknown_action_type_raises_value_error():
+    with pytest.raises(ValueError, match="Unknown action type 'teleport'"):
+        apply_action(make_game(), new_action("teleport"))
+
+
+def turn(*steps: dict) -> dict:
+    return new_action("turn", player_id="player_1", actions=list(steps))
+
+
+def test_turn_applies_steps_in_order():
+    game = make_racing_game(Position(5, 5), Heading.NORTH, legs=3)
+    steps = [
+        {"type": "raise_spinnaker"},
+        {"type": "lower_spinnaker"},
+        {"type": "move_leg", "heading": 0},
+    ]
+
+    played = apply_action(game, turn(*steps))
+
+    expected = game
+    for step in steps:
+        expected = apply_action(expected, {**step, "player_id": "player_1", "seed": 0})
+    assert played.yachts == expected.yachts
+    assert played.legs_remaining == 1
+
+
+def test_turn_reports_the_first_rejected_step():
+    game = make_racing_game(Position(5, 5), Heading.NORTH, legs=3)
+
+    with pytest.raises(
+        TurnActionError, match="Action 1: Spinnaker is already raised"
+    ) as e:
+        apply_action(
+            game,
+            turn(
+                {"type": "raise_spinnaker"},
+                {"type": "raise_spinnaker"},
+                {"type": "move_leg", "heading": 0},
+            ),
+        )
+
+    assert e.value.index == 1
+
+
+def test_turn_cannot_end_another_players_turn():
+    game = make_racing_game(Position(5, 5), Heading.NORTH, legs=0)
+    action = new_action("turn", player_id="player_2", actions=[{"type": "end_turn"}])
+
+    with pytest.raises(TurnActionError, match="Action 0: It is not player_id player_2"):
+        apply_action(game, action)
+
+
+def test_turn_rejects_non_turn_steps():
+    game = make_racing_game(Position(5, 5), Heading.NORTH)
+
+    with pytest.raises(TurnActionError, match="'start_setup' is not allowed"):
+        apply_action(game, turn({"type": "start_setup"}))
@@ -1,4 +1,12 @@
+import uuid
+
 from httpx import AsyncClient, Response
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from regatta.cache.game_cache import game_cache
+from regatta.core.action_log import new_action
+from regatta.db.models import GameActionRow, GameRow
 
 
 async def exhaust_legs(
@@ -114,3 +122,115 @@ async def test_add_duplicate_player_returns_422(client: AsyncClient) -> None:
         f"/games/{game_id}/players", json={"player_id": "player_1"}
     )
     assert response.status_code == 422
+
+
+async def test_concurrent_write_is_retried_on_fresh_state(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    game = await client.post("/games/")
+    game_id = game.json()["id"]
+    await client.post(f"/games/{game_id}/players", json={"player_id": "player_1"})
+
+    # Another worker logs a player behind this worker's cache.
+    game_row = await db_session.get(GameRow, uuid.UUID(game_id))
+    assert game_row is not None
+    db_session.add(
+        GameActionRow(
+            game_id=game_row.id,
+            sequence=game_row.version + 1,
+            action=new_action("add_player", player_id="player_2"),
+        )
+    )
+    await db_session.execute(
+        update(GameRow)
+        .where(GameRow.id == game_row.id)
+        .values(version=GameRow.version + 1)
+    )
+
+    response = await client.post(
+        f"/games/{game_id}/players", json={"player_id": "player_3"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["players"] == ["player_1", "player_2", "player_3"]
+
+
+async def test_state_is_rebuilt_from_snapshot_and_action_log(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    game = await client.post("/games/")
+    game_id = game.json()["id"]
+    for player_id in ["player_1", "player_2"]:
+        await client.post(f"/games/{game_id}/players", json={"player_id": player_id})
+    started = await client.post(f"/games/{game_id}/start")
+
+    game_cache.invalidate(game_id)
+    rebuilt = await client.get(f"/games/{game_id}")
+
+    assert rebuilt.json() == started.json()
+    game_row = await db_session.get(GameRow, uuid.UUID(game_id))
+    assert game_row is not None
+    assert (game_row.snapshot_version, game_row.version) == (1, 4)
+
+
+async def test_turn_rejects_the_whole_batch_on_an_invalid_action(
+    client: AsyncClient,
+) -> None:
+    game = await client.post("/games/")
+    game_id = game.json()["id"]
+    for player_id in ["player_1", "player_2"]:
+        await client.post(f"/games/{game_id}/players", json={"player_id": player_id})
+    before = await client.post(f"/games/{game_id}/start")
+    current_player = before.json()["setup_order"][0]
+
+    response = await client.post(
+        f"/games/{game_id}/turn",
+        json={
+            "player_id": current_player,
+            "actions": [
+                {"type": "raise_spinnaker"},
+                {"type": "raise_spinnaker"},
+            ],
+        },
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"].startswith("Action 0:")
+    after = await client.get(f"/games/{game_id}")
+    assert after.json() == before.json()
+
+
+async def test_list_games_pages_newest_first(client: AsyncClient) -> None:
+    created = [(await client.post("/games/")).json()["id"] for _ in range(3)]
+    await client.post(f"/games/{created[0]}/players", json={"player_id": "player_1"})
+
+    first_page = await client.get("/games/", params={"limit": 2})
+    assert first_page.status_code == 200
+    first_ids = [game["id"] for game in first_page.json()["games"]]
+    assert first_ids == created[:0:-1]
+
+    second_page = await client.get(
+        "/games/", params={"limit": 2, "cursor": first_page.json()["next_cursor"]}
+    )
+    assert second_page.json()["games"][0]["id"] == created[0]
+    assert second_page.json()["games"][0]["player_count"] == 1
+
+
+async def test_list_games_filters_by_phase_and_player_count(
+    client: AsyncClient,
+) -> None:
+    game = await client.post("/games/")
+    game_id = game.json()["id"]
+    for player_id in ["player_1", "player_2"]:
+        await client.post(f"/games/{game_id}/players", json={"player_id": player_id})
+
+    response = await client.get("/games/", params={"phase": "LOBBY", "player_count": 2})
+
+    games = response.json()["games"]
+    assert game_id in [game["id"] for game in games]
+    assert all(g["phase"] == "LOBBY" and g["player_count"] == 2 for g in games)
+
+
+async def test_list_games_rejects_bad_cursor(client: AsyncClient) -> None:
+    response = await client.get("/games/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 422
@@ -64,3 +64,18 @@ def test_board_is_on_starting_line(board):
     assert board.is_on_starting_line(Position(0, 0))
     assert board.is_on_starting_line(Position(2, 2))
     assert not board.is_on_starting_line(Position(4, 4))
+
+
+def test_board_course_index(board):
+    assert board.course.course_marks == frozenset(board.course_marks)
+    assert board.course.starting_line == frozenset(board.get_starting_line_positions())
+
+
+def test_board_course_index_is_shared_between_equal_courses(board):
+    same_course = Board(
+        Grid(5, 5),
+        [Position(1, 1), Position(2, 2), Position(3, 3)],
+        (Position(0, 0), Position(3, 3)),
+    )
+
+    assert same_course.course is board.course
@@ -0,0 +1,138 @@
+import asyncio
+import json
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from regatta.db.game_store import StoredGame
+from regatta.serialization.game_serializer import serialize_game
+from regatta.ws.broadcast_bus import (
+    NOTIFY_PAYLOAD_LIMIT,
+    PostgresBroadcastBus,
+    encode_notification,
+)
+from tests.test_game_actions import make_game
+
+DATABASE_URL = "postgresql+asyncpg://localhost/regatta"
+GAME_ID = "6f1c1a52-7e84-4d3a-9a3b-3f8f1b0c2d11"
+
+
+def test_small_states_are_sent_inline():
+    payload = json.loads(encode_notification("worker", GAME_ID, 4, {"legs": 1}))
+
+    assert payload == {
+        "origin": "worker",
+        "game_id": GAME_ID,
+        "version": 4,
+        "state": {"legs": 1},
+    }
+
+
+def test_large_states_are_sent_as_a_pointer():
+    state = {"padding": "x" * NOTIFY_PAYLOAD_LIMIT}
+
+    payload = json.loads(encode_notification("worker", GAME_ID, 4, state))
+
+    assert payload == {
+        "origin": "worker",
+        "game_id": GAME_ID,
+        "version": 4,
+        "pointer": True,
+    }
+
+
+def test_dsn_drops_the_sqlalchemy_driver():
+    bus = PostgresBroadcastBus(DATABASE_URL, "updates")
+
+    assert bus.dsn.render_as_string() == "postgresql://localhost/regatta"
+
+
+async def test_notifications_from_other_workers_reach_the_handler():
+    bus = PostgresBroadcastBus(DATABASE_URL, "updates")
+    bus._handler = AsyncMock()
+
+    notification = encode_notification("other", GAME_ID, 2, {"legs": 2})
+
+    await bus._deliver(json.loads(notification))
+
+    bus._handler.assert_awaited_once_with(GAME_ID, 2, {"legs": 2})
+
+
+async def test_own_notifications_are_ignored():
+    bus = PostgresBroadcastBus(DATABASE_URL, "updates")
+    bus._handler = AsyncMock()
+
+    await bus._deliver(
+        json.loads(encode_notification(bus.origin, GAME_ID, 2, {"legs": 2}))
+    )
+
+    bus._handler.assert_not_called()
+
+
+async def test_pointers_are_resolved_from_the_database():
+    bus = PostgresBroadcastBus(DATABASE_URL, "updates")
+    bus._handler = AsyncMock()
+    game = make_game()
+    load_game = AsyncMock(return_value=StoredGame(game, 3, {}))
+
+    with patch("regatta.ws.broadcast_bus.load_game", load_game):
+        await bus._deliver(
+            {"origin": "other", "game_id": GAME_ID, "version": 2, "pointer": True}
+        )
+
+    assert load_game.await_args.args[1] == uuid.UUID(GAME_ID)
+    bus._handler.assert_awaited_once_with(GAME_ID, 3, serialize_game(game))
+
+
+def make_connection(closed: bool = False) -> MagicMock:
+    connection = MagicMock()
+    connection.execute = AsyncMock()
+    connection.is_closed.return_value = closed
+    return connection
+
+
+async def test_publish_reconnects_a_closed_publisher():
+    bus = PostgresBroadcastBus(DATABASE_URL, "updates")
+    bus._handler = AsyncMock()
+    bus._publisher = make_connection(closed=True)
+    replacement = make_connection()
+
+    with patch("regatta.ws.broadcast_bus.asyncpg.connect", return_value=replacement):
+        await bus.publish(GAME_ID, 2, {"legs": 2})
+
+    assert bus._publisher is replacement
+    replacement.execute.assert_awaited_once()
+
+
+async def test_publish_retries_once_after_a_connection_error():
+    bus = PostgresBroadcastBus(DATABASE_URL, "updates")
+    bus._handler = AsyncMock()
+    dropped = make_connection()
+    dropped.execute.side_effect = ConnectionResetError()
+    bus._publisher = dropped
+    replacement = make_connection()
+
+    with patch("regatta.ws.broadcast_bus.asyncpg.connect", return_value=replacement):
+        await bus.publish(GAME_ID, 2, {"legs": 2})
+
+    dropped.terminate.assert_called_once()
+    replacement.execute.assert_awaited_once()
+
+
+async def test_lost_listener_is_replaced_and_resynced():
+    bus = PostgresBroadcastBus(DATABASE_URL, "updates")
+    bus._resync = AsyncMock()
+    listeners = [make_connection(), make_connection()]
+    for listener in listeners:
+        listener.add_listener = AsyncMock()
+
+    with patch("regatta.ws.broadcast_bus.asyncpg.connect", side_effect=listeners):
+        lost = await bus._listen()
+        supervisor = asyncio.create_task(bus._supervise(lost))
+        lost.set()
+        while not bus._resync.await_count:
+            await asyncio.sleep(0)
+        supervisor.cancel()
+
+    listeners[0].terminate.assert_called_once()
+    listeners[1].add_listener.assert_awaited_once()
+    assert bus._listener is listeners[1]
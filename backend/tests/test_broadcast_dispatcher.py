@@ -0,0 +1,133 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from regatta.cache.game_cache import GameCache
+from regatta.ws.broadcast_dispatcher import BroadcastDispatcher
+
+
+def make_manager() -> MagicMock:
+    manager = MagicMock()
+    manager.broadcast_state = AsyncMock()
+    manager.drain = AsyncMock()
+    manager.active_connections = {"game_1": [AsyncMock()]}
+    return manager
+
+
+async def test_publish_returns_before_delivery():
+    manager = make_manager()
+    dispatcher = BroadcastDispatcher(manager)
+
+    dispatcher.publish("game_1", 1, {"legs": 1})
+
+    manager.broadcast_state.assert_not_called()
+    await dispatcher.stop(timeout=1)
+    manager.broadcast_state.assert_called_once_with("game_1", {"legs": 1})
+
+
+async def test_updates_are_delivered_in_publish_order():
+    manager = make_manager()
+    dispatcher = BroadcastDispatcher(manager)
+
+    for legs in range(5):
+        dispatcher.publish("game_1", legs, {"legs": legs})
+    await dispatcher.stop(timeout=1)
+
+    delivered = [call.args[1]["legs"] for call in manager.broadcast_state.mock_calls]
+    assert delivered == [0, 1, 2, 3, 4]
+
+
+async def test_stop_drains_socket_queues():
+    manager = make_manager()
+    dispatcher = BroadcastDispatcher(manager)
+
+    dispatcher.publish("game_1", 1, {"legs": 1})
+    await dispatcher.stop(timeout=1)
+
+    manager.drain.assert_called_once_with("game_1")
+
+
+async def test_failed_broadcast_does_not_stop_worker():
+    manager = make_manager()
+    manager.broadcast_state.side_effect = [Exception("boom"), None]
+    dispatcher = BroadcastDispatcher(manager)
+
+    dispatcher.publish("game_1", 1, {"legs": 1})
+    dispatcher.publish("game_1", 2, {"legs": 2})
+    await asyncio.wait_for(dispatcher.stop(timeout=1), 2)
+
+    assert manager.broadcast_state.call_count == 2
+
+
+async def test_updates_are_published_to_the_bus_after_local_delivery():
+    manager = make_manager()
+    bus = MagicMock()
+    bus.publish = AsyncMock()
+    bus.stop = AsyncMock()
+    dispatcher = BroadcastDispatcher(manager, bus)
+
+    dispatcher.publish("game_1", 1, {"legs": 1})
+    await dispatcher.stop(timeout=1)
+
+    manager.broadcast_state.assert_called_once_with("game_1", {"legs": 1})
+    bus.publish.assert_called_once_with("game_1", 1, {"legs": 1})
+    bus.stop.assert_awaited_once()
+
+
+async def test_failed_local_delivery_is_still_published_to_the_bus():
+    manager = make_manager()
+    manager.broadcast_state.side_effect = Exception("boom")
+    bus = MagicMock()
+    bus.publish = AsyncMock()
+    bus.stop = AsyncMock()
+    dispatcher = BroadcastDispatcher(manager, bus)
+
+    dispatcher.publish("game_1", 1, {"legs": 1})
+    await dispatcher.stop(timeout=1)
+
+    bus.publish.assert_called_once_with("game_1", 1, {"legs": 1})
+
+
+def make_cache(version: int) -> GameCache:
+    cache = GameCache(max_size=10, ttl_seconds=60)
+    cache.put("game_1", MagicMock(), {}, version, {})
+    return cache
+
+
+async def test_relayed_updates_evict_older_cache_entries():
+    cache = make_cache(version=3)
+    dispatcher = BroadcastDispatcher(make_manager(), cache=cache)
+
+    await dispatcher._relay("game_1", 4, {"legs": 4})
+
+    assert cache.get("game_1") is None
+
+
+async def test_relayed_updates_keep_newer_cache_entries():
+    cache = make_cache(version=5)
+    dispatcher = BroadcastDispatcher(make_manager(), cache=cache)
+
+    await dispatcher._relay("game_1", 4, {"legs": 4})
+
+    assert cache.get("game_1").version == 5
+
+
+async def test_relayed_updates_older_than_delivered_ones_are_dropped():
+    manager = make_manager()
+    dispatcher = BroadcastDispatcher(manager, cache=make_cache(version=0))
+
+    dispatcher.publish("game_1", 5, {"legs": 5})
+    await dispatcher.stop(timeout=1)
+    await dispatcher._relay("game_1", 4, {"legs": 4})
+    await dispatcher._relay("game_1", 6, {"legs": 6})
+
+    delivered = [call.args[1]["legs"] for call in manager.broadcast_state.mock_calls]
+    assert delivered == [5, 6]
+
+
+async def test_resync_clears_the_cache():
+    cache = make_cache(version=3)
+    dispatcher = BroadcastDispatcher(make_manager(), cache=cache)
+
+    await dispatcher._resync()
+
+    assert cache.get("game_1") is None
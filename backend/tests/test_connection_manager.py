@@ -1,3 +1,5 @@
+import asyncio
+import json
 from unittest.mock import AsyncMock
 
 from regatta.ws.connection_manager import ConnectionManager
@@ -29,9 +31,10 @@ async def test_broadcast_sends():
     manager.connect("mock_game_id", connection_2)
 
     await manager.broadcast("mock_game_id", {"foo": "jazz"})
+    await manager.drain("mock_game_id")
 
-    connection_1.send_json.assert_called_once_with({"foo": "jazz"})
-    connection_2.send_json.assert_called_once_with({"foo": "jazz"})
+    connection_1.send_text.assert_called_once_with('{"foo":"jazz"}')
+    connection_2.send_text.assert_called_once_with('{"foo":"jazz"}')
 
 
 async def test_broadcast_removes():
@@ -42,9 +45,145 @@ async def test_broadcast_removes():
     manager.connect("mock_game_id", good_connection)
     manager.connect("mock_game_id", bad_connection)
 
-    bad_connection.send_json.side_effect = Exception("disconnected")
+    bad_connection.send_text.side_effect = Exception("disconnected")
 
     await manager.broadcast("mock_game_id", {"foo": "jazz"})
+    await manager.drain("mock_game_id")
 
-    good_connection.send_json.assert_called_once_with({"foo": "jazz"})
+    good_connection.send_text.assert_called_once_with('{"foo":"jazz"}')
     assert bad_connection not in manager.active_connections["mock_game_id"]
+
+
+async def test_broadcast_state_sends_snapshot_then_patch():
+    manager = ConnectionManager()
+    connection = AsyncMock()
+    manager.connect("mock_game_id", connection)
+
+    await manager.broadcast_state("mock_game_id", {"legs": 2, "yachts": {}})
+    await manager.broadcast_state("mock_game_id", {"legs": 1, "yachts": {}})
+    await manager.drain("mock_game_id")
+
+    snapshot = json.loads(connection.send_text.call_args_list[0].args[0])
+    patch = json.loads(connection.send_text.call_args_list[1].args[0])
+    assert snapshot["type"] == "snapshot"
+    assert snapshot["state"] == {"legs": 2, "yachts": {}}
+    assert patch["type"] == "patch"
+    assert patch["base_version"] == snapshot["version"]
+    assert patch["changes"] == {"legs": 1}
+
+
+async def test_send_snapshot_on_demand():
+    manager = ConnectionManager()
+    existing = AsyncMock()
+    late_joiner = AsyncMock()
+    manager.connect("mock_game_id", existing)
+    await manager.broadcast_state("mock_game_id", {"legs": 2, "yachts": {}})
+
+    manager.connect("mock_game_id", late_joiner)
+    await manager.send_snapshot("mock_game_id", late_joiner)
+    await manager.drain("mock_game_id")
+
+    message = json.loads(late_joiner.send_text.call_args.args[0])
+    assert message["type"] == "snapshot"
+    assert message["state"] == {"legs": 2, "yachts": {}}
+
+
+async def test_latest_state_dropped_when_last_socket_leaves():
+    manager = ConnectionManager()
+    connection = AsyncMock()
+    manager.connect("mock_game_id", connection)
+    await manager.broadcast_state("mock_game_id", {"legs": 2, "yachts": {}})
+
+    manager.disconnect("mock_game_id", connection)
+
+    assert "mock_game_id" not in manager.latest_states
+
+
+async def test_broadcast_encodes_once_per_message():
+    manager = ConnectionManager()
+    connections = [AsyncMock() for _ in range(3)]
+    for connection in connections:
+        manager.connect("mock_game_id", connection)
+
+    await manager.broadcast("mock_game_id", {"foo": "jazz"})
+    await manager.drain("mock_game_id")
+
+    sent = [connection.send_text.call_args.args[0] for connection in connections]
+    assert all(text is sent[0] for text in sent)
+
+
+def make_stalled_connection() -> AsyncMock:
+    async def never_delivered(_text: str) -> None:
+        await asyncio.Event().wait()
+
+    connection = AsyncMock()
+    connection.send_text.side_effect = never_delivered
+    return connection
+
+
+async def test_slow_consumer_does_not_block_broadcast():
+    manager = ConnectionManager(send_queue_size=4)
+    fast = AsyncMock()
+    slow = make_stalled_connection()
+    manager.connect("mock_game_id", fast)
+    manager.connect("mock_game_id", slow)
+
+    await asyncio.wait_for(manager.broadcast("mock_game_id", {"foo": "jazz"}), 1)
+    await asyncio.sleep(0)
+
+    fast.send_text.assert_called_once_with('{"foo":"jazz"}')
+    assert manager.stats()["queued_messages"] == 0
+
+    manager.disconnect("mock_game_id", slow)
+
+
+async def test_full_queue_coalesces_to_latest_snapshot():
+    manager = ConnectionManager(send_queue_size=2, overflow_policy="coalesce")
+    slow = make_stalled_connection()
+    manager.connect("mock_game_id", slow)
+
+    for legs in range(5):
+        await manager.broadcast_state("mock_game_id", {"legs": legs, "yachts": {}})
+        await asyncio.sleep(0)
+
+    queued = manager._outboxes[slow].queue
+    snapshot = json.loads(queued.get_nowait())
+    patch = json.loads(queued.get_nowait())
+    assert snapshot["type"] == "snapshot"
+    assert snapshot["state"] == {"legs": 3, "yachts": {}}
+    assert patch["base_version"] == snapshot["version"]
+    assert patch["changes"] == {"legs": 4}
+    assert manager.stats()["coalesced"] == 1
+    assert slow in manager.active_connections["mock_game_id"]
+
+    manager.disconnect("mock_game_id", slow)
+
+
+async def test_replies_are_not_coalesced_away():
+    manager = ConnectionManager(send_queue_size=2, overflow_policy="coalesce")
+    connection = AsyncMock()
+    manager.connect("mock_game_id", connection)
+
+    for legs in range(5):
+        await manager.broadcast_state("mock_game_id", {"legs": legs, "yachts": {}})
+    await manager.send(connection, {"type": "ack", "request_id": "r1"})
+    await manager.drain("mock_game_id")
+
+    sent = [json.loads(call.args[0]) for call in connection.send_text.mock_calls]
+    assert sent[0] == {"type": "ack", "request_id": "r1"}
+    assert sent[-1]["state"] == {"legs": 4, "yachts": {}}
+    assert manager.stats()["coalesced"] > 0
+
+
+async def test_full_queue_evicts_with_drop_policy():
+    manager = ConnectionManager(send_queue_size=1, overflow_policy="drop")
+    slow = make_stalled_connection()
+    manager.connect("mock_game_id", slow)
+
+    for _ in range(3):
+        await manager.broadcast("mock_game_id", {"foo": "jazz"})
+        await asyncio.sleep(0)
+
+    assert slow not in manager.active_connections["mock_game_id"]
+    assert manager.stats()["evictions"] == 1
+    slow.close.assert_called_once_with(code=1013)
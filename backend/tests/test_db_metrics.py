@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from regatta.db.metrics import DatabaseMetrics, InstrumentedPool
+
+
+def test_statements_are_timed():
+    metrics = DatabaseMetrics()
+    engine = create_engine("sqlite://")
+    metrics.attach(engine)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 2"))
+
+    stats = metrics.stats()
+    assert stats["queries"] == 2
+    assert 0 < stats["mean_query_ms"] <= stats["max_query_ms"]
+
+
+def test_failed_statements_do_not_skew_later_timings():
+    metrics = DatabaseMetrics()
+    engine = create_engine("sqlite://")
+    metrics.attach(engine)
+
+    with engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM missing"))
+        conn.execute(text("SELECT 1"))
+        assert not conn.info
+
+    assert metrics.stats()["queries"] == 1
+
+
+def test_unlimited_overflow_has_no_saturation():
+    metrics = DatabaseMetrics()
+    engine = create_async_engine(
+        "postgresql+asyncpg://localhost/regatta",
+        poolclass=InstrumentedPool,
+        max_overflow=-1,
+    )
+    metrics.attach(engine.sync_engine)
+
+    stats = metrics.stats()
+
+    assert stats["max_overflow"] == -1
+    assert stats["saturation"] is None
+
+
+def test_checkout_waits_are_summarised():
+    metrics = DatabaseMetrics()
+
+    metrics.record_checkout_wait(0.001)
+    metrics.record_checkout_wait(0.003)
+
+    stats = metrics.stats()
+    assert stats["checkouts"] == 2
+    assert stats["mean_checkout_wait_ms"] == pytest.approx(2.0)
+    assert stats["max_checkout_wait_ms"] == pytest.approx(3.0)
+
+
+def test_empty_metrics_report_zero():
+    stats = DatabaseMetrics().stats()
+
+    assert stats["mean_checkout_wait_ms"] == 0.0
+    assert stats["mean_query_ms"] == 0.0
@@ -13,6 +13,7 @@ from regatta.core.game_actions import (
     start_setup,
     use_puff,
 )
+from regatta.core.geometry import convex_hull
 from regatta.models.board import Board, Grid
 from regatta.models.game import Game, GamePhase
 from regatta.models.position import Position
@@ -787,3 +788,12 @@ def test_start_round_no_partial_blanket_without_spinnaker():
     with patch("regatta.core.game_actions.random.randint", return_value=3):
         result = start_round(game)
     assert result.legs_remaining == 3
+
+
+def test_move_leg_tracks_hull_of_history():
+    game = make_racing_game(Position(1, 1), Heading.EAST, legs=3)
+
+    after_move = move_leg(game, "player_1", Heading.SOUTH)
+    yacht = after_move.yachts["player_1"]
+
+    assert yacht.track_hull == tuple(convex_hull(list(yacht.position_history)))
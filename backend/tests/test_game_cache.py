@@ -0,0 +1,97 @@
+from regatta.cache.game_cache import GameCache
+from tests.test_game_actions import make_game
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_miss_then_hit():
+    cache = GameCache(max_size=2, ttl_seconds=60)
+    game = make_game()
+
+    assert cache.get("game_1") is None
+    cache.put("game_1", game, {"id": "game_1"}, 1, {})
+
+    cached_game = cache.get("game_1")
+    assert cached_game is not None
+    assert cached_game.game is game
+    assert cached_game.payload == {"id": "game_1"}
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_evicts_least_recently_used():
+    cache = GameCache(max_size=2, ttl_seconds=60)
+    game = make_game()
+
+    cache.put("game_1", game, {}, 1, {})
+    cache.put("game_2", game, {}, 1, {})
+    cache.get("game_1")
+    cache.put("game_3", game, {}, 1, {})
+
+    assert cache.get("game_2") is None
+    assert cache.get("game_1") is not None
+    assert cache.get("game_3") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = GameCache(max_size=2, ttl_seconds=10, clock=clock)
+    cache.put("game_1", make_game(), {}, 1, {})
+
+    clock.now = 9.9
+    assert cache.get("game_1") is not None
+
+    clock.now = 10.0
+    assert cache.get("game_1") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_zero_size_disables_cache():
+    cache = GameCache(max_size=0, ttl_seconds=60)
+    cache.put("game_1", make_game(), {}, 1, {})
+
+    assert cache.get("game_1") is None
+
+
+def test_invalidate():
+    cache = GameCache(max_size=2, ttl_seconds=60)
+    cache.put("game_1", make_game(), {}, 1, {})
+    cache.invalidate("game_1")
+
+    assert cache.get("game_1") is None
+
+
+def test_put_never_replaces_a_newer_version():
+    cache = GameCache(max_size=2, ttl_seconds=60)
+    newer = make_game()
+
+    cache.put("game_1", newer, {"version": 3}, 3, {})
+    cache.put("game_1", make_game(), {"version": 2}, 2, {})
+
+    entry = cache.get("game_1")
+    assert entry is not None
+    assert entry.version == 3
+    assert entry.payload == {"version": 3}
+
+
+def test_derived_values_are_computed_once_per_entry():
+    cache = GameCache(max_size=2, ttl_seconds=60)
+    entry = cache.put("game_1", make_game(), {}, 1, {})
+    calls = []
+
+    def compute(game):
+        calls.append(game)
+        return len(calls)
+
+    assert entry.derive("count", compute) == 1
+    assert cache.get("game_1").derive("count", compute) == 1
+
+    newer = cache.put("game_1", make_game(), {}, 2, {})
+    assert newer.derive("count", compute) == 2
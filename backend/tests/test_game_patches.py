@@ -0,0 +1,42 @@
+import json
+
+from regatta.core.game_actions import move_leg, use_puff
+from regatta.models.position import Position
+from regatta.models.wind import Heading
+from regatta.serialization.game_serializer import serialize_game
+from regatta.ws.game_patches import apply_patch, diff_game
+from tests.test_game_actions import make_racing_game
+
+
+def test_diff_of_identical_states_is_empty():
+    state = serialize_game(make_racing_game(Position(1, 1), Heading.EAST))
+    assert diff_game(state, state) == {}
+
+
+def test_move_patch_round_trips():
+    game = make_racing_game(Position(1, 1), Heading.EAST, legs=3)
+    before = serialize_game(game)
+    after = serialize_game(move_leg(game, "player_1", Heading.SOUTH))
+
+    changes = diff_game(before, after)
+
+    assert apply_patch(before, changes) == after
+    assert "board" not in changes
+    assert changes["yachts"]["player_1"]["track"] == {
+        "from": 0,
+        "runs": [1, 2, 0, 1, 1],
+    }
+
+
+def test_track_patch_only_sends_new_tail():
+    game = make_racing_game(Position(1, 1), Heading.EAST, legs=3)
+    game = move_leg(game, "player_1", Heading.SOUTH)
+    before = serialize_game(game)
+    after = serialize_game(use_puff(game, "player_1", Heading.SOUTH))
+
+    changes = diff_game(before, after)
+
+    # Same direction as the last run, so only the run length changes.
+    assert changes["yachts"]["player_1"]["track"] == {"from": 4, "runs": [2]}
+    assert apply_patch(before, changes) == after
+    assert len(json.dumps(changes)) < len(json.dumps(after)) / 4
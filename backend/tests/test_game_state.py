@@ -0,0 +1,72 @@
+import uuid
+from dataclasses import replace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from regatta.api.game_state import apply_game_action
+from regatta.cache.game_cache import game_cache
+from regatta.db.game_store import StoredGame
+from regatta.models.game import Game
+from regatta.models.position import Position
+from regatta.models.wind import Heading
+from regatta.serialization.game_serializer import serialize_game
+from tests.test_game_actions import make_racing_game
+
+GAME_ID = uuid.UUID("0c7d9a3e-5b1f-4e2a-8d6c-9f4b2a1e7c35")
+RAISE_SPINNAKER = {"type": "raise_spinnaker", "player_id": "player_1", "seed": 0}
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock(rowcount=1))
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    yield session
+    game_cache.invalidate(str(GAME_ID))
+
+
+def racing_game(spinnaker: bool) -> Game:
+    game = make_racing_game(Position(5, 5), Heading.NORTH)
+    yacht = game.yachts["player_1"]
+    return replace(game, yachts={"player_1": yacht.with_spinnaker(spinnaker)})
+
+
+def cache_game(game: Game, version: int) -> None:
+    payload = serialize_game(game)
+    game_cache.put(str(GAME_ID), game, payload, version, payload)
+
+
+async def test_action_rejected_by_a_stale_cache_entry_is_rechecked(session):
+    # Another worker lowered the spinnaker in version 2; this one cached 1.
+    cache_game(racing_game(spinnaker=True), version=1)
+    stored = racing_game(spinnaker=False)
+    load_game = AsyncMock(return_value=StoredGame(stored, 2, serialize_game(stored)))
+
+    with (
+        patch("regatta.api.game_state.load_game", load_game),
+        patch("regatta.api.game_state.broadcast_dispatcher"),
+    ):
+        saved_game = await apply_game_action(GAME_ID, session, RAISE_SPINNAKER)
+
+    assert saved_game.version == 3
+    assert saved_game.game.yachts["player_1"].spinnaker
+    session.commit.assert_awaited_once()
+
+
+async def test_action_rejected_by_the_stored_game_is_a_422(session):
+    cache_game(racing_game(spinnaker=True), version=1)
+    stored = racing_game(spinnaker=True)
+    load_game = AsyncMock(return_value=StoredGame(stored, 1, serialize_game(stored)))
+
+    with (
+        patch("regatta.api.game_state.load_game", load_game),
+        pytest.raises(HTTPException) as error,
+    ):
+        await apply_game_action(GAME_ID, session, RAISE_SPINNAKER)
+
+    assert error.value.status_code == 422
+    load_game.assert_awaited_once()
+    session.execute.assert_not_awaited()
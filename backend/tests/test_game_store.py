@@ -0,0 +1,142 @@
+import json
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql
+
+from regatta.db.game_store import append_action, list_games, state_update
+from regatta.db.models import GameRow
+from regatta.models.position import Position
+from regatta.models.wind import Heading
+from regatta.models.yacht import Yacht
+from regatta.serialization.game_serializer import serialize_game
+from tests.test_game_actions import make_game
+
+
+def compile_update(old: dict, new: dict):
+    statement = update(GameRow).values(state=state_update(old, new))
+    return statement.compile(dialect=postgresql.dialect())
+
+
+def game_with_track(length: int, extra_yachts: int = 0) -> dict:
+    history = [Position(x, 0) for x in range(length)]
+    yachts = {"player_1": Yacht(history[-1], Heading.EAST, position_history=history)}
+    for i in range(extra_yachts):
+        position = Position(i, 5)
+        yachts[f"player_{i + 2}"] = Yacht(
+            position, Heading.EAST, position_history=[position]
+        )
+    return serialize_game(make_game(yachts=yachts, legs_remaining=3))
+
+
+def sail_one_leg(state: dict) -> dict:
+    yacht = state["yachts"]["player_1"]
+    runs = yacht["position_history"]["runs"]
+    moved_yacht = {
+        **yacht,
+        "position": {"x": yacht["position"]["x"] + 1, "y": 0},
+        "position_history": {
+            **yacht["position_history"],
+            "runs": [*runs[:-1], runs[-1] + 1],
+        },
+    }
+    return {
+        **state,
+        "legs_remaining": state["legs_remaining"] - 1,
+        "yachts": {**state["yachts"], "player_1": moved_yacht},
+    }
+
+
+def bound_bytes(old: dict, new: dict) -> int:
+    return len(json.dumps(compile_update(old, new).params, default=str))
+
+
+def test_update_size_does_not_grow_with_history_or_fleet():
+    short_race = game_with_track(100)
+    long_race = game_with_track(900)
+    big_fleet = game_with_track(100, extra_yachts=20)
+
+    baseline = bound_bytes(short_race, sail_one_leg(short_race))
+
+    assert bound_bytes(long_race, sail_one_leg(long_race)) == baseline
+    assert bound_bytes(big_fleet, sail_one_leg(big_fleet)) == baseline
+
+
+def test_track_growth_is_a_trim_and_append():
+    old = game_with_track(3)
+
+    sql = str(compile_update(old, sail_one_leg(old)))
+
+    assert "games.state #> " in sql
+    assert "- %(param_" in sql
+    assert sql.count("jsonb_set") == 2
+
+
+def test_new_yacht_is_set_whole():
+    old = game_with_track(3)
+    position = Position(1, 5)
+    new_yacht = serialize_game(
+        make_game(yachts={"player_2": Yacht(position, Heading.EAST)})
+    )["yachts"]["player_2"]
+    new = {**old, "yachts": {**old["yachts"], "player_2": new_yacht}}
+
+    compiled = compile_update(old, new)
+
+    assert str(compiled).count("jsonb_set") == 1
+    assert new_yacht in compiled.params.values()
+    assert ["yachts", "player_2"] in compiled.params.values()
+
+
+def test_unchanged_state_is_left_alone():
+    state = game_with_track(3)
+
+    assert str(compile_update(state, state)).startswith(
+        "UPDATE games SET state=games.state,"
+    )
+
+
+STORED = {"phase": "RACING", "players": ["p1"], "legs_remaining": 3, "yachts": {}}
+CURRENT = {"phase": "RACING", "players": ["p1"], "legs_remaining": 2, "yachts": {}}
+
+
+async def append(rowcount: int, expected_version: int) -> dict | None:
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock(rowcount=rowcount))
+    return await append_action(
+        db,
+        uuid.uuid4(),
+        expected_version,
+        {"type": "end_turn", "seed": 1},
+        CURRENT,
+        STORED,
+        snapshot_interval=20,
+    )
+
+
+async def test_append_action_reports_version_conflicts():
+    assert await append(rowcount=0, expected_version=3) is None
+
+
+async def test_append_action_keeps_the_snapshot_between_intervals():
+    assert await append(rowcount=1, expected_version=3) == STORED
+
+
+async def test_append_action_snapshots_on_the_interval():
+    assert await append(rowcount=1, expected_version=19) == CURRENT
+
+
+async def test_list_games_seeks_past_the_cursor():
+    db = MagicMock()
+    db.execute = AsyncMock()
+    cursor = (datetime(2026, 1, 1, tzinfo=UTC), uuid.uuid4())
+
+    await list_games(db, limit=21, phase="LOBBY", after=cursor)
+
+    sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "games.phase = " in sql
+    assert "(games.created_at, games.id) < " in sql
+    assert sql.endswith(
+        "ORDER BY games.created_at DESC, games.id DESC \n LIMIT %(param_3)s"
+    )
@@ -0,0 +1,45 @@
+import random
+
+from regatta.core.geometry import convex_hull, extend_hull, is_strictly_inside_hull
+from regatta.models.position import Position
+
+
+def test_convex_hull_drops_interior_and_collinear_points():
+    points = [Position(0, 0), Position(2, 0), Position(4, 0), Position(2, 2)]
+    points += [Position(4, 4), Position(0, 4)]
+
+    assert set(convex_hull(points)) == {
+        Position(0, 0),
+        Position(4, 0),
+        Position(4, 4),
+        Position(0, 4),
+    }
+
+
+def test_is_strictly_inside_hull_excludes_boundary():
+    hull = convex_hull([Position(0, 0), Position(4, 0), Position(4, 4), Position(0, 4)])
+
+    assert is_strictly_inside_hull(hull, Position(2, 2))
+    assert not is_strictly_inside_hull(hull, Position(2, 0))
+    assert not is_strictly_inside_hull(hull, Position(5, 5))
+
+
+def test_extend_hull_matches_full_recomputation():
+    rng = random.Random(7)
+    points: list[Position] = []
+    hull: tuple[Position, ...] = ()
+
+    for _ in range(500):
+        point = Position(rng.randint(0, 27), rng.randint(0, 19))
+        points.append(point)
+        hull = extend_hull(hull, point)
+
+        assert hull == tuple(convex_hull(points))
+
+
+def test_extend_hull_keeps_hull_for_interior_point():
+    hull = tuple(
+        convex_hull([Position(0, 0), Position(4, 0), Position(4, 4), Position(0, 4)])
+    )
+
+    assert extend_hull(hull, Position(2, 2)) is hull
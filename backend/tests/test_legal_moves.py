@@ -0,0 +1,109 @@
+from unittest.mock import patch
+
+import pytest
+
+from regatta.core.game_actions import move_leg
+from regatta.core.legal_moves import list_legal_actions
+from regatta.models.game import GamePhase
+from regatta.models.position import Position
+from regatta.models.wind import Heading
+from regatta.models.yacht import Yacht
+from tests.test_game_actions import make_game, make_racing_game
+
+
+def moves_by_heading(game):
+    return {move.heading: move for move in list_legal_actions(game).moves}
+
+
+def test_moves_agree_with_move_leg():
+    game = make_racing_game(Position(5, 3), Heading.NORTH, legs=3)
+
+    for heading, move in moves_by_heading(game).items():
+        try:
+            expected = move_leg(game, "player_1", heading).yachts["player_1"].position
+        except ValueError:
+            expected = None
+        assert move.destination == expected
+        assert move.legal == (expected is not None)
+
+
+def test_sailing_into_the_wind_is_explained():
+    game = make_racing_game(Position(5, 3), Heading.NORTH)
+
+    into_the_wind = moves_by_heading(game)[Heading.EAST]
+
+    assert not into_the_wind.legal
+    assert into_the_wind.reason == "Cannot sail directly into the wind"
+    assert into_the_wind.speed == 0
+
+
+def test_right_of_way_violations_are_flagged():
+    # Wind EAST. player_1 on port tack would land where starboard-tack
+    # player_2 sails next.
+    game = make_game(
+        phase=GamePhase.RACING,
+        setup_order=["player_1"],
+        legs_remaining=1,
+        yachts={
+            "player_1": Yacht(Position(3, 2), Heading.SOUTH_EAST),
+            "player_2": Yacht(Position(5, 4), Heading.NORTH_WEST),
+        },
+    )
+
+    move = moves_by_heading(game)[Heading.SOUTH_EAST]
+
+    assert not move.legal
+    assert move.reason.startswith("Right-of-way violation")
+    assert move.tack == "port"
+
+
+def test_maneuvers_cost_an_extra_leg():
+    game = make_racing_game(Position(5, 3), Heading.NORTH_EAST)
+
+    moves = moves_by_heading(game)
+
+    assert moves[Heading.NORTH_EAST].leg_cost == 1
+    assert moves[Heading.SOUTH_EAST].maneuver == "tack"
+    assert moves[Heading.SOUTH_EAST].leg_cost == 2
+
+
+def test_spinnaker_effect_is_reported():
+    game = make_racing_game(Position(5, 3), Heading.WEST)
+
+    downwind = moves_by_heading(game)[Heading.WEST]
+
+    assert downwind.toggled_spinnaker_speed == downwind.speed + 1
+
+
+def test_last_leg_dry_runs_do_not_roll_dice():
+    game = make_racing_game(Position(5, 3), Heading.NORTH, legs=1)
+
+    with patch("regatta.core.game_actions.random.randint") as roll:
+        legal_actions = list_legal_actions(game)
+
+    roll.assert_not_called()
+    assert any(move.legal for move in legal_actions.moves)
+    assert legal_actions.can_lower_spinnaker is False
+
+
+def test_no_legs_left_only_allows_end_turn():
+    game = make_racing_game(Position(5, 3), Heading.NORTH, legs=0)
+
+    legal_actions = list_legal_actions(game)
+
+    assert not any(move.legal for move in legal_actions.moves)
+    assert legal_actions.can_end_turn
+
+
+def test_puff_targets_are_listed():
+    game = make_racing_game(Position(0, 3), Heading.NORTH)
+
+    puffs = {puff.direction: puff for puff in list_legal_actions(game).puffs}
+
+    assert puffs[Heading.EAST].destination == Position(1, 3)
+    assert not puffs[Heading.WEST].legal
+
+
+def test_only_racing_games_have_legal_actions():
+    with pytest.raises(ValueError, match="Must be in RACING phase"):
+        list_legal_actions(make_game())
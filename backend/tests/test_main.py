@@ -0,0 +1,31 @@
+import uuid
+
+from starlette.testclient import TestClient
+
+from regatta.api.auth import create_access_token
+from regatta.cache.game_cache import game_cache
+from regatta.main import app
+from regatta.models.position import Position
+from regatta.models.wind import Heading
+from regatta.serialization.game_serializer import serialize_game
+from tests.test_game_actions import make_racing_game
+
+
+def test_planner_pool_is_usable_in_every_lifespan():
+    game_id = str(uuid.uuid4())
+    game = make_racing_game(Position(5, 5), Heading.NORTH)
+    payload = serialize_game(game)
+    headers = {"Authorization": f"Bearer {create_access_token()}"}
+
+    try:
+        for _ in range(2):
+            # Each lifespan gets a fresh entry, so the search runs every time.
+            game_cache.put(game_id, game, payload, 1, payload)
+            with TestClient(app) as client:
+                response = client.get(
+                    f"/games/{game_id}/reachable-cells", headers=headers
+                )
+            assert response.status_code == 200, response.text
+            assert response.json()["player_id"] == "player_1"
+    finally:
+        game_cache.invalidate(game_id)
@@ -1,6 +1,6 @@
 import pytest
 
-from regatta.models.position import Position, calculate_next_position
+from regatta.models.position import Position, calculate_next_position, get_position
 from regatta.models.wind import Heading
 
 
@@ -20,3 +20,14 @@ from regatta.models.wind import Heading
 )
 def test_calculate_next_position(input_a, input_b, expected):
     assert calculate_next_position(input_a, input_b) == expected
+
+
+def test_get_position_is_interned():
+    assert get_position(3, 4) == Position(3, 4)
+    assert get_position(3, 4) is get_position(3, 4)
+
+
+def test_calculate_next_position_reuses_pooled_positions():
+    first = calculate_next_position(Position(0, 0), Heading.EAST)
+    second = calculate_next_position(Position(2, 0), Heading.WEST)
+    assert first is second
@@ -0,0 +1,94 @@
+from dataclasses import replace
+from unittest.mock import patch
+
+import pytest
+
+from regatta.core.game_actions import raise_spinnaker
+from regatta.core.legal_moves import list_legal_actions, reachable_cells
+from regatta.models.position import Position
+from regatta.models.wind import Heading
+from regatta.models.yacht import Yacht
+from tests.test_game_actions import make_game, make_racing_game
+
+
+def move_destinations(game):
+    return {move.destination for move in list_legal_actions(game).moves if move.legal}
+
+
+def without_puffs(game):
+    yacht = game.yachts["player_1"]
+    return replace(game, yachts={"player_1": replace(yacht, puff_count=0)})
+
+
+def test_last_leg_reaches_every_move_with_or_without_the_spinnaker():
+    game = without_puffs(make_racing_game(Position(5, 3), Heading.NORTH, legs=1))
+
+    reachable = reachable_cells(game)
+
+    # Raising and then lowering the spinnaker spends the leg without moving.
+    expected = (
+        move_destinations(game)
+        | move_destinations(raise_spinnaker(game, "player_1"))
+        | {Position(5, 3)}
+    )
+    assert reachable.player_id == "player_1"
+    assert reachable.cells == expected
+    assert not reachable.can_finish
+
+
+def test_the_puff_can_be_used_before_any_leg():
+    game = make_racing_game(Position(5, 3), Heading.NORTH, legs=1)
+    puffed_first = without_puffs(make_racing_game(Position(4, 3), Heading.NORTH, 1))
+
+    assert move_destinations(puffed_first) <= reachable_cells(game).cells
+
+
+def test_more_legs_reach_further():
+    one_leg = reachable_cells(make_racing_game(Position(1, 3), Heading.NORTH, 1))
+    two_legs = reachable_cells(make_racing_game(Position(1, 3), Heading.NORTH, 2))
+
+    assert max(cell.x for cell in two_legs.cells) > max(
+        cell.x for cell in one_leg.cells
+    )
+
+
+def test_a_turn_without_legs_can_only_puff():
+    game = make_racing_game(Position(5, 3), Heading.NORTH, legs=0)
+
+    assert reachable_cells(game).cells == {
+        Position(5, 3),
+        Position(4, 3),
+        Position(6, 3),
+        Position(5, 4),
+        Position(4, 4),
+        Position(6, 4),
+        Position(4, 2),
+        Position(6, 2),
+    }
+
+
+def test_finishing_the_race_is_reported():
+    yacht = Yacht(
+        Position(4, 4), Heading.SOUTH, marks_rounded=frozenset({Position(5, 2)})
+    )
+    game = make_racing_game(Position(4, 4), Heading.SOUTH, legs=1)
+    game = replace(game, yachts={"player_1": yacht})
+
+    reachable = reachable_cells(game)
+
+    assert reachable.can_finish
+    assert Position(4, 5) in reachable.cells
+
+
+def test_search_does_not_roll_dice():
+    game = make_racing_game(Position(5, 3), Heading.NORTH, legs=3)
+
+    with patch("regatta.core.game_actions.random.randint") as roll:
+        reachable_cells(game)
+
+    roll.assert_not_called()
+
+
+def test_only_racing_games_have_reachable_cells():
+    with pytest.raises(ValueError, match="Must be in RACING phase"):
+        reachable_cells(make_game())
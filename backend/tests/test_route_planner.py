@@ -0,0 +1,127 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from unittest.mock import patch
+
+from regatta.core.game_actions import lower_spinnaker, move_leg, raise_spinnaker
+from regatta.core.route_planner import (
+    Course,
+    _encloses,
+    plan_route,
+    plan_route_async,
+)
+from regatta.models.board import Board, Grid
+from regatta.models.game import Game, GamePhase
+from regatta.models.position import Position
+from regatta.models.track import Track
+from regatta.models.wind import Heading, WindDirection
+from regatta.models.yacht import Yacht
+
+BOARD = Board(
+    Grid(12, 10),
+    course_marks=[Position(6, 2)],
+    starting_line=(Position(3, 9), Position(9, 9)),
+)
+
+ACTIONS = {
+    "move_leg": lambda game, step: move_leg(game, "player_1", step.heading),
+    "raise_spinnaker": lambda game, _: raise_spinnaker(game, "player_1"),
+    "lower_spinnaker": lambda game, _: lower_spinnaker(game, "player_1"),
+}
+
+
+def sail(route, wind: WindDirection, yacht: Yacht) -> Game:
+    """Plays the route through the real game actions."""
+    game = Game(
+        id="route",
+        board=BOARD,
+        wind_direction=wind,
+        phase=GamePhase.RACING,
+        setup_order=["player_1"],
+        legs_remaining=1_000,
+        yachts={"player_1": yacht},
+    )
+    for step in route.steps:
+        game = ACTIONS[step.action](game, step)
+        assert game.yachts["player_1"].position == step.position
+    return game
+
+
+def fresh_yacht(position: Position, wind: WindDirection) -> Yacht:
+    return Yacht(position, wind.opposite(), position_history=Track((position,)))
+
+
+def test_planned_routes_win_the_race_in_the_planned_legs():
+    for wind in (WindDirection.NORTH, WindDirection.EAST, WindDirection.SOUTH):
+        route = plan_route(BOARD, wind)
+
+        game = sail(route, wind, fresh_yacht(route.start, wind))
+
+        assert game.winner == "player_1"
+        assert 1_000 - game.legs_remaining == route.legs
+        assert route.legs == sum(step.legs for step in route.steps)
+
+
+def test_route_from_a_yacht_mid_race():
+    wind = WindDirection.EAST
+    track = Track(
+        (Position(6, 8), Position(6, 5), Position(4, 3), Position(5, 1))
+        + (Position(7, 1), Position(8, 3), Position(8, 4), Position(8, 5))
+    )
+    yacht = Yacht(
+        Position(8, 5),
+        Heading.SOUTH,
+        marks_rounded=frozenset({Position(6, 2)}),
+        position_history=track,
+    )
+
+    route = plan_route(BOARD, wind, yacht)
+
+    # Spinnaker up, then one broad reach of four cells onto the line.
+    assert route.start == Position(8, 5)
+    assert route.legs == 1
+    assert route.steps[-1].position == Position(4, 9)
+    assert sail(route, wind, yacht).winner == "player_1"
+
+
+def test_a_mark_is_rounded_only_once_the_track_surrounds_it():
+    east, north, west, south = 1, 2, 4, 8
+    north_east, north_west, south_west, south_east = 16, 32, 64, 128
+
+    assert _encloses(east | north | west | south)
+    assert _encloses(north | south_west | south_east)
+    assert not _encloses(north_east | north_west)
+    assert not _encloses(east | west | north)
+    assert not _encloses(north_east | south_west)
+
+
+def test_routes_are_cached_per_course_and_wind():
+    other_game_board = replace(BOARD, course_marks=list(BOARD.course_marks))
+
+    first = plan_route(BOARD, WindDirection.WEST)
+
+    assert plan_route(other_game_board, WindDirection.WEST) is first
+    assert plan_route(Course.from_board(BOARD), WindDirection.WEST) is first
+
+
+def test_a_yacht_keeping_to_its_route_is_not_searched_again():
+    wind = WindDirection.SOUTH
+    route = plan_route(BOARD, wind)
+    first_steps = replace(route, steps=route.steps[:2])
+    yacht = sail(first_steps, wind, fresh_yacht(route.start, wind)).yachts["player_1"]
+
+    with patch("regatta.core.route_planner._search") as search:
+        rest = plan_route(BOARD, wind, yacht)
+
+    search.assert_not_called()
+    assert rest.steps == route.steps[2:]
+    assert rest.legs == route.legs - sum(step.legs for step in route.steps[:2])
+
+
+async def test_routes_can_be_planned_in_a_process_pool():
+    course = Course(10, 8, (Position(5, 2),), (Position(2, 7), Position(7, 7)))
+
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        route = await plan_route_async(pool, course, WindDirection.NORTH_EAST)
+
+    assert route == plan_route(course, WindDirection.NORTH_EAST)
+    assert route.legs > 0
@@ -1,5 +1,11 @@
 import json
 
+import pytest
+
+from regatta.models.game import Game
+from regatta.models.position import Position
+from regatta.models.wind import Heading
+from regatta.models.yacht import Yacht
 from regatta.serialization.game_serializer import deserialize_game, serialize_game
 from tests.test_game_actions import make_game
 
@@ -16,3 +22,51 @@ def test_round_trip():
 def test_serialized_form_is_json_compatible():
     game = make_game()
     json.dumps(serialize_game(game))  # raises if not JSON-safe
+
+
+def make_game_with_track(history: list[Position]) -> Game:
+    return make_game(
+        yachts={"player_1": Yacht(history[-1], Heading.EAST, position_history=history)}
+    )
+
+
+def test_track_round_trip_with_jumps():
+    history = [Position(3, 5), Position(3, 4), Position(3, 3), Position(6, 1)]
+    game = make_game_with_track(history)
+
+    serialized_game = serialize_game(game)
+
+    assert serialized_game["yachts"]["player_1"]["position_history"] == {
+        "version": 1,
+        "runs": [3, 5, 0, -1, 2, 3, -2, 1],
+    }
+    assert deserialize_game(serialized_game) == game
+
+
+def test_straight_track_collapses_to_one_run():
+    history = [Position(0, y) for y in range(20)]
+    serialized_game = serialize_game(make_game_with_track(history))
+
+    runs = serialized_game["yachts"]["player_1"]["position_history"]["runs"]
+
+    assert runs == [0, 0, 0, 1, 19]
+
+
+def test_deserializes_legacy_track_format():
+    history = [Position(3, 5), Position(4, 4)]
+    game = make_game_with_track(history)
+    serialized_game = serialize_game(game)
+    serialized_game["yachts"]["player_1"]["position_history"] = [
+        {"x": 3, "y": 5},
+        {"x": 4, "y": 4},
+    ]
+
+    assert deserialize_game(serialized_game) == game
+
+
+def test_rejects_unknown_track_format_version():
+    serialized_game = serialize_game(make_game_with_track([Position(3, 5)]))
+    serialized_game["yachts"]["player_1"]["position_history"]["version"] = 99
+
+    with pytest.raises(ValueError, match="Unsupported track format"):
+        deserialize_game(serialized_game)
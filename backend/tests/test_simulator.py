@@ -0,0 +1,107 @@
+import random
+from unittest.mock import patch
+
+import pytest
+
+from regatta.core.action_log import apply_action
+from regatta.core.course import generate_board
+from regatta.models.game import GamePhase
+from regatta.sim.simulator import (
+    RaceResult,
+    SimulationStats,
+    run_simulation,
+    simulate_race,
+)
+
+
+def test_races_are_reproducible_from_their_seed():
+    assert simulate_race(7, players=3) == simulate_race(7, players=3)
+    assert generate_board(random.Random(7)) == generate_board(random.Random(7))
+
+
+def test_greedy_race_finishes():
+    result = simulate_race(1, players=2)
+
+    assert not result.stalled
+    assert result.winner in result.starts
+    assert result.turns > 0
+    assert sorted(result.starts) == ["player_1", "player_2"]
+
+
+def test_seats_in_a_round_share_one_roll():
+    actions: list[str] = []
+    # (round, seat, legs_per_turn) whenever a new turn begins.
+    turns: list[tuple[int, int, int]] = []
+
+    def play(game, action):
+        actions.append(action["type"])
+        after = apply_action(game, action)
+        if after.phase == GamePhase.RACING and (
+            game.phase != GamePhase.RACING
+            or after.current_player_index != game.current_player_index
+        ):
+            rounds = turns[-1][0] if turns else 0
+            if turns and after.current_player_index == 0:
+                rounds += 1
+            turns.append((rounds, after.current_player_index, after.legs_per_turn))
+        return after
+
+    with patch("regatta.sim.simulator.apply_action", side_effect=play):
+        simulate_race(5, players=3)
+
+    rolls: dict[int, set[int]] = {}
+    for rounds, _, legs_per_turn in turns:
+        rolls.setdefault(rounds, set()).add(legs_per_turn)
+    assert len(rolls) > 1
+    assert all(len(roll) == 1 for roll in rolls.values())
+    assert actions.count("start_round") == 0
+
+
+def test_seats_take_policies_in_turn():
+    result = simulate_race(3, players=3, policies=("greedy", "random"))
+
+    assert result.policies == {
+        "player_1": "greedy",
+        "player_2": "random",
+        "player_3": "greedy",
+    }
+
+
+def test_stats_aggregate_results():
+    stats = SimulationStats()
+    for winner, turns in (("a", 20), (None, 40)):
+        stats.add(
+            RaceResult(
+                seed=0,
+                winner=winner,
+                starts={"a": 3, "b": 5},
+                policies={"a": "greedy", "b": "random"},
+                turns=turns,
+                blanketed_turns=3,
+                partially_blanketed_turns=0,
+                stalled=winner is None,
+            )
+        )
+
+    summary = stats.summary()
+
+    assert summary["races"] == 2
+    assert summary["finished"] == 1
+    assert summary["stalled"] == 1
+    assert summary["race_length_rounds"]["mean"] == 10
+    assert summary["win_rate_by_start"] == {3: 0.5, 5: 0.0}
+    assert summary["win_rate_by_policy"] == {"greedy": 0.5, "random": 0.0}
+    assert summary["blanketed_turn_rate"] == 0.1
+
+
+def test_worker_processes_give_the_same_stats():
+    in_process = run_simulation(4, seed=10, workers=1)
+    pooled = run_simulation(4, seed=10, workers=2)
+
+    assert pooled == in_process
+    assert pooled.races == 4
+
+
+def test_unknown_policies_are_rejected():
+    with pytest.raises(ValueError, match="Unknown policies: bogus"):
+        run_simulation(1, policies=["bogus"])
@@ -0,0 +1,73 @@
+from unittest.mock import patch
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from regatta.api.auth import create_access_token, decode_token
+from regatta.cache.token_cache import TokenCache, token_cache
+from tests.test_game_cache import FakeClock
+
+
+def test_get_miss_then_hit():
+    cache = TokenCache(max_size=2)
+    claims = {"sub": "player", "exp": 2_000_000_000}
+
+    assert cache.get("token_1") is None
+    cache.put("token_1", claims)
+
+    assert cache.get("token_1") == claims
+    assert cache.stats()["hit_rate"] == 0.5
+
+
+def test_entries_expire_at_the_exp_claim():
+    clock = FakeClock()
+    cache = TokenCache(max_size=2, clock=clock)
+    cache.put("token_1", {"exp": 100})
+
+    clock.now = 99.0
+    assert cache.get("token_1") is not None
+    clock.now = 100.0
+    assert cache.get("token_1") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_least_recently_used_token_is_evicted():
+    cache = TokenCache(max_size=2)
+    for token in ["token_1", "token_2"]:
+        cache.put(token, {"exp": 2_000_000_000})
+    cache.get("token_1")
+
+    cache.put("token_3", {"exp": 2_000_000_000})
+
+    assert cache.get("token_2") is None
+    assert cache.get("token_1") is not None
+
+
+def test_tokens_without_exp_are_not_cached():
+    cache = TokenCache(max_size=2)
+
+    cache.put("token_1", {"sub": "player"})
+
+    assert cache.stats()["size"] == 0
+
+
+def test_decode_token_verifies_each_token_once():
+    token_cache.clear()
+    token = create_access_token()
+
+    with patch("regatta.api.auth.jwt.decode", wraps=jwt.decode) as verify:
+        first = decode_token(token)
+        second = decode_token(token)
+
+    assert first == second
+    verify.assert_called_once()
+
+
+def test_invalid_tokens_are_rejected_and_not_cached():
+    token_cache.clear()
+
+    with pytest.raises(HTTPException):
+        decode_token("not-a-token")
+
+    assert token_cache.stats()["size"] == 0
@@ -0,0 +1,53 @@
+import pytest
+
+from regatta.models.position import Position
+from regatta.models.track import Track
+
+
+def test_track_sequence_protocol():
+    track = Track([Position(1, 2), Position(3, 4)])
+
+    assert len(track) == 2
+    assert track[0] == Position(1, 2)
+    assert track[-1] == Position(3, 4)
+    assert list(track) == [Position(1, 2), Position(3, 4)]
+    assert list(track.coordinates()) == [(1, 2), (3, 4)]
+
+    with pytest.raises(IndexError):
+        track[2]
+
+
+def test_append_leaves_snapshot_unchanged():
+    original = Track([Position(0, 0)])
+    extended = original.append(Position(1, 1))
+
+    assert list(original) == [Position(0, 0)]
+    assert list(extended) == [Position(0, 0), Position(1, 1)]
+
+
+def test_append_to_older_snapshot_branches():
+    base = Track([Position(0, 0)])
+    first = base.append(Position(1, 1))
+    second = base.append(Position(2, 2))
+
+    assert list(first) == [Position(0, 0), Position(1, 1)]
+    assert list(second) == [Position(0, 0), Position(2, 2)]
+
+
+def test_track_equality_and_hash():
+    built = Track().append(Position(1, 1)).append(Position(2, 2))
+    packed = Track.from_coordinates([(1, 1), (2, 2)])
+
+    assert built == packed
+    assert hash(built) == hash(packed)
+    assert built != Track([Position(1, 1)])
+
+
+def test_track_packed_round_trip():
+    track = Track([Position(1, 2), Position(3, 4)])
+
+    assert list(track.packed()) == [1, 2, 3, 4]
+    assert Track.from_packed(track.packed()) == track
+
+    with pytest.raises(ValueError, match="x/y pairs"):
+        Track.from_packed([1, 2, 3])
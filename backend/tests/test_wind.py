@@ -4,8 +4,12 @@ from regatta.models.wind import (
     Heading,
     PointOfSail,
     WindDirection,
+    _compute_maneuver,
+    _compute_point_of_sail,
+    _compute_tack,
     detect_maneuver,
     get_point_of_sail,
+    get_speed,
     get_tack,
 )
 
@@ -109,3 +113,32 @@ def test_detect_maneuver_beating_to_beating():
         detect_maneuver(WindDirection.NORTH, Heading.NORTH_WEST, Heading.NORTH_EAST)
         == "tack"
     )
+
+
+@pytest.mark.parametrize(
+    "heading,spinnaker,expected",
+    [
+        (Heading.NORTH, True, 0),  # luffing — spinnaker does not help
+        (Heading.NORTH_EAST, True, 1),  # beating
+        (Heading.EAST, True, 2),  # beam reach
+        (Heading.SOUTH_EAST, False, 3),  # broad reach
+        (Heading.SOUTH_EAST, True, 4),  # broad reach + spinnaker
+        (Heading.SOUTH, False, 2),  # running
+        (Heading.SOUTH, True, 3),  # running + spinnaker
+    ],
+)
+def test_get_speed(heading, spinnaker, expected):
+    assert get_speed(WindDirection.NORTH, heading, spinnaker) == expected
+
+
+def test_lookup_tables_match_arithmetic():
+    for wind in WindDirection:
+        for heading in Heading:
+            assert get_point_of_sail(wind, heading) == _compute_point_of_sail(
+                wind, heading
+            )
+            assert get_tack(wind, heading) == _compute_tack(wind, heading)
+            for new_heading in Heading:
+                assert detect_maneuver(wind, heading, new_heading) == (
+                    _compute_maneuver(wind, heading, new_heading)
+                )
@@ -1,23 +1,209 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 from starlette.testclient import TestClient
 
 from regatta.api.auth import create_access_token
+from regatta.api.deps import get_db
+from regatta.cache.game_cache import game_cache
+from regatta.db.game_store import StoredGame
 from regatta.main import app
-from regatta.ws.connection_manager import connection_manager
+from regatta.models.position import Position
+from regatta.models.wind import Heading
+from regatta.serialization.game_serializer import serialize_game
+from regatta.ws.connection_manager import VersionedState, connection_manager
+from tests.test_game_actions import make_racing_game
 
 
 def test_ws_connect():
     token = create_access_token()
-    with TestClient(app) as client, client.websocket_connect(
-        f"/games/mock_game_id/ws?token={token}"
+    with (
+        TestClient(app) as client,
+        client.websocket_connect(f"/games/mock_game_id/ws?token={token}"),
     ):
         assert "mock_game_id" in connection_manager.active_connections
 
 
 def test_ws_disconnect():
     token = create_access_token()
-    with TestClient(app) as client, client.websocket_connect(
-        f"/games/mock_game_id/ws?token={token}"
+    with (
+        TestClient(app) as client,
+        client.websocket_connect(f"/games/mock_game_id/ws?token={token}"),
     ):
         pass
 
     assert connection_manager.active_connections["mock_game_id"] == []
+
+
+def test_ws_snapshot_request():
+    token = create_access_token()
+    with (
+        TestClient(app) as client,
+        client.websocket_connect(f"/games/mock_game_id/ws?token={token}") as connection,
+    ):
+        connection_manager.latest_states["mock_game_id"] = VersionedState(
+            7, {"phase": "LOBBY"}
+        )
+        connection.send_text('{"type": "snapshot"}')
+
+        assert connection.receive_json() == {
+            "type": "snapshot",
+            "version": 7,
+            "state": {"phase": "LOBBY"},
+        }
+
+
+GAME_ID = "3b8e5f0e-2f4c-4a8e-9a57-0c1f3d6f8b21"
+
+
+@pytest.fixture
+def cached_racing_game():
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock(rowcount=1))
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+
+    async def override_get_db():
+        yield session
+
+    game = make_racing_game(Position(5, 5), Heading.NORTH)
+    game_cache.put(GAME_ID, game, serialize_game(game), 1, serialize_game(game))
+    app.dependency_overrides[get_db] = override_get_db
+    yield session
+    app.dependency_overrides.clear()
+    game_cache.invalidate(GAME_ID)
+
+
+def receive_reply(connection) -> dict:
+    # State patches for the same game may arrive before or after the reply.
+    while True:
+        frame = connection.receive_json()
+        if frame["type"] in ("ack", "error"):
+            return frame
+
+
+def test_ws_command_is_acked(cached_racing_game):
+    token = create_access_token()
+    with (
+        TestClient(app) as client,
+        client.websocket_connect(f"/games/{GAME_ID}/ws?token={token}") as connection,
+    ):
+        connection.send_json(
+            {
+                "type": "command",
+                "request_id": "r1",
+                "player_id": "player_1",
+                "action": {"type": "raise_spinnaker"},
+            }
+        )
+
+        assert receive_reply(connection) == {
+            "type": "ack",
+            "request_id": "r1",
+            "version": 2,
+        }
+    cached_racing_game.commit.assert_awaited_once()
+    assert game_cache.get(GAME_ID).game.yachts["player_1"].spinnaker
+
+
+def test_ws_rejected_command_returns_error_frame(cached_racing_game):
+    token = create_access_token()
+    game = game_cache.get(GAME_ID).game
+    stored_game = StoredGame(game, 1, serialize_game(game))
+    with (
+        TestClient(app) as client,
+        client.websocket_connect(f"/games/{GAME_ID}/ws?token={token}") as connection,
+        patch("regatta.api.game_state.load_game", AsyncMock(return_value=stored_game)),
+    ):
+        connection.send_json(
+            {
+                "type": "command",
+                "request_id": "r2",
+                "player_id": "player_2",
+                "action": {"type": "move_leg", "heading": 0},
+            }
+        )
+
+        assert receive_reply(connection) == {
+            "type": "error",
+            "request_id": "r2",
+            "status": 422,
+            "detail": "It is not player_id player_2's turn",
+        }
+    cached_racing_game.commit.assert_not_awaited()
+
+
+def test_ws_malformed_command_returns_error_frame(cached_racing_game):
+    token = create_access_token()
+    with (
+        TestClient(app) as client,
+        client.websocket_connect(f"/games/{GAME_ID}/ws?token={token}") as connection,
+    ):
+        connection.send_json(
+            {"type": "command", "request_id": "r3", "action": {"type": "fly"}}
+        )
+
+        reply = receive_reply(connection)
+        assert reply["request_id"] == "r3"
+        assert reply["status"] == 422
+
+
+def test_ws_is_unregistered_when_the_handler_fails(cached_racing_game):
+    token = create_access_token()
+    failing_command = AsyncMock(side_effect=RuntimeError("boom"))
+    with (
+        patch("regatta.api.routes.ws._run_command", failing_command),
+        pytest.raises(RuntimeError),
+        TestClient(app) as client,
+        client.websocket_connect(f"/games/{GAME_ID}/ws?token={token}") as connection,
+    ):
+        connection.send_json({"type": "command", "request_id": "r4"})
+        connection.receive_json()
+
+    assert connection_manager.active_connections[GAME_ID] == []
+
+
+def test_ws_command_for_a_malformed_game_id_is_not_found():
+    token = create_access_token()
+    with (
+        TestClient(app) as client,
+        client.websocket_connect(f"/games/mock_game_id/ws?token={token}") as connection,
+    ):
+        connection.send_json(
+            {
+                "type": "command",
+                "request_id": "r5",
+                "player_id": "player_1",
+                "action": {"type": "raise_spinnaker"},
+            }
+        )
+
+        assert receive_reply(connection) == {
+            "type": "error",
+            "request_id": "r5",
+            "status": 404,
+            "detail": "Not Found",
+        }
+
+
+def test_ws_failed_load_rolls_back_the_session(cached_racing_game):
+    token = create_access_token()
+    game_cache.invalidate(GAME_ID)
+    failing_load = AsyncMock(side_effect=ValueError("corrupt state"))
+    with (
+        patch("regatta.api.game_state.load_game", failing_load),
+        pytest.raises(ValueError, match="corrupt state"),
+        TestClient(app) as client,
+        client.websocket_connect(f"/games/{GAME_ID}/ws?token={token}") as connection,
+    ):
+        connection.send_json(
+            {
+                "type": "command",
+                "request_id": "r6",
+                "player_id": "player_1",
+                "action": {"type": "raise_spinnaker"},
+            }
+        )
+        connection.receive_json()
+
+    cached_racing_game.rollback.assert_awaited_once()
@@ -39,3 +39,9 @@ def test_with_puff_count():
     assert original.puff_count == 2
     assert updated.puff_count == 0
     assert original is not updated
+
+
+def test_yacht_is_slotted():
+    yacht = Yacht(Position(0, 0), Heading.SOUTH)
+    assert not hasattr(yacht, "__dict__")
+    assert not hasattr(yacht.position, "__dict__")
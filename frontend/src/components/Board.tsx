@@ -8,6 +8,7 @@ export interface BoardProps {
   marksRounded?: { x: number; y: number }[];
   cellSize?: number;
   previewPath?: { from: { x: number; y: number }; to: { x: number; y: number } } | null;
+  reachableCells?: { x: number; y: number }[];
 }
 
 export const CELL_SIZE = 28;
@@ -26,7 +27,8 @@ export const Board = ({
   highlightedCell,
   marksRounded,
   cellSize,
-  previewPath
+  previewPath,
+  reachableCells
 }: BoardProps) => {
   const canvasRef = useRef<HTMLCanvasElement>(null);
   // Tracks the previous target positions for animation interpolation
@@ -106,6 +108,12 @@ export const Board = ({
         context.stroke();
       });
 
+      // cells the current player can end their turn on
+      context.fillStyle = 'rgba(255, 255, 255, 0.12)';
+      reachableCells?.forEach(({ x, y }) => {
+        context.fillRect(x * cs, y * cs, cs, cs);
+      });
+
       // course marks
       board.course_marks.forEach(({ x, y }) => {
         const rounded = marksRounded?.some((m) => m.x === x && m.y === y) ?? false;
@@ -217,7 +225,15 @@ export const Board = ({
       }
       // If animation is running, the updated drawFnRef will be picked up next frame
     }
-  }, [board, yachts, highlightedCell, marksRounded, previewPath, cellSize]);
+  }, [
+    board,
+    yachts,
+    highlightedCell,
+    marksRounded,
+    previewPath,
+    reachableCells,
+    cellSize
+  ]);
 
   // Cancel animation on unmount
   useEffect(() => {
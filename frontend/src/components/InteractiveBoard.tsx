@@ -17,6 +17,7 @@ export const InteractiveBoard = ({
   marksRounded,
   cellSize,
   previewPath,
+  reachableCells,
   disabled,
   waitingFor
 }: InteractiveBoardProps) => {
@@ -54,6 +55,7 @@ export const InteractiveBoard = ({
         marksRounded={marksRounded}
         cellSize={cellSize}
         previewPath={previewPath}
+        reachableCells={reachableCells}
       />
       <canvas
         style={{ position: 'absolute', top: 0, left: 0, cursor: disabled ? 'default' : 'crosshair' }}
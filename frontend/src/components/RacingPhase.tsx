@@ -1,5 +1,5 @@
 import { useState, useEffect } from 'react';
-import { PhaseProps } from '../types/models';
+import { PhaseProps, ReachableCells } from '../types/models';
 import { YACHT_COLORS } from './Board';
 import { InteractiveBoard } from './InteractiveBoard';
 import { SailCompass } from './SailCompass';
@@ -72,6 +72,30 @@ export const RacingPhase = ({ game, setGame, playerId }: PhaseProps) => {
     y: number;
   } | null>(null);
 
+  const [reachableCells, setReachableCells] = useState<
+    ReachableCells['cells']
+  >([]);
+
+  // Cells this turn can end on; the server caches them per game version
+  useEffect(() => {
+    if (!isMyTurn) {
+      setReachableCells([]);
+      return;
+    }
+
+    let cancelled = false;
+    authFetch(
+      `${import.meta.env.VITE_API_URL}/games/${game.id}/reachable-cells`
+    )
+      .then((response) => (response.ok ? response.json() : null))
+      .then((data: ReachableCells | null) => {
+        if (!cancelled) setReachableCells(data?.cells ?? []);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [game, isMyTurn]);
+
   const [showRules, setShowRules] = useState(false);
   const [puffMode, setPuffMode] = useState(false);
   const [error, setError] = useState<string | null>(null);
@@ -262,6 +286,7 @@ export const RacingPhase = ({ game, setGame, playerId }: PhaseProps) => {
         marksRounded={game.yachts[currentPlayer].marks_rounded}
         cellSize={cellSize}
         previewPath={previewPath}
+        reachableCells={reachableCells}
         disabled={!isMyTurn}
         waitingFor={currentPlayer}
       />
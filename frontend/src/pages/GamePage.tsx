@@ -1,17 +1,19 @@
-import { useEffect, useState } from 'react';
+import { useEffect, useRef, useState } from 'react';
 import { useParams } from 'react-router';
-import { GameResponse } from '../types/models';
+import { GameMessage, GameResponse } from '../types/models';
 import { LobbyPhase } from '../components/LobbyPhase';
 import { Board } from '../components/Board';
 import { SetupPhase } from '../components/SetupPhase';
 import { RacingPhase } from '../components/RacingPhase';
 import { FinishedPhase } from '../components/FinishedPhase';
 import { authFetch } from '../utils/api';
+import { applyGamePatch } from '../utils/gamePatch';
 
 export const GamePage = () => {
   const { gameId } = useParams<{ gameId: string }>();
   const [loading, setLoading] = useState(true);
   const [game, setGame] = useState<GameResponse>();
+  const gameVersion = useRef<number | null>(null);
 
   const errMsg = (gameId: string): string => {
     return `Failed to fetch game with gameId ${gameId}`;
@@ -81,9 +83,32 @@ export const GamePage = () => {
       `${webSocketUrl}/games/${gameId}/ws?token=${token}`
     );
 
+    const requestSnapshot = () => {
+      webSocket.send(JSON.stringify({ type: 'snapshot' }));
+    };
+
+    webSocket.onopen = requestSnapshot;
+
     webSocket.onmessage = (event) => {
-      const data: GameResponse = JSON.parse(event.data);
-      setGame(data);
+      const message: GameMessage = JSON.parse(event.data);
+
+      if (message.type === 'snapshot') {
+        gameVersion.current = message.version;
+        setGame(message.state);
+        return;
+      }
+
+      if (gameVersion.current !== message.base_version) {
+        // Missed an update — resync from a full snapshot.
+        gameVersion.current = null;
+        requestSnapshot();
+        return;
+      }
+
+      gameVersion.current = message.version;
+      setGame((current) =>
+        current ? applyGamePatch(current, message.changes) : current
+      );
     };
 
     return () => {
@@ -1,11 +1,34 @@
-import { useState } from 'react';
+import { useEffect, useState } from 'react';
 import { useNavigate } from 'react-router';
 import { authFetch } from '../utils/api';
 import { LoadingButton } from '../components/LoadingButton';
+import { GameList, GameSummary } from '../types/models';
 
 export const LobbyPage = () => {
   const navigate = useNavigate();
   const [gameId, setGameId] = useState<string>('');
+  const [openGames, setOpenGames] = useState<GameSummary[]>([]);
+
+  useEffect(() => {
+    const fetchOpenGames = async (): Promise<void> => {
+      try {
+        const response = await authFetch(
+          `${import.meta.env.VITE_API_URL}/games/?phase=LOBBY&limit=10`
+        );
+
+        if (!response.ok) {
+          throw new Error(`Failed to list games: ${response.status}`);
+        }
+
+        const { games }: GameList = await response.json();
+        setOpenGames(games);
+      } catch (error) {
+        console.error('There was an error calling fetchOpenGames', { error });
+      }
+    };
+
+    fetchOpenGames();
+  }, []);
 
   const handleCreateGame = async (): Promise<void> => {
     try {
@@ -65,6 +88,29 @@ export const LobbyPage = () => {
               JOIN GAME
             </button>
           </div>
+
+          {openGames.length > 0 && (
+            <div className="flex flex-col gap-2">
+              <span className="text-gray-500 text-sm tracking-wider">
+                OPEN GAMES
+              </span>
+              {openGames.map((openGame) => (
+                <button
+                  key={openGame.id}
+                  onClick={() => navigate(`/game/${openGame.id}`)}
+                  className="flex justify-between bg-[#1e2d3d] hover:bg-[#2a3d52] text-white border border-gray-600 px-4 py-2 transition-colors"
+                >
+                  <span className="font-mono text-sm">
+                    {openGame.id.slice(0, 8)}
+                  </span>
+                  <span className="text-gray-400 text-sm">
+                    {openGame.player_count}{' '}
+                    {openGame.player_count === 1 ? 'player' : 'players'}
+                  </span>
+                </button>
+              ))}
+            </div>
+          )}
         </div>
       </div>
     </div>
@@ -11,7 +11,8 @@ export interface paths {
             path?: never;
             cookie?: never;
         };
-        get?: never;
+        /** Get Games */
+        get: operations["get_games_games__get"];
         put?: never;
         /** Create Game */
         post: operations["create_game_games__post"];
@@ -38,6 +39,66 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/games/{game_id}/legal-actions": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Legal Actions
+         * @description Every move, puff and spinnaker action open to the current player.
+         */
+        get: operations["get_legal_actions_games__game_id__legal_actions_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/games/{game_id}/reachable-cells": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Reachable Cells
+         * @description Every cell the current player could end their turn on.
+         */
+        get: operations["get_reachable_cells_games__game_id__reachable_cells_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/games/{game_id}/standings": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Standings
+         * @description Players ordered by the fewest legs each still needs to finish.
+         */
+        get: operations["get_standings_games__game_id__standings_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/games/{game_id}/players": {
         parameters: {
             query?: never;
@@ -191,6 +252,45 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/games/{game_id}/turn": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Take Turn
+         * @description Applies several actions for one player in order, with one commit and one
+         *     broadcast. Nothing is saved if any action is rejected; the 422 detail
+         *     names the index of the first one that was.
+         */
+        post: operations["take_turn_games__game_id__turn_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/auth/login": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /** Login */
+        post: operations["login_auth_login_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/health": {
         parameters: {
             query?: never;
@@ -208,6 +308,23 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/metrics": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /** Metrics */
+        get: operations["metrics_metrics_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
 }
 export type webhooks = Record<string, never>;
 export interface components {
@@ -234,6 +351,21 @@ export interface components {
             /** Y */
             y: number;
         };
+        /** EndTurnStep */
+        EndTurnStep: {
+            /**
+             * Type
+             * @constant
+             */
+            type: "end_turn";
+        };
+        /** GameListResponse */
+        GameListResponse: {
+            /** Games */
+            games: components["schemas"]["GameSummaryResponse"][];
+            /** Next Cursor */
+            next_cursor: string | null;
+        };
         /** GameResponse */
         GameResponse: {
             /** Id */
@@ -261,6 +393,27 @@ export interface components {
             has_used_puff: boolean;
             /** Winner */
             winner: string | null;
+            /** Last Event */
+            last_event: string | null;
+        };
+        /** GameSummaryResponse */
+        GameSummaryResponse: {
+            /** Id */
+            id: string;
+            /** Phase */
+            phase: string;
+            /** Player Count */
+            player_count: number;
+            /**
+             * Created At
+             * Format: date-time
+             */
+            created_at: string;
+            /**
+             * Updated At
+             * Format: date-time
+             */
+            updated_at: string;
         };
         /** GridResponse */
         GridResponse: {
@@ -274,6 +427,26 @@ export interface components {
             /** Detail */
             detail?: components["schemas"]["ValidationError"][];
         };
+        /** LegalActionsResponse */
+        LegalActionsResponse: {
+            /** Player Id */
+            player_id: string;
+            /** Moves */
+            moves: components["schemas"]["MoveOptionResponse"][];
+            /** Puffs */
+            puffs: components["schemas"]["PuffOptionResponse"][];
+            /** Can Raise Spinnaker */
+            can_raise_spinnaker: boolean;
+            /** Can Lower Spinnaker */
+            can_lower_spinnaker: boolean;
+            /** Can End Turn */
+            can_end_turn: boolean;
+        };
+        /** LoginRequest */
+        LoginRequest: {
+            /** Password */
+            password: string;
+        };
         /** MoveLegRequest */
         MoveLegRequest: {
             /** Player Id */
@@ -281,6 +454,40 @@ export interface components {
             /** Heading */
             heading: number;
         };
+        /** MoveLegStep */
+        MoveLegStep: {
+            /**
+             * Type
+             * @constant
+             */
+            type: "move_leg";
+            /** Heading */
+            heading: number;
+        };
+        /** MoveOptionResponse */
+        MoveOptionResponse: {
+            /** Heading */
+            heading: number;
+            /** Legal */
+            legal: boolean;
+            /** Reason */
+            reason: string | null;
+            destination: components["schemas"]["PositionResponse"] | null;
+            /** Speed */
+            speed: number;
+            /** Toggled Spinnaker Speed */
+            toggled_spinnaker_speed: number;
+            /** Leg Cost */
+            leg_cost: number;
+            /** Maneuver */
+            maneuver: "tack" | "jibe" | null;
+            /** Tack */
+            tack: "starboard" | "port" | null;
+            /** Rounds Mark */
+            rounds_mark: boolean;
+            /** Finishes */
+            finishes: boolean;
+        };
         /** PositionResponse */
         PositionResponse: {
             /** X */
@@ -288,11 +495,78 @@ export interface components {
             /** Y */
             y: number;
         };
+        /** PuffOptionResponse */
+        PuffOptionResponse: {
+            /** Direction */
+            direction: number;
+            /** Legal */
+            legal: boolean;
+            /** Reason */
+            reason: string | null;
+            destination: components["schemas"]["PositionResponse"] | null;
+            /** Rounds Mark */
+            rounds_mark: boolean;
+        };
+        /** ReachableCellsResponse */
+        ReachableCellsResponse: {
+            /** Player Id */
+            player_id: string;
+            /** Cells */
+            cells: components["schemas"]["PositionResponse"][];
+            /** Can Finish */
+            can_finish: boolean;
+        };
         /** SpinnakerRequest */
         SpinnakerRequest: {
             /** Player Id */
             player_id: string;
         };
+        /** SpinnakerStep */
+        SpinnakerStep: {
+            /**
+             * Type
+             * @enum {string}
+             */
+            type: "raise_spinnaker" | "lower_spinnaker";
+        };
+        /** StandingResponse */
+        StandingResponse: {
+            /** Player Id */
+            player_id: string;
+            /** Legs To Finish */
+            legs_to_finish: number | null;
+            /** Marks Rounded */
+            marks_rounded: number;
+        };
+        /** StandingsResponse */
+        StandingsResponse: {
+            /** Standings */
+            standings: components["schemas"]["StandingResponse"][];
+        };
+        /** TokenResponse */
+        TokenResponse: {
+            /** Access Token */
+            access_token: string;
+            /**
+             * Token Type
+             * @default bearer
+             */
+            token_type: string;
+        };
+        /** TrackResponse */
+        TrackResponse: {
+            /** Version */
+            version: number;
+            /** Runs */
+            runs: number[];
+        };
+        /** TurnRequest */
+        TurnRequest: {
+            /** Player Id */
+            player_id: string;
+            /** Actions */
+            actions: (components["schemas"]["MoveLegStep"] | components["schemas"]["UsePuffStep"] | components["schemas"]["SpinnakerStep"] | components["schemas"]["EndTurnStep"])[];
+        };
         /** UsePuffRequest */
         UsePuffRequest: {
             /** Player Id */
@@ -300,6 +574,16 @@ export interface components {
             /** Direction */
             direction: number;
         };
+        /** UsePuffStep */
+        UsePuffStep: {
+            /**
+             * Type
+             * @constant
+             */
+            type: "use_puff";
+            /** Direction */
+            direction: number;
+        };
         /** ValidationError */
         ValidationError: {
             /** Location */
@@ -324,8 +608,7 @@ export interface components {
             puff_count: number;
             /** Marks Rounded */
             marks_rounded: components["schemas"]["PositionResponse"][];
-            /** Position History */
-            position_history: components["schemas"]["PositionResponse"][];
+            position_history: components["schemas"]["TrackResponse"];
         };
     };
     responses: never;
@@ -336,10 +619,50 @@ export interface components {
 }
 export type $defs = Record<string, never>;
 export interface operations {
+    get_games_games__get: {
+        parameters: {
+            query?: {
+                phase?: "LOBBY" | "SETUP" | "RACING" | "FINISHED" | null;
+                player_count?: number | null;
+                created_after?: string | null;
+                created_before?: string | null;
+                cursor?: string | null;
+                limit?: number;
+            };
+            header: {
+                authorization: string;
+            };
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["GameListResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     create_game_games__post: {
         parameters: {
             query?: never;
-            header?: never;
+            header: {
+                authorization: string;
+            };
             path?: never;
             cookie?: never;
         };
@@ -354,12 +677,23 @@ export interface operations {
                     "application/json": components["schemas"]["GameResponse"];
                 };
             };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
         };
     };
     get_game_games__game_id__get: {
         parameters: {
             query?: never;
-            header?: never;
+            header: {
+                authorization: string;
+            };
             path: {
                 game_id: string;
             };
@@ -387,10 +721,111 @@ export interface operations {
             };
         };
     };
+    get_legal_actions_games__game_id__legal_actions_get: {
+        parameters: {
+            query?: never;
+            header: {
+                authorization: string;
+            };
+            path: {
+                game_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["LegalActionsResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    get_reachable_cells_games__game_id__reachable_cells_get: {
+        parameters: {
+            query?: never;
+            header: {
+                authorization: string;
+            };
+            path: {
+                game_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ReachableCellsResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    get_standings_games__game_id__standings_get: {
+        parameters: {
+            query?: never;
+            header: {
+                authorization: string;
+            };
+            path: {
+                game_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["StandingsResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     add_player_to_game_games__game_id__players_post: {
         parameters: {
             query?: never;
-            header?: never;
+            header: {
+                authorization: string;
+            };
             path: {
                 game_id: string;
             };
@@ -425,7 +860,9 @@ export interface operations {
     begin_setup_games__game_id__start_post: {
         parameters: {
             query?: never;
-            header?: never;
+            header: {
+                authorization: string;
+            };
             path: {
                 game_id: string;
             };
@@ -456,7 +893,9 @@ export interface operations {
     choose_start_games__game_id__starting_position_post: {
         parameters: {
             query?: never;
-            header?: never;
+            header: {
+                authorization: string;
+            };
             path: {
                 game_id: string;
             };
@@ -491,7 +930,9 @@ export interface operations {
     start_game_round_games__game_id__round_post: {
         parameters: {
             query?: never;
-            header?: never;
+            header: {
+                authorization: string;
+            };
             path: {
                 game_id: string;
             };
@@ -522,7 +963,9 @@ export interface operations {
     make_move_games__game_id__move_post: {
         parameters: {
             query?: never;
-            header?: never;
+            header: {
+                authorization: string;
+            };
             path: {
                 game_id: string;
             };
@@ -557,7 +1000,9 @@ export interface operations {
     end_player_turn_games__game_id__end_turn_post: {
         parameters: {
             query?: never;
-            header?: never;
+            header: {
+                authorization: string;
+            };
             path: {
                 game_id: string;
             };
@@ -588,7 +1033,9 @@ export interface operations {
     puff_games__game_id__puff_post: {
         parameters: {
             query?: never;
-            header?: never;
+            header: {
+                authorization: string;
+            };
             path: {
                 game_id: string;
             };
@@ -623,7 +1070,9 @@ export interface operations {
     spinnaker_raise_games__game_id__spinnaker_raise_post: {
         parameters: {
             query?: never;
-            header?: never;
+            header: {
+                authorization: string;
+            };
             path: {
                 game_id: string;
             };
@@ -658,7 +1107,9 @@ export interface operations {
     spinnaker_lower_games__game_id__spinnaker_lower_post: {
         parameters: {
             query?: never;
-            header?: never;
+            header: {
+                authorization: string;
+            };
             path: {
                 game_id: string;
             };
@@ -690,6 +1141,76 @@ export interface operations {
             };
         };
     };
+    take_turn_games__game_id__turn_post: {
+        parameters: {
+            query?: never;
+            header: {
+                authorization: string;
+            };
+            path: {
+                game_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["TurnRequest"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["GameResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    login_auth_login_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["LoginRequest"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["TokenResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     health_check_health_get: {
         parameters: {
             query?: never;
@@ -710,4 +1231,24 @@ export interface operations {
             };
         };
     };
+    metrics_metrics_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": unknown;
+                };
+            };
+        };
+    };
 }
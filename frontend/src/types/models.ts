@@ -1,10 +1,29 @@
 import { Dispatch, SetStateAction } from 'react';
 import type { components } from '../types/api';
 
-export type GameResponse = components['schemas']['GameResponse'] & { last_event: string | null };
+export type GameResponse = components['schemas']['GameResponse'];
 export type BoardResponse = components['schemas']['BoardResponse'];
 export type YachtResponse = components['schemas']['YachtResponse'];
 
+export type GameSummary = components['schemas']['GameSummaryResponse'];
+export type GameList = components['schemas']['GameListResponse'];
+export type ReachableCells = components['schemas']['ReachableCellsResponse'];
+
+export type TrackPatch = { from: number; runs: number[] };
+export type YachtPatch = Partial<YachtResponse> & { track?: TrackPatch };
+export type GamePatch = Partial<Omit<GameResponse, 'yachts'>> & {
+  yachts?: Record<string, YachtPatch>;
+};
+
+export type GameMessage =
+  | { type: 'snapshot'; version: number; state: GameResponse }
+  | {
+      type: 'patch';
+      version: number;
+      base_version: number;
+      changes: GamePatch;
+    };
+
 export interface PhaseProps {
   game: GameResponse;
   setGame: Dispatch<SetStateAction<GameResponse | undefined>>;
@@ -0,0 +1,44 @@
+import { GameResponse } from '../types/models';
+import { applyGamePatch } from './gamePatch';
+
+describe('applyGamePatch', () => {
+  const game = {
+    legs_remaining: 2,
+    yachts: {
+      player_1: {
+        position: { x: 1, y: 3 },
+        heading: 180,
+        spinnaker: false,
+        puff_count: 2,
+        marks_rounded: [],
+        position_history: { version: 1, runs: [1, 2, 0, 1, 1] }
+      }
+    }
+  } as unknown as GameResponse;
+
+  it('replaces changed fields and keeps the rest', () => {
+    const patched = applyGamePatch(game, { legs_remaining: 1 });
+
+    expect(patched.legs_remaining).toBe(1);
+    expect(patched.yachts).toEqual(game.yachts);
+  });
+
+  it('splices the new tail onto the track runs', () => {
+    const patched = applyGamePatch(game, {
+      yachts: {
+        player_1: {
+          position: { x: 1, y: 4 },
+          puff_count: 1,
+          track: { from: 4, runs: [2] }
+        }
+      }
+    });
+
+    const yacht = patched.yachts.player_1;
+    expect(yacht.position).toEqual({ x: 1, y: 4 });
+    expect(yacht.puff_count).toBe(1);
+    expect(yacht.position_history.runs).toEqual([1, 2, 0, 1, 2]);
+    expect(yacht).not.toHaveProperty('track');
+    expect(game.yachts.player_1.position_history.runs).toEqual([1, 2, 0, 1, 1]);
+  });
+});
@@ -0,0 +1,30 @@
+import { GamePatch, GameResponse, YachtResponse } from '../types/models';
+
+// Mirrors regatta.ws.game_patches.apply_patch on the backend.
+export const applyGamePatch = (
+  game: GameResponse,
+  changes: GamePatch
+): GameResponse => {
+  const { yachts: yachtChanges, ...fieldChanges } = changes;
+  const yachts = { ...game.yachts };
+
+  Object.entries(yachtChanges ?? {}).forEach(([playerId, yachtPatch]) => {
+    const { track, ...yachtFieldChanges } = yachtPatch;
+    const yacht = {
+      ...yachts[playerId],
+      ...yachtFieldChanges
+    } as YachtResponse;
+
+    if (track) {
+      const keptRuns = yacht.position_history.runs.slice(0, track.from);
+      yacht.position_history = {
+        ...yacht.position_history,
+        runs: [...keptRuns, ...track.runs]
+      };
+    }
+
+    yachts[playerId] = yacht;
+  });
+
+  return { ...game, ...fieldChanges, yachts };
+};